@@ -0,0 +1,94 @@
+"""add signal continuous aggregates
+
+Revision ID: 20251201_0000
+Revises: 20251127_1700
+Create Date: 2025-12-01 00:00:00.000000
+
+Creates TimescaleDB continuous aggregates for signal statistics so dashboard
+queries read pre-computed buckets instead of re-aggregating raw (often
+compressed) signal rows:
+
+- signals_hourly / signals_hourly_by_ticker: hourly count, avg/max ff_value
+- signals_daily / signals_daily_by_ticker: daily count, avg/min/max/stddev ff_value
+
+All views are real-time (materialized_only = false), so buckets newer than the
+last refresh are computed from raw rows and unioned in at query time.
+"""
+from alembic import op
+import logging
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+# revision identifiers, used by Alembic.
+revision = '20251201_0000'
+down_revision = '20251127_1700'
+branch_labels = None
+depends_on = None
+
+
+# (view name, bucket width, include ticker, refresh start offset, end offset, schedule)
+AGGREGATES = [
+    ('signals_hourly', '1 hour', False, '3 days', '1 hour', '30 minutes'),
+    ('signals_hourly_by_ticker', '1 hour', True, '3 days', '1 hour', '30 minutes'),
+    ('signals_daily', '1 day', False, '7 days', '1 day', '1 hour'),
+    ('signals_daily_by_ticker', '1 day', True, '7 days', '1 day', '1 hour'),
+]
+
+
+def _view_sql(name: str, bucket: str, by_ticker: bool) -> str:
+    """Build the CREATE MATERIALIZED VIEW statement for one aggregate."""
+    ticker_column = "ticker," if by_ticker else ""
+    group_by = "bucket, ticker" if by_ticker else "bucket"
+
+    # Daily views carry the spread statistics used by get_daily_signal_stats
+    daily_columns = ""
+    if bucket == '1 day':
+        daily_columns = """
+            MIN(ff_value) AS min_ff_value,
+            STDDEV(ff_value) AS stddev_ff_value,"""
+
+    return f"""
+        CREATE MATERIALIZED VIEW {name}
+        WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+        SELECT
+            time_bucket(INTERVAL '{bucket}', as_of_ts) AS bucket,
+            {ticker_column}
+            COUNT(*) AS signal_count,{daily_columns}
+            AVG(ff_value) AS avg_ff_value,
+            MAX(ff_value) AS max_ff_value
+        FROM signals
+        GROUP BY {group_by}
+        WITH NO DATA;
+    """
+
+
+def upgrade() -> None:
+    """Create signal continuous aggregates and their refresh policies."""
+    for name, bucket, by_ticker, start_offset, end_offset, schedule in AGGREGATES:
+        logger.info(f"Creating continuous aggregate {name} ({bucket} buckets)...")
+        op.execute(_view_sql(name, bucket, by_ticker))
+
+        if by_ticker:
+            op.execute(f"CREATE INDEX ix_{name}_ticker_bucket ON {name} (ticker, bucket DESC);")
+
+        op.execute(f"""
+            SELECT add_continuous_aggregate_policy('{name}',
+                start_offset => INTERVAL '{start_offset}',
+                end_offset => INTERVAL '{end_offset}',
+                schedule_interval => INTERVAL '{schedule}');
+        """)
+        logger.info(f"✓ {name} created with refresh policy every {schedule}")
+
+    # Backfill existing history; refresh_continuous_aggregate cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, *_ in AGGREGATES:
+            logger.info(f"Backfilling {name}...")
+            op.execute(f"CALL refresh_continuous_aggregate('{name}', NULL, NULL);")
+    logger.info("✓ Continuous aggregates backfilled")
+
+
+def downgrade() -> None:
+    """Drop signal continuous aggregates (policies are dropped with them)."""
+    for name, *_ in reversed(AGGREGATES):
+        logger.info(f"Dropping continuous aggregate {name}...")
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {name};")
@@ -0,0 +1,32 @@
+"""add decision history keyset index
+
+Revision ID: 20251202_0000
+Revises: 20251201_0000
+Create Date: 2025-12-02 00:00:00.000000
+
+Adds a composite (user_id, decision_ts, id) index so the paginated history
+endpoint walks a user's decisions newest-first straight from the index.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20251202_0000'
+down_revision = '20251201_0000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create composite index for history keyset pagination."""
+    op.create_index(
+        'ix_signal_user_decisions_user_time',
+        'signal_user_decisions',
+        ['user_id', 'decision_ts', 'id'],
+        postgresql_using='btree'
+    )
+
+
+def downgrade() -> None:
+    """Drop history keyset index."""
+    op.drop_index('ix_signal_user_decisions_user_time', table_name='signal_user_decisions')
@@ -0,0 +1,122 @@
+"""Brotli/gzip compression of large API responses."""
+import gzip
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip only without the brotli package
+    brotli = None
+
+
+class CompressionMiddleware:
+    """
+    Compress complete response bodies of at least minimum_size bytes.
+
+    Brotli is preferred when the client accepts it and the brotli package is
+    installed, otherwise gzip. Streamed responses (SSE, multi-chunk bodies)
+    and already-encoded responses pass through untouched, so live events are
+    never held back in a compressor buffer. Strong ETags are weakened on
+    compressed responses, as they no longer identify the exact bytes; the
+    ETag middleware compares If-None-Match weakly.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    @staticmethod
+    def choose_encoding(accept_encoding: str) -> Optional[str]:
+        """Pick "br" or "gzip" from an Accept-Encoding header, if any."""
+        accepted = set()
+        for item in accept_encoding.split(","):
+            coding, *params = item.split(";")
+            quality = 1.0
+            for param in params:
+                name, _, value = param.strip().partition("=")
+                if name == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            if quality > 0:
+                accepted.add(coding.strip().lower())
+
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        """Compress a body with the chosen encoding."""
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self.choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                if (
+                    "content-encoding" in headers
+                    or headers.get("content-type", "").startswith("text/event-stream")
+                ):
+                    # Event streams must not wait for their first event
+                    passthrough = True
+                    await send(message)
+                    return
+                # Hold the headers until the first body chunk shows the size
+                start = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough or start is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=list(start.get("headers", [])))
+            start["headers"] = headers.raw
+
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            compressed = self._compress(body, encoding)
+            headers["content-encoding"] = encoding
+            headers["content-length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["etag"] = f"W/{etag}"
+
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,178 @@
+"""ETag / 304 Not Modified caching for read-heavy GET routes."""
+import logging
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.auth import decode_access_token, load_user
+from app.core.database import AsyncSessionLocal
+from app.services.response_cache import response_cache, SIGNALS, SUBSCRIPTIONS, SETTINGS
+from app.utils.pagination import NEXT_CURSOR_HEADER
+
+logger = logging.getLogger(__name__)
+
+
+# Path -> data scopes the response depends on
+CACHED_ROUTES: Dict[str, Tuple[str, ...]] = {
+    "/api/signals": (SIGNALS, SUBSCRIPTIONS),
+    "/api/watchlist": (SUBSCRIPTIONS,),
+    "/api/settings": (SETTINGS,),
+    "/signals": (SIGNALS,),
+}
+
+# Cached routes readable without authentication
+PUBLIC_ROUTES = {"/signals"}
+
+# Response headers stored with and replayed from the cache
+CACHED_HEADERS = {"content-type", NEXT_CURSOR_HEADER.lower()}
+
+# Browsers keep the body privately and revalidate with If-None-Match every time
+CACHE_CONTROL = "private, no-cache"
+
+
+class ETagCacheMiddleware:
+    """
+    Serve cached GET responses and 304s keyed by (user, route, params).
+
+    The ETag is derived from the current data versions before the route
+    runs (see ResponseCache), so a matching If-None-Match returns 304
+    without running the route, and a repeated request is answered from
+    the stored body. Only successful responses are cached. Requests without
+    a valid token, or whose user is missing or not active (checked through
+    auth_user_cache, as in get_current_user), pass through so the route
+    returns its usual 401/403. The user's auth version is part of the ETag.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    @staticmethod
+    def _user_id(path: str, headers: Headers) -> Optional[str]:
+        """Resolve the cache owner from the bearer token (no database access)."""
+        if path in PUBLIC_ROUTES:
+            return "public"
+
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return None
+
+        try:
+            return decode_access_token(token).get("sub")
+        except HTTPException:
+            return None
+
+    @staticmethod
+    async def _auth_version(user_id: str) -> Optional[str]:
+        """The user's auth version if they may be served from cache, else None."""
+        if user_id == "public":
+            return "public"
+
+        async with AsyncSessionLocal() as db:
+            user, version = await load_user(db, user_id)
+        if user is None or user.status != "active":
+            return None
+        return version
+
+    @staticmethod
+    def _etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+        """Whether an If-None-Match header value matches the current ETag."""
+        if not if_none_match:
+            return False
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return etag in candidates or "*" in candidates
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        data_scopes = CACHED_ROUTES.get(scope["path"])
+        headers = Headers(scope=scope)
+        user_id = self._user_id(scope["path"], headers) if data_scopes else None
+        if user_id is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            auth_version = await self._auth_version(user_id)
+            if auth_version is not None:
+                params = urlencode(sorted(parse_qsl(scope["query_string"].decode(), keep_blank_values=True)))
+                etag = await response_cache.make_etag(
+                    user_id, scope["path"], params, data_scopes,
+                    auth_version=None if user_id == "public" else auth_version
+                )
+        except Exception as e:
+            logger.warning(f"Response cache unavailable for {scope['path']}: {e}")
+            auth_version = None
+
+        if auth_version is None:
+            # Missing or inactive user (the route answers 401/403), or cache unavailable
+            await self.app(scope, receive, send)
+            return
+
+        if self._etag_matches(etag, headers.get("if-none-match")):
+            await self._send_cached(send, 304, etag, [], b"")
+            return
+
+        try:
+            cached = await response_cache.get_body(etag)
+        except Exception as e:
+            logger.warning(f"Response cache unavailable for {scope['path']}: {e}")
+            await self.app(scope, receive, send)
+            return
+
+        if cached is not None:
+            await self._send_cached(send, 200, etag, cached["headers"], cached["body"].encode())
+            return
+
+        await self._call_and_store(scope, receive, send, etag)
+
+    @staticmethod
+    async def _send_cached(send: Send, status: int, etag: str, headers: list, body: bytes) -> None:
+        """Send a response built from cached parts."""
+        raw_headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in headers]
+        raw_headers += [
+            (b"etag", etag.encode("latin-1")),
+            (b"cache-control", CACHE_CONTROL.encode("latin-1")),
+        ]
+        if status != 304:
+            raw_headers.append((b"content-length", str(len(body)).encode("latin-1")))
+
+        await send({"type": "http.response.start", "status": status, "headers": raw_headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _call_and_store(self, scope: Scope, receive: Receive, send: Send, etag: str) -> None:
+        """Run the route, tagging and storing a successful response."""
+        state = {"status": None, "headers": [], "body": []}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                if state["status"] == 200:
+                    state["headers"] = [
+                        (name.decode("latin-1"), value.decode("latin-1"))
+                        for name, value in message.get("headers", [])
+                        if name.decode("latin-1").lower() in CACHED_HEADERS
+                    ]
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"etag", etag.encode("latin-1")),
+                        (b"cache-control", CACHE_CONTROL.encode("latin-1")),
+                    ]
+
+            await send(message)
+
+            if message["type"] == "http.response.body" and state["status"] == 200:
+                state["body"].append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    try:
+                        await response_cache.set_body(etag, {
+                            "headers": state["headers"],
+                            "body": b"".join(state["body"]).decode()
+                        })
+                    except Exception as e:
+                        logger.warning(f"Failed to cache response for {scope['path']}: {e}")
+
+        await self.app(scope, receive, send_wrapper)
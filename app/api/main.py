@@ -1,5 +1,5 @@
 """FastAPI application for analytics and monitoring."""
-from fastapi import FastAPI, Depends, Request
+from fastapi import FastAPI, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,6 +9,10 @@ from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from app.core.database import get_db
 from app.core.config import settings
+from app.core.metrics import render_metrics
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.api.etag_cache import ETagCacheMiddleware
+from app.api.compression import CompressionMiddleware
 from app.services import SignalService
 from typing import List, Optional
 import logging
@@ -126,6 +130,12 @@ async def global_exception_handler(request: Request, exc: Exception):
         headers=cors_headers
     )
 
+# ETag/304 caching for read-heavy GET routes (added before CORS so CORS wraps it)
+app.add_middleware(ETagCacheMiddleware)
+
+# Compress large bodies outside the ETag cache, which stores them uncompressed
+app.add_middleware(CompressionMiddleware, minimum_size=settings.response_compression_min_bytes)
+
 # Configure CORS
 logger.info(f"Configuring CORS with origins: {settings.cors_origins_list}")
 app.add_middleware(
@@ -134,6 +144,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
 
@@ -189,6 +200,13 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics for this API process."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=settings.backend_port)
@@ -11,6 +11,7 @@ import logging
 
 from app.core.database import get_db
 from app.core.auth import create_access_token, get_current_user
+from app.core.user_cache import auth_user_cache
 from app.core.config import settings
 from app.services.auth_service import AuthService
 from app.models.user import User
@@ -154,6 +155,20 @@ async def login(
     }
 
 
+@router.post("/logout")
+async def logout(current_user: User = Depends(get_current_user)):
+    """
+    Log out the current user.
+    
+    Drops the user from every API process's authenticated-user cache, so
+    the next request with any of their tokens reloads them from the database.
+    Requires authentication.
+    """
+    await auth_user_cache.invalidate(str(current_user.id))
+    
+    return {"message": "Logged out"}
+
+
 class UnlinkTelegramRequest(BaseModel):
     """Request to unlink a Telegram chat."""
     chat_id: Optional[str] = None  # If None, unlink all chats
@@ -2,7 +2,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-from app.core.database import get_db, engine
+from app.core.database import get_db, get_read_db, engine, read_engine
 import logging
 
 logger = logging.getLogger(__name__)
@@ -110,6 +110,13 @@ async def check_database_health(db: AsyncSession = Depends(get_db)):
             "overflow": engine.pool.overflow(),
             "checked_in": engine.pool.checkedin()
         }
+        if read_engine is not engine:
+            pool_stats["read_replica"] = {
+                "size": read_engine.pool.size(),
+                "checked_out": read_engine.pool.checkedout(),
+                "overflow": read_engine.pool.overflow(),
+                "checked_in": read_engine.pool.checkedin()
+            }
         logger.debug(f"✓ Pool stats: {pool_stats}")
         
         # Step 7: Get database size
@@ -146,7 +153,7 @@ async def check_database_health(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/health/db/chunks")
-async def get_chunk_details(db: AsyncSession = Depends(get_db)):
+async def get_chunk_details(db: AsyncSession = Depends(get_read_db)):
     """
     Get detailed chunk information for all hypertables.
     
@@ -194,7 +201,7 @@ async def get_chunk_details(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/health/db/compression")
-async def get_compression_stats(db: AsyncSession = Depends(get_db)):
+async def get_compression_stats(db: AsyncSession = Depends(get_read_db)):
     """
     Get compression statistics including compression ratios.
     
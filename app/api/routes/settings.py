@@ -8,6 +8,7 @@ from app.core.database import get_db
 from app.core.auth import get_current_user
 from app.models.user import User
 from app.services.user_service import UserService
+from app.services.response_cache import response_cache, SETTINGS
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
@@ -151,6 +152,7 @@ async def update_settings(
     
     await db.commit()
     await db.refresh(settings)
+    await response_cache.bump(SETTINGS, str(current_user.id))
     
     return {
         "ff_threshold": settings.ff_threshold,
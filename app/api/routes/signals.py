@@ -1,25 +1,41 @@
 """Signals and history API routes."""
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import json
+import time
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, tuple_
 from typing import List, Optional
 from datetime import datetime
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db, AsyncSessionLocal
 from app.core.auth import get_current_user
 from app.models.user import User
 from app.models.signal import Signal
 from app.models.decision import SignalUserDecision
 from app.models.subscription import Subscription
 from app.services.signal_service import SignalService
+from app.services.subscription_service import SubscriptionService
+from app.services.signal_stream import signal_stream
+from app.services.signal_feed import signal_feed_cache
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
+from app.api.serializers import serialize_signal, serialize_decision, json_response
 
 router = APIRouter(prefix="/api/signals", tags=["signals"])
 
+# Comment line sent on idle streams so proxies keep the connection open
+STREAM_KEEPALIVE_SECONDS = 15
+
+# How often an open stream reloads the user's watchlist
+STREAM_SUBSCRIPTION_REFRESH_SECONDS = 60
+
 
 class SignalResponse(BaseModel):
     """Signal information response."""
     id: str
+    ref: str  # Encoded "<id>@<ts>" reference for chunk-pruned lookups
     ticker: str
     ff_value: float
     front_iv: float
@@ -59,116 +75,218 @@ class HistoryResponse(BaseModel):
     decision: Optional[DecisionResponse]
 
 
+def _paginate_payloads(payloads: List[dict], limit: int, response: Response) -> List[dict]:
+    """Trim serialized signals to one page, setting X-Next-Cursor if more remain."""
+    if len(payloads) > limit:
+        payloads = payloads[:limit]
+        last = payloads[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            datetime.fromisoformat(last["as_of_ts"]), last["id"]
+        )
+    return payloads
+
+
+def _parse_cursor(cursor: str):
+    """Decode a pagination cursor, rejecting malformed values with 400."""
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
 @router.get("", response_model=List[SignalResponse])
 async def get_signals(
+    response: Response,
     ticker: Optional[str] = None,
     limit: int = 50,
+    cursor: Optional[str] = None,
+    since: Optional[datetime] = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Get recent signals for the user's watchlist.
+    Get recent signals for the user's watchlist, newest first.
     
-    Optionally filter by ticker.
+    Optionally filter by ticker. Pages are keyed on (as_of_ts, id): when more
+    rows exist, the X-Next-Cursor response header holds the cursor for the
+    next page. Pass `since` to fetch only signals newer than a timestamp.
+    The unfiltered first page is served from the user's Redis feed when it
+    is warm, and rebuilds that feed when it is not. Rows are serialized
+    directly to JSON bytes, skipping response_model validation.
     Requires authentication.
     """
-    # Get user's subscribed tickers
-    result = await db.execute(
-        select(Subscription.ticker).where(
-            and_(
-                Subscription.user_id == current_user.id,
-                Subscription.active == True
-            )
-        )
-    )
-    subscribed_tickers = [row[0] for row in result.all()]
+    user_id = str(current_user.id)
     
-    if not subscribed_tickers:
-        return []
+    # The default "latest signals" view is served from the user's Redis feed
+    hot_view = not (ticker or cursor or since) and limit <= signal_feed_cache.FEED_SIZE
+    if hot_view:
+        cached = await signal_feed_cache.get_latest(user_id, limit + 1)
+        if cached is not None:
+            return json_response(_paginate_payloads(cached, limit, response), response)
     
-    # Build query for signals
+    # Single query: semijoin signals against the user's active subscriptions
+    subscribed_tickers = select(Subscription.ticker).where(
+        and_(
+            Subscription.user_id == current_user.id,
+            Subscription.active == True
+        )
+    )
     query = select(Signal).where(Signal.ticker.in_(subscribed_tickers))
     
     if ticker:
         query = query.where(Signal.ticker == ticker.upper())
     
-    query = query.order_by(Signal.as_of_ts.desc()).limit(limit)
+    if since:
+        query = query.where(Signal.as_of_ts > since)
+    
+    if cursor:
+        cursor_ts, cursor_id = _parse_cursor(cursor)
+        query = query.where(tuple_(Signal.as_of_ts, Signal.id) < tuple_(cursor_ts, cursor_id))
+    
+    # Fetch one extra row to tell whether another page exists; a feed
+    # rebuild fetches the whole feed
+    fetch_size = signal_feed_cache.FEED_SIZE if hot_view else limit + 1
+    query = query.order_by(Signal.as_of_ts.desc(), Signal.id.desc()).limit(fetch_size)
     
     result = await db.execute(query)
-    signals = result.scalars().all()
+    payloads = [serialize_signal(signal) for signal in result.scalars().all()]
     
-    return [
-        {
-            "id": str(signal.id),
-            "ticker": signal.ticker,
-            "ff_value": signal.ff_value,
-            "front_iv": signal.front_iv,
-            "back_iv": signal.back_iv,
-            "sigma_fwd": signal.sigma_fwd,
-            "front_expiry": signal.front_expiry.isoformat(),
-            "back_expiry": signal.back_expiry.isoformat(),
-            "front_dte": signal.front_dte,
-            "back_dte": signal.back_dte,
-            "as_of_ts": signal.as_of_ts.isoformat(),
-            "quality_score": signal.quality_score,
-            "vol_point": signal.vol_point
-        }
-        for signal in signals
-    ]
+    if hot_view:
+        await signal_feed_cache.fill(user_id, payloads)
+    
+    return json_response(_paginate_payloads(payloads, limit, response), response)
 
 
 @router.get("/history", response_model=List[HistoryResponse])
 async def get_history(
+    response: Response,
     limit: int = 50,
+    cursor: Optional[str] = None,
+    since: Optional[datetime] = None,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
-    Get the user's signal history with decisions.
+    Get the user's signal history with decisions, most recent first.
     
+    Pages are keyed on (decision_ts, id) and continue via the X-Next-Cursor
+    response header. Pass `since` to fetch only decisions made or updated
+    after a timestamp. Rows are serialized directly to JSON bytes. Reads
+    from the read replica when one is configured.
     Requires authentication.
     """
     # Get user's decisions with signals
-    result = await db.execute(
+    query = (
         select(SignalUserDecision, Signal)
         .join(Signal, and_(
             SignalUserDecision.signal_id == Signal.id,
             SignalUserDecision.signal_as_of_ts == Signal.as_of_ts
         ))
         .where(SignalUserDecision.user_id == current_user.id)
-        .order_by(SignalUserDecision.decision_ts.desc())
-        .limit(limit)
     )
     
-    history = []
-    for decision, signal in result.all():
-        history.append({
-            "signal": {
-                "id": str(signal.id),
-                "ticker": signal.ticker,
-                "ff_value": signal.ff_value,
-                "front_iv": signal.front_iv,
-                "back_iv": signal.back_iv,
-                "sigma_fwd": signal.sigma_fwd,
-                "front_expiry": signal.front_expiry.isoformat(),
-                "back_expiry": signal.back_expiry.isoformat(),
-                "front_dte": signal.front_dte,
-                "back_dte": signal.back_dte,
-                "as_of_ts": signal.as_of_ts.isoformat(),
-                "quality_score": signal.quality_score,
-                "vol_point": signal.vol_point
-            },
-            "decision": {
-                "id": str(decision.id),
-                "signal_id": str(decision.signal_id),
-                "decision": decision.decision,
-                "decision_ts": decision.decision_ts.isoformat(),
-                "pnl": decision.pnl,
-                "exit_price": decision.exit_price
-            }
-        })
+    if since:
+        query = query.where(SignalUserDecision.decision_ts > since)
     
-    return history
+    if cursor:
+        cursor_ts, cursor_id = _parse_cursor(cursor)
+        query = query.where(
+            tuple_(SignalUserDecision.decision_ts, SignalUserDecision.id) < tuple_(cursor_ts, cursor_id)
+        )
+    
+    result = await db.execute(
+        query
+        .order_by(SignalUserDecision.decision_ts.desc(), SignalUserDecision.id.desc())
+        .limit(limit + 1)
+    )
+    rows = result.all()
+    
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1][0]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.decision_ts, str(last.id))
+    
+    history = [
+        {"signal": serialize_signal(signal), "decision": serialize_decision(decision)}
+        for decision, signal in rows
+    ]
+    
+    return json_response(history, response)
+
+
+async def _active_tickers(db: AsyncSession, user_id: str) -> set:
+    """Load the tickers a user is actively subscribed to."""
+    subscriptions = await SubscriptionService.get_user_subscriptions(db, user_id)
+    return {sub.ticker for sub in subscriptions}
+
+
+def _format_sse(event: dict) -> str:
+    """Serialize a stream event in text/event-stream format."""
+    return f"id: {event['id']}\nevent: signal\ndata: {json.dumps(event['data'])}\n\n"
+
+
+@router.get("/stream")
+async def stream_signals(
+    request: Request,
+    last_event_id: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Stream new signals for the user's watchlist as Server-Sent Events.
+    
+    Each event carries the signal in the same shape as `GET /api/signals`
+    and a stream ID. Reconnecting clients send `Last-Event-ID` to receive
+    buffered signals they missed before live delivery resumes.
+    Requires authentication.
+    """
+    user_id = str(current_user.id)
+    tickers = await _active_tickers(db, user_id)
+    
+    async def event_source():
+        last_sent = last_event_id
+        refreshed_at = time.monotonic()
+        queue = None
+        try:
+            # Register only once the body is streaming, so disconnect() always runs;
+            # and before replaying, so events published in between are not lost
+            queue = await signal_stream.connect(user_id, tickers)
+            backlog = await signal_stream.replay(last_event_id, tickers) if last_event_id else []
+            
+            for event in backlog:
+                yield _format_sse(event)
+                last_sent = event["id"]
+            
+            while not await request.is_disconnected():
+                # Checked every iteration: a busy stream may never hit the keepalive timeout
+                if time.monotonic() - refreshed_at >= STREAM_SUBSCRIPTION_REFRESH_SECONDS:
+                    async with AsyncSessionLocal() as session:
+                        signal_stream.set_subscriptions(user_id, await _active_tickers(session, user_id))
+                    refreshed_at = time.monotonic()
+                
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                
+                # Skip live events already delivered by the replay
+                if not signal_stream.is_after(event["id"], last_sent):
+                    continue
+                yield _format_sse(event)
+                last_sent = event["id"]
+        finally:
+            if queue is not None:
+                signal_stream.disconnect(user_id, queue)
+    
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.post("/{signal_id}/decision", response_model=DecisionResponse, status_code=status.HTTP_201_CREATED)
@@ -181,6 +299,9 @@ async def record_decision(
     """
     Record a decision (place/ignore) for a signal.
     
+    The path takes the signal's encoded reference ("<id>@<ts>", see the
+    `ref` field of signal responses) so the lookup hits a single hypertable
+    chunk; a bare signal ID is still accepted.
     Requires authentication.
     """
     # Validate decision type
@@ -191,8 +312,7 @@ async def record_decision(
         )
     
     # Verify signal exists
-    result = await db.execute(select(Signal).where(Signal.id == signal_id))
-    signal = result.scalar_one_or_none()
+    signal = await SignalService.get_signal_by_ref(db, signal_id)
     
     if not signal:
         raise HTTPException(
@@ -204,7 +324,8 @@ async def record_decision(
     result = await db.execute(
         select(SignalUserDecision).where(
             and_(
-                SignalUserDecision.signal_id == signal_id,
+                SignalUserDecision.signal_id == signal.id,
+                SignalUserDecision.signal_as_of_ts == signal.as_of_ts,
                 SignalUserDecision.user_id == current_user.id
             )
         )
@@ -238,7 +359,7 @@ async def record_decision(
     
     # Create new decision
     decision = SignalUserDecision(
-        signal_id=signal_id,
+        signal_id=signal.id,
         signal_as_of_ts=signal.as_of_ts,
         user_id=current_user.id,
         decision=request.decision,
@@ -0,0 +1,70 @@
+"""Fast JSON serialization for list endpoints returning many rows."""
+from typing import Any, Optional
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+
+from app.models.decision import SignalUserDecision
+from app.models.signal import Signal
+from app.utils.signal_ref import encode_signal_ref
+
+# Sub-response headers that describe the (empty) placeholder body, not the page
+_BODY_HEADERS = {"content-length", "content-type"}
+
+
+def serialize_signal(signal: Signal) -> dict:
+    """Convert a Signal row into the SignalResponse shape."""
+    return {
+        "id": str(signal.id),
+        "ref": encode_signal_ref(str(signal.id), signal.as_of_ts),
+        "ticker": signal.ticker,
+        "ff_value": signal.ff_value,
+        "front_iv": signal.front_iv,
+        "back_iv": signal.back_iv,
+        "sigma_fwd": signal.sigma_fwd,
+        "front_expiry": signal.front_expiry.isoformat(),
+        "back_expiry": signal.back_expiry.isoformat(),
+        "front_dte": signal.front_dte,
+        "back_dte": signal.back_dte,
+        "as_of_ts": signal.as_of_ts.isoformat(),
+        "quality_score": signal.quality_score,
+        "vol_point": signal.vol_point
+    }
+
+
+def serialize_decision(decision: SignalUserDecision) -> dict:
+    """Convert a SignalUserDecision row into the DecisionResponse shape."""
+    return {
+        "id": str(decision.id),
+        "signal_id": str(decision.signal_id),
+        "decision": decision.decision,
+        "decision_ts": decision.decision_ts.isoformat(),
+        "pnl": decision.pnl,
+        "exit_price": decision.exit_price
+    }
+
+
+def json_response(content: Any, response: Optional[Response] = None) -> ORJSONResponse:
+    """
+    Encode already-shaped content straight to JSON bytes with orjson.
+
+    Returning a Response makes FastAPI skip response_model validation and
+    jsonable_encoder, which dominate the cost of large list payloads. The
+    route's response_model is still used for the OpenAPI schema, so content
+    must already match it (build it with the serializers above).
+
+    Args:
+        content: JSON-compatible content
+        response: Injected sub-response whose headers (e.g. X-Next-Cursor)
+            FastAPI would otherwise drop when a Response is returned
+
+    Returns:
+        Rendered JSON response
+    """
+    headers = None
+    if response is not None:
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name not in _BODY_HEADERS
+        }
+    return ORJSONResponse(content, headers=headers)
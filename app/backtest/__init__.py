@@ -0,0 +1,10 @@
+"""Vectorized historical backtesting of Forward Factor settings."""
+from app.backtest.history import ChainHistory
+from app.backtest.engine import ParameterGrid, BacktestResult, run_backtest
+
+__all__ = [
+    "ChainHistory",
+    "ParameterGrid",
+    "BacktestResult",
+    "run_backtest"
+]
@@ -0,0 +1,331 @@
+"""Vectorized Forward Factor backtest over a parameter grid."""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from app.backtest.history import ChainHistory
+from app.services.signal_engine import forward_factor_arrays
+
+# StabilityTracker state lives in Redis for 24 hours from the first sighting
+STATE_TTL_SECONDS = 86400
+
+# Grid axes in array order; the first two come from the history, the rest broadcast
+GRID_AXES = (
+    "vol_point",
+    "dte_pair",
+    "sigma_fwd_floor",
+    "ff_threshold",
+    "required_scans",
+    "cooldown_minutes",
+    "delta_ff_min",
+)
+
+
+def _default_dte_pairs() -> List[Dict[str, int]]:
+    return [{"front": 30, "back": 60, "front_tol": 5, "back_tol": 10}]
+
+
+@dataclass
+class ParameterGrid:
+    """Cartesian grid of user settings to backtest (every combination is run)."""
+    vol_points: List[str] = field(default_factory=lambda: ["ATM"])
+    dte_pairs: List[Dict[str, int]] = field(default_factory=_default_dte_pairs)
+    sigma_fwd_floors: List[float] = field(default_factory=lambda: [0.05])
+    ff_thresholds: List[float] = field(default_factory=lambda: [0.20])
+    required_scans: List[int] = field(default_factory=lambda: [2])
+    cooldown_minutes: List[float] = field(default_factory=lambda: [120])
+    delta_ff_mins: List[float] = field(default_factory=lambda: [0.02])
+
+    @property
+    def axes(self) -> Tuple[list, ...]:
+        """Values along each axis, in GRID_AXES order."""
+        return (
+            self.vol_points,
+            self.dte_pairs,
+            self.sigma_fwd_floors,
+            self.ff_thresholds,
+            self.required_scans,
+            self.cooldown_minutes,
+            self.delta_ff_mins,
+        )
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return tuple(len(values) for values in self.axes)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    def axis(self, name: str) -> np.ndarray:
+        """Values of a numeric axis shaped to broadcast against the grid."""
+        index = GRID_AXES.index(name)
+        shape = [1] * len(GRID_AXES)
+        shape[index] = -1
+        return np.asarray(self.axes[index], dtype=float).reshape(shape)
+
+    def params(self, index: int) -> Dict[str, Any]:
+        """Settings for one flattened grid index."""
+        position = np.unravel_index(index, self.shape)
+        return {name: values[i] for name, values, i in zip(GRID_AXES, self.axes, position)}
+
+
+@dataclass
+class BacktestResult:
+    """Per-combination totals, flattened in grid order (see ParameterGrid.params)."""
+    grid: ParameterGrid
+    signals: np.ndarray  # Scans where compute_signals would emit the signal
+    alerts: np.ndarray  # Signals that passed the stability debounce/cooldown
+    scored: np.ndarray  # Alerts with a calendar mark at the horizon
+    hits: np.ndarray  # Scored alerts whose calendar gained value
+    return_sum: np.ndarray  # Sum of calendar returns over scored alerts
+    ff_scored: np.ndarray  # Alerts with an FF value at the horizon
+    ff_reversion_sum: np.ndarray  # Sum of (FF at alert - FF at horizon)
+
+    @classmethod
+    def empty(cls, grid: ParameterGrid) -> "BacktestResult":
+        zeros = lambda dtype: np.zeros(grid.size, dtype=dtype)
+        return cls(grid, zeros(np.int64), zeros(np.int64), zeros(np.int64), zeros(np.int64),
+                   zeros(float), zeros(np.int64), zeros(float))
+
+    @staticmethod
+    def _ratio(total: np.ndarray, count: np.ndarray) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(count > 0, total / np.maximum(count, 1), np.nan)
+
+    @property
+    def hit_rate(self) -> np.ndarray:
+        return self._ratio(self.hits.astype(float), self.scored)
+
+    @property
+    def mean_return(self) -> np.ndarray:
+        return self._ratio(self.return_sum, self.scored)
+
+    @property
+    def mean_ff_reversion(self) -> np.ndarray:
+        return self._ratio(self.ff_reversion_sum, self.ff_scored)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Settings and metrics for one combination."""
+        return {
+            **self.grid.params(index),
+            "signals": int(self.signals[index]),
+            "alerts": int(self.alerts[index]),
+            "scored": int(self.scored[index]),
+            "hit_rate": float(self.hit_rate[index]),
+            "mean_return": float(self.mean_return[index]),
+            "mean_ff_reversion": float(self.mean_ff_reversion[index]),
+        }
+
+    def top(self, n: int = 10, by: str = "mean_return", min_alerts: int = 1) -> List[Dict[str, Any]]:
+        """Best combinations by a metric, ignoring those with too few scored alerts."""
+        metric = np.asarray(getattr(self, by), dtype=float)
+        metric = np.where((self.scored >= min_alerts) & np.isfinite(metric), metric, -np.inf)
+        order = np.argsort(-metric, kind="stable")[:n]
+        return [self.row(int(i)) for i in order if np.isfinite(metric[i])]
+
+
+def pair_indices(history: ChainHistory, dte_pairs: List[Dict[str, int]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pair expiries for every snapshot and DTE pair at once.
+
+    Same rule as pair_expiries(): the expiry nearest each target within its
+    tolerance (earliest on ties), and the front must expire first.
+
+    Returns:
+        (front, back, valid): expiry column indices and validity, each (P, T)
+    """
+    dte = np.where(np.isnan(history.dte), np.inf, history.dte)[None]  # (1, T, E)
+
+    def nearest(targets: np.ndarray, tolerances: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        distance = np.abs(dte - targets[:, None, None])
+        distance = np.where(distance <= tolerances[:, None, None], distance, np.inf)
+        index = distance.argmin(axis=2)
+        return index, np.isfinite(np.take_along_axis(distance, index[..., None], axis=2)[..., 0])
+
+    front, front_ok = nearest(
+        np.array([p["front"] for p in dte_pairs], dtype=float),
+        np.array([p.get("front_tol", 5) for p in dte_pairs], dtype=float)
+    )
+    back, back_ok = nearest(
+        np.array([p["back"] for p in dte_pairs], dtype=float),
+        np.array([p.get("back_tol", 10) for p in dte_pairs], dtype=float)
+    )
+    rows = np.arange(history.n_snapshots)[None]
+    valid = front_ok & back_ok & (history.dte[rows, front] < history.dte[rows, back])
+    return front, back, valid
+
+
+def _exit_rows(history: ChainHistory, horizon_minutes: float) -> Tuple[np.ndarray, np.ndarray]:
+    """First snapshot at least the horizon after each snapshot (and whether it exists)."""
+    rows = np.searchsorted(history.times, history.times + horizon_minutes * 60.0, side="left")
+    exists = rows < history.n_snapshots
+    return np.minimum(rows, history.n_snapshots - 1), exists
+
+
+def _locate(history: ChainHistory, rows: np.ndarray, ordinals: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Column of each expiry (by date ordinal) in the given snapshot rows."""
+    match = history.expiry_ord[rows][None] == ordinals[..., None]  # (P, T, E)
+    return match.argmax(axis=2), match.any(axis=2)
+
+
+def evaluate(history: ChainHistory, grid: ParameterGrid, horizon_minutes: float) -> Dict[str, np.ndarray]:
+    """
+    Per-scan FF, signal inputs and forward P&L proxies for every vol point and DTE pair.
+
+    The calendar proxy marks the long ATM call calendar (sell front, buy back)
+    at the alert and again at the horizon on the same expiries, re-struck at
+    the money, as a return on the entry debit. FF reversion is the alert FF
+    minus the FF of the same expiry pair at the horizon.
+
+    Returns:
+        Arrays keyed "ff", "sigma_fwd", "valid" (V, P, T), "pair_key",
+        "calendar_return" (P, T) and "ff_reversion" (V, P, T)
+    """
+    vol_index = [history.vol_points.index(v) for v in grid.vol_points]
+    iv = history.iv[vol_index]  # (V, T, E)
+    rows = np.arange(history.n_snapshots)[None]  # (1, T)
+    front, back, paired = pair_indices(history, grid.dte_pairs)
+
+    front_dte, back_dte = history.dte[rows, front], history.dte[rows, back]
+    ff, sigma_fwd, valid = forward_factor_arrays(
+        iv[:, rows, front], front_dte, iv[:, rows, back], back_dte
+    )
+    # compute_signals also drops pairs without an ATM contract for liquidity checks
+    valid &= paired & history.has_atm[rows, front] & history.has_atm[rows, back]
+
+    front_ord, back_ord = history.expiry_ord[rows, front], history.expiry_ord[rows, back]
+    pair_key = front_ord * 1_000_000 + back_ord
+
+    exit_rows, exit_exists = _exit_rows(history, horizon_minutes)
+    exit_front, found_front = _locate(history, exit_rows, front_ord)
+    exit_back, found_back = _locate(history, exit_rows, back_ord)
+    found = paired & exit_exists[None] & found_front & found_back
+    exit_rows = exit_rows[None]
+
+    entry = history.atm_mid[rows, back] - history.atm_mid[rows, front]
+    exit_value = history.atm_mid[exit_rows, exit_back] - history.atm_mid[exit_rows, exit_front]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        calendar_return = np.where(found & (entry > 0), (exit_value - entry) / entry, np.nan)
+
+    exit_ff, _, exit_valid = forward_factor_arrays(
+        iv[:, exit_rows, exit_front], history.dte[exit_rows, exit_front],
+        iv[:, exit_rows, exit_back], history.dte[exit_rows, exit_back]
+    )
+    ff_reversion = np.where(valid & exit_valid & found, ff - exit_ff, np.nan)
+
+    return {
+        "ff": ff,
+        "sigma_fwd": sigma_fwd,
+        "valid": valid,
+        "pair_key": pair_key,
+        "calendar_return": calendar_return,
+        "ff_reversion": ff_reversion,
+    }
+
+
+def simulate(history: ChainHistory, grid: ParameterGrid, horizon_minutes: float, result: BacktestResult) -> None:
+    """
+    Replay StabilityTracker over one ticker's scans for every grid combination.
+
+    The tracker's cooldown makes each step depend on the last alert, so scans
+    are stepped in time order while every combination advances together as
+    one broadcast array. Like the tracker, state is keyed by expiry pair and
+    expires 24 hours after the first sighting; a new expiry pair starts fresh.
+
+    Args:
+        history: One ticker's chains
+        grid: Settings to sweep
+        horizon_minutes: Holding period for the P&L proxies
+        result: Totals to add this ticker's counts to (in place)
+    """
+    data = evaluate(history, grid, horizon_minutes)
+    shape = grid.shape
+    floors = grid.axis("sigma_fwd_floor")
+    thresholds = grid.axis("ff_threshold")
+    required = grid.axis("required_scans")
+    cooldown_seconds = grid.axis("cooldown_minutes") * 60.0
+    delta_min = grid.axis("delta_ff_min")
+    expand = (slice(None), slice(None)) + (None,) * (len(shape) - 2)
+
+    has_state = np.zeros(shape, dtype=bool)
+    state_key = np.full(shape, -1, dtype=np.int64)
+    first_seen = np.zeros(shape)
+    count = np.zeros(shape, dtype=np.int64)
+    last_ff = np.zeros(shape)
+    last_alert = np.full(shape, np.nan)
+
+    totals = {name: np.zeros(shape, dtype=getattr(result, name).dtype) for name in (
+        "signals", "alerts", "scored", "hits", "return_sum", "ff_scored", "ff_reversion_sum")}
+
+    for t, now in enumerate(history.times):
+        ff = np.nan_to_num(data["ff"][:, :, t], nan=-np.inf)[expand]
+        sigma_fwd = np.nan_to_num(data["sigma_fwd"][:, :, t], nan=-np.inf)[expand]
+        present = data["valid"][:, :, t][expand] & (sigma_fwd >= floors) & (ff >= thresholds)
+        if not present.any():
+            continue
+        present = np.broadcast_to(present, shape)
+        key = data["pair_key"][None, :, t][expand]
+
+        same = has_state & (state_key == key) & (now - first_seen < STATE_TTL_SECONDS)
+        new = present & ~same
+        seen = present & same
+
+        count = np.where(new, 1, np.where(seen, count + 1, count))
+        alerted = ~np.isnan(last_alert)
+        cooling = seen & alerted & (now - last_alert < cooldown_seconds)
+        small_delta = seen & alerted & ~cooling & (ff - last_ff < delta_min)
+        alert = seen & ~cooling & ~small_delta & (count >= required)
+
+        last_alert = np.where(new, np.nan, np.where(alert, now, last_alert))
+        last_ff = np.where(present, ff, last_ff)
+        first_seen = np.where(new, now, first_seen)
+        state_key = np.where(new, key, state_key)
+        has_state |= present
+
+        totals["signals"] += present
+        if not alert.any():
+            continue
+        totals["alerts"] += alert
+
+        calendar_return = data["calendar_return"][None, :, t][expand]
+        scored = alert & np.isfinite(calendar_return)
+        totals["scored"] += scored
+        totals["hits"] += scored & (calendar_return > 0)
+        totals["return_sum"] += np.where(scored, calendar_return, 0.0)
+
+        ff_reversion = data["ff_reversion"][:, :, t][expand]
+        ff_scored = alert & np.isfinite(ff_reversion)
+        totals["ff_scored"] += ff_scored
+        totals["ff_reversion_sum"] += np.where(ff_scored, ff_reversion, 0.0)
+
+    for name, values in totals.items():
+        getattr(result, name)[:] += values.ravel()
+
+
+def run_backtest(
+    histories: Iterable[ChainHistory],
+    grid: ParameterGrid,
+    horizon_minutes: float = 1440.0
+) -> BacktestResult:
+    """
+    Backtest every grid combination over every ticker's history.
+
+    Args:
+        histories: One ChainHistory per ticker
+        grid: Settings to sweep
+        horizon_minutes: Holding period for the P&L proxies (default one day)
+
+    Returns:
+        Totals across tickers per combination
+    """
+    result = BacktestResult.empty(grid)
+    for history in histories:
+        missing = set(grid.vol_points) - set(history.vol_points)
+        if missing:
+            raise ValueError(f"{history.ticker} history has no {sorted(missing)} vol points")
+        if history.dte.size:
+            simulate(history, grid, horizon_minutes, result)
+    return result
+
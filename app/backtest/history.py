@@ -0,0 +1,105 @@
+"""Columnar option chain history for backtesting."""
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence
+
+import numpy as np
+
+from app.providers.models import ChainSnapshot
+from app.providers.replay import ReplayFrame
+from app.services.signal_engine import select_contract, term_structure
+
+
+@dataclass
+class ChainHistory:
+    """
+    One ticker's recorded chains as padded NumPy arrays.
+
+    Snapshots are rows (T, sorted by time) and expiries are columns (E, the
+    most any snapshot has, sorted by DTE). Missing cells are NaN (or -1 for
+    expiry ordinals), so every stage of the backtest is array arithmetic.
+    Vol point IVs come from the live engine's term_structure(), and
+    calendar marks use the ATM call mid the engine checks for liquidity.
+    """
+    ticker: str
+    vol_points: List[str]
+    times: np.ndarray  # (T,) epoch seconds
+    underlying: np.ndarray  # (T,)
+    dte: np.ndarray  # (T, E) days, NaN padding
+    expiry_ord: np.ndarray  # (T, E) date.toordinal(), -1 padding
+    iv: np.ndarray  # (V, T, E) IV at each vol point, NaN if unavailable
+    atm_mid: np.ndarray  # (T, E) ATM call mid, NaN if no usable quote
+    has_atm: np.ndarray  # (T, E) whether the expiry has an ATM call at all
+
+    @property
+    def n_snapshots(self) -> int:
+        return len(self.times)
+
+    @classmethod
+    def from_chains(cls, chains: Iterable[ChainSnapshot], vol_points: Sequence[str] = ("ATM",)) -> "ChainHistory":
+        """
+        Build a history from parsed chains of a single ticker.
+
+        Args:
+            chains: Snapshots in any order
+            vol_points: Vol point methods to extract ("ATM", "35d_put", ...)
+
+        Returns:
+            ChainHistory
+
+        Raises:
+            ValueError: If there are no chains or they span several tickers
+        """
+        chains = sorted(chains, key=lambda c: c.as_of)
+        if not chains:
+            raise ValueError("No chains to build a history from")
+        tickers = {c.ticker for c in chains}
+        if len(tickers) > 1:
+            raise ValueError(f"Chains span several tickers: {sorted(tickers)}")
+
+        n_times = len(chains)
+        n_expiries = max((len(c.expiries) for c in chains), default=0)
+        vol_points = list(vol_points)
+
+        dte = np.full((n_times, n_expiries), np.nan)
+        expiry_ord = np.full((n_times, n_expiries), -1, dtype=np.int64)
+        iv = np.full((len(vol_points), n_times, n_expiries), np.nan)
+        atm_mid = np.full((n_times, n_expiries), np.nan)
+        has_atm = np.zeros((n_times, n_expiries), dtype=bool)
+
+        for t, chain in enumerate(chains):
+            n = len(chain.expiries)
+            for v, method in enumerate(vol_points):
+                iv[v, t, :n] = term_structure(chain, method).iv
+            for e, expiry in enumerate(chain.expiries):
+                dte[t, e] = expiry.dte
+                expiry_ord[t, e] = expiry.expiry_date.toordinal()
+                contract = select_contract(chain, expiry).contract
+                if contract is not None:
+                    has_atm[t, e] = True
+                    if contract.bid is not None and contract.ask is not None:
+                        atm_mid[t, e] = (contract.bid + contract.ask) / 2.0
+
+        return cls(
+            ticker=chains[0].ticker,
+            vol_points=vol_points,
+            times=np.array([c.as_of.timestamp() for c in chains]),
+            underlying=np.array([c.underlying_price for c in chains], dtype=float),
+            dte=dte,
+            expiry_ord=expiry_ord,
+            iv=iv,
+            atm_mid=atm_mid,
+            has_atm=has_atm
+        )
+
+    @classmethod
+    def from_frames(cls, frames: Iterable[ReplayFrame], vol_points: Sequence[str] = ("ATM",)) -> List["ChainHistory"]:
+        """
+        Build one history per ticker from recorded frames (files or option_chain_snapshots).
+
+        Returns:
+            Histories sorted by ticker
+        """
+        by_ticker = {}
+        for frame in frames:
+            by_ticker.setdefault(frame.ticker.upper(), []).append(frame.to_chain())
+        return [cls.from_chains(by_ticker[ticker], vol_points) for ticker in sorted(by_ticker)]
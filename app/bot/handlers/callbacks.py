@@ -13,8 +13,9 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
     Handle callback queries from signal action buttons.
     
-    Callback data format: "signal:<signal_id>:<action>"
-    where action is "placed", "ignored", or "expired"
+    Callback data format: "<action>:<signal_ref>"
+    where action is "place" or "ignore" and signal_ref is an encoded
+    "<signal_id>@<timestamp>" reference (bare signal IDs are still accepted)
     """
     try:
         query = update.callback_query
@@ -28,8 +29,8 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 return
             
             action = parts[0]  # "place" or "ignore"
-            signal_id = parts[1]
-            # user_id is in parts[2] if present (from notification)
+            signal_ref = parts[1]
+            # Older notifications also carried user_id in parts[2]
             
             # Map action names
             action_map = {
@@ -51,13 +52,7 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 return
             
             # Get signal first to obtain as_of_ts for composite foreign key
-            from app.models import Signal
-            from sqlalchemy import select
-            
-            result = await db.execute(
-                select(Signal).where(Signal.id == signal_id)
-            )
-            signal = result.scalar_one_or_none()
+            signal = await SignalService.get_signal_by_ref(db, signal_ref)
             
             if not signal:
                 await query.edit_message_text("❌ Signal not found")
@@ -66,7 +61,7 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
             # Record decision with composite foreign key
             await SignalService.record_decision(
                 db,
-                signal_id=signal_id,
+                signal_id=signal.id,
                 signal_as_of_ts=signal.as_of_ts,
                 user_id=user.id,
                 decision=action,
@@ -3,7 +3,7 @@ import logging
 from telegram import Update
 from telegram.ext import ContextTypes
 from app.services import UserService, SignalService
-from app.core.database import AsyncSessionLocal
+from app.core.database import AsyncReadSessionLocal
 from app.utils.formatting import format_history
 
 logger = logging.getLogger(__name__)
@@ -17,7 +17,8 @@ async def history_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     try:
         chat_id = str(update.effective_chat.id)
         
-        async with AsyncSessionLocal() as db:
+        # Read-only lookups: served by the read replica when configured
+        async with AsyncReadSessionLocal() as db:
             # Get user
             user = await UserService.get_user_by_chat_id(db, chat_id)
             if not user:
@@ -4,6 +4,7 @@ import traceback
 from telegram import Update
 from telegram.ext import Application, CommandHandler, CallbackQueryHandler, ContextTypes
 from app.core.config import settings
+from app.core.metrics import start_metrics_server
 from app.bot.handlers.start import start_command, help_command
 from app.bot.handlers.watchlist import add_command, remove_command, list_command
 from app.bot.handlers.history import history_command
@@ -63,8 +64,15 @@ def main():
     logger.debug(f"Bot token configured: {bool(settings.telegram_bot_token)}")
     logger.info("="*60)
     
+    start_metrics_server()
+    
     # Create application
-    application = Application.builder().token(settings.telegram_bot_token).build()
+    application = (
+        Application.builder()
+        .token(settings.telegram_bot_token)
+        .base_url(settings.telegram_api_base_url)
+        .build()
+    )
     
     # Register error handler
     application.add_error_handler(error_handler)
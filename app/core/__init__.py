@@ -1,6 +1,6 @@
 """Core package initialization."""
 from app.core.config import settings
-from app.core.database import Base, get_db, init_db
+from app.core.database import Base, get_db, get_read_db, init_db
 from app.core.redis import get_redis, close_redis
 
-__all__ = ["settings", "Base", "get_db", "init_db", "get_redis", "close_redis"]
+__all__ = ["settings", "Base", "get_db", "get_read_db", "init_db", "get_redis", "close_redis"]
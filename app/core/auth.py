@@ -1,7 +1,10 @@
 """Authentication utilities for JWT token handling and password hashing."""
+import asyncio
 import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
@@ -10,22 +13,44 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.user_cache import auth_user_cache
 from app.models.user import User
 from sqlalchemy import select
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = logging.getLogger(__name__)
+
+# Password hashing context (hashes with a different cost are flagged for rehash)
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds)
+
+# Bounded pool for bcrypt so hashing never blocks the event loop
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="bcrypt"
+)
 
 # OAuth2 scheme for token extraction
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
+def _prehash(password: str) -> str:
+    """
+    Pre-hash passwords longer than bcrypt's 72-byte limit with SHA256.
+    
+    This is a standard approach to work around bcrypt's limitation while
+    keeping the full password significant.
+    """
+    if len(password.encode('utf-8')) > 72:
+        return hashlib.sha256(password.encode('utf-8')).hexdigest()
+    return password
+
+
 def hash_password(password: str) -> str:
     """
     Hash a plain text password using bcrypt.
     
     To work around bcrypt's 72-byte limitation, we pre-hash long passwords
     with SHA256. This ensures security while avoiding the byte limit.
+    Blocks for the full bcrypt cost; use hash_password_async in handlers.
     
     Args:
         password: Plain text password
@@ -33,12 +58,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    # Pre-hash with SHA256 if password is longer than 72 bytes
-    # This is a standard approach to work around bcrypt's limitation
-    if len(password.encode('utf-8')) > 72:
-        password = hashlib.sha256(password.encode('utf-8')).hexdigest()
-    
-    return pwd_context.hash(password)
+    return pwd_context.hash(_prehash(password))
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -46,6 +66,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Verify a plain text password against a hashed password.
     
     Handles the SHA256 pre-hashing for passwords longer than 72 bytes.
+    Blocks for the full bcrypt cost; use verify_password_async in handlers.
     
     Args:
         plain_password: Plain text password to verify
@@ -54,11 +75,46 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    # Pre-hash with SHA256 if password is longer than 72 bytes
-    if len(plain_password.encode('utf-8')) > 72:
-        plain_password = hashlib.sha256(plain_password.encode('utf-8')).hexdigest()
+    return pwd_context.verify(_prehash(plain_password), hashed_password)
+
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if its hash uses outdated parameters.
     
-    return pwd_context.verify(plain_password, hashed_password)
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Stored hash to compare against
+        
+    Returns:
+        Tuple of (matches, new_hash); new_hash is set only when the password
+        matches and the stored hash's cost differs from BCRYPT_ROUNDS
+    """
+    return pwd_context.verify_and_update(_prehash(plain_password), hashed_password)
+
+
+async def _run_in_password_pool(func, *args):
+    """Run a blocking bcrypt call in the bounded password thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, func, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password without blocking the event loop (see hash_password)."""
+    return await _run_in_password_pool(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop (see verify_password)."""
+    return await _run_in_password_pool(verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Verify and maybe rehash without blocking the event loop (see verify_and_update_password)."""
+    return await _run_in_password_pool(verify_and_update_password, plain_password, hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -112,6 +168,38 @@ def decode_access_token(token: str) -> dict:
         raise credentials_exception
 
 
+async def load_user(db: AsyncSession, user_id: str) -> Tuple[Optional[User], Optional[str]]:
+    """
+    Load a user through auth_user_cache, falling back to the database.
+    
+    Args:
+        db: Database session (only queried on a cache miss)
+        user_id: User ID from the access token
+        
+    Returns:
+        (user, version) tuple; user is None if it doesn't exist, version is
+        the user's auth_user_cache version, or None if Redis is unavailable
+    """
+    # Read the version before loading so a concurrent change is never cached as current
+    try:
+        version = await auth_user_cache.get_version(user_id)
+    except Exception as e:
+        logger.warning(f"User cache unavailable, loading user from database: {e}")
+        version = None
+    
+    user = auth_user_cache.get(user_id, version) if version is not None else None
+    
+    if user is None:
+        # Query user from database
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        
+        if user is not None and version is not None:
+            auth_user_cache.put(user_id, user, version)
+    
+    return user, version
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db)
@@ -119,6 +207,10 @@ async def get_current_user(
     """
     FastAPI dependency to get the current authenticated user from JWT token.
     
+    Users are served from the per-process auth_user_cache while their Redis
+    version is unchanged, so most requests skip the user query. If Redis is
+    unavailable the user is always loaded from the database.
+    
     Args:
         token: JWT token from Authorization header
         db: Database session
@@ -141,9 +233,7 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
     
-    # Query user from database
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user, _ = await load_user(db, user_id)
     
     if user is None:
         raise credentials_exception
@@ -1,9 +1,17 @@
 """Database setup with async SQLAlchemy for PostgreSQL/TimescaleDB."""
+from sqlalchemy.exc import TimeoutError as SATimeoutError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
+from app.core.metrics import (
+    PROCESS_ROLE, DB_POOL_CHECKOUTS, DB_POOL_CHECKOUT_WAIT, DB_POOL_CHECKOUT_TIMEOUTS
+)
+from app.core.db_metrics import instrument_engine
 import logging
 import re
+import time
+import uuid
 from typing import AsyncGenerator
 
 logger = logging.getLogger(__name__)
@@ -16,27 +24,103 @@ def mask_db_url(url: str) -> str:
 logger.info(f"Connecting to database: {mask_db_url(settings.database_url)}")
 logger.debug(f"Database URL scheme: {settings.database_url.split(':')[0]}")
 
-# Create async engine with PostgreSQL connection pooling
-engine_args = {
-    "echo": settings.log_level == "DEBUG",  # Log all SQL if DEBUG
-    "pool_pre_ping": True,  # Verify connections before using
-    "pool_size": 10,  # Maintain 10 connections in pool
-    "max_overflow": 20,  # Allow up to 20 additional connections
-    "pool_timeout": 30,  # Wait up to 30s for connection
-    "pool_recycle": 3600,  # Recycle connections every hour
+# Pool sizes per process role. Every service opens its own pool, so the sum
+# across replicas must stay below Postgres max_connections.
+POOL_PROFILES = {
+    "api": {"pool_size": 10, "max_overflow": 10},
+    "bot": {"pool_size": 3, "max_overflow": 2},
+    "scan_worker": {"pool_size": 2, "max_overflow": 2},  # One scan at a time
+    "notification_router": {"pool_size": 2, "max_overflow": 2},
+    "reminder_worker": {"pool_size": 1, "max_overflow": 2},
+    "scheduler": {"pool_size": 1, "max_overflow": 2},
+    "discovery_worker": {"pool_size": 1, "max_overflow": 1},
 }
 
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool recording checkouts and checkout wait time."""
+    
+    engine_name = "primary"
+    
+    def _do_get(self):
+        labels = {"role": PROCESS_ROLE, "engine": self.engine_name}
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except SATimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(**labels).inc()
+            raise
+        DB_POOL_CHECKOUT_WAIT.labels(**labels).observe(time.perf_counter() - start)
+        DB_POOL_CHECKOUTS.labels(**labels).inc()
+        return connection
+
+
+def _pool_class(engine_name: str):
+    """Pool class labelling its metrics with an engine name (kept across pool recreation)."""
+    return type(f"InstrumentedQueuePool_{engine_name}", (InstrumentedQueuePool,), {"engine_name": engine_name})
+
+
+def build_engine_args(role: str, url: str) -> dict:
+    """
+    Build create_async_engine arguments for a process role.
+    
+    Args:
+        role: Process role selecting the pool profile (PROCESS_ROLE)
+        url: Database URL (asyncpg-specific options are only set for asyncpg)
+        
+    Returns:
+        Keyword arguments for create_async_engine
+    """
+    profile = POOL_PROFILES.get(role)
+    if profile is None:
+        logger.warning(f"Unknown process role '{role}', using the api pool profile")
+        profile = POOL_PROFILES["api"]
+    
+    args = {
+        "echo": settings.log_level == "DEBUG",  # Log all SQL if DEBUG
+        "pool_pre_ping": True,  # Verify connections before using
+        "pool_size": settings.db_pool_size if settings.db_pool_size is not None else profile["pool_size"],
+        "max_overflow": settings.db_max_overflow if settings.db_max_overflow is not None else profile["max_overflow"],
+        "pool_timeout": 30,  # Wait up to 30s for connection
+        "pool_recycle": 3600,  # Recycle connections every hour
+    }
+    
+    if url.startswith("postgresql+asyncpg"):
+        if settings.db_pgbouncer:
+            # PgBouncer transaction pooling hands each transaction to any
+            # server connection, so named prepared statements cannot be reused
+            args["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            }
+        else:
+            args["connect_args"] = {
+                "statement_cache_size": settings.db_statement_cache_size,
+                "prepared_statement_cache_size": settings.db_statement_cache_size,
+            }
+    
+    return args
+
+
+# Create async engine with PostgreSQL connection pooling
+engine_args = build_engine_args(PROCESS_ROLE, settings.database_url)
+
 logger.info(
-    f"Configuring connection pool: pool_size=10, max_overflow=20, "
-    f"pool_timeout=30s, pool_recycle=3600s"
+    f"Configuring connection pool for role '{PROCESS_ROLE}': "
+    f"pool_size={engine_args['pool_size']}, max_overflow={engine_args['max_overflow']}, "
+    f"pool_timeout=30s, pool_recycle=3600s, pgbouncer={settings.db_pgbouncer}"
 )
 
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
+    poolclass=_pool_class("primary"),
     **engine_args
 )
 
+instrument_engine(engine.sync_engine, "primary")
+
 logger.info("Database engine created with connection pooling enabled")
 logger.debug(f"Engine pool configuration: {engine.pool}")
 
@@ -51,6 +135,29 @@ AsyncSessionLocal = async_sessionmaker(
 
 logger.info("Async session factory created")
 
+# Optional read replica: analytics and history reads go here so expensive
+# aggregates do not compete with scan-worker writes on the primary
+if settings.read_database_url:
+    logger.info(f"Connecting to read replica: {mask_db_url(settings.read_database_url)}")
+    read_engine = create_async_engine(
+        settings.read_database_url,
+        poolclass=_pool_class("replica"),
+        **build_engine_args(PROCESS_ROLE, settings.read_database_url)
+    )
+    instrument_engine(read_engine.sync_engine, "replica")
+else:
+    logger.info("No read replica configured, read sessions use the primary")
+    read_engine = engine
+
+# Session factory for read-only queries (see get_read_db)
+AsyncReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False
+)
+
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
@@ -92,6 +199,28 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
                 logger.debug("Database session closed")
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only database sessions.
+    
+    Uses the read replica when READ_DATABASE_URL is set, otherwise the
+    primary. Replicas may lag, so use this only for reads that tolerate
+    slightly stale data (analytics, history, monitoring), and never write.
+    """
+    async with AsyncReadSessionLocal() as session:
+        try:
+            yield session
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Read session rolled back due to error: {str(e)}", exc_info=True)
+            raise
+
+
+def get_read_session():
+    """Context manager for read-only sessions outside of FastAPI requests."""
+    return AsyncReadSessionLocal()
+
+
 def get_async_session():
     """Context manager for getting database sessions outside of FastAPI requests."""
     logger.debug("Creating standalone async session context manager")
@@ -0,0 +1,88 @@
+"""SQLAlchemy event hooks recording statement latency and pool usage."""
+import re
+import time
+from functools import lru_cache
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.metrics import (
+    PROCESS_ROLE,
+    DB_STATEMENT_DURATION,
+    DB_STATEMENT_ERRORS,
+    DB_POOL_CONNECTIONS_IN_USE,
+)
+
+# Leading SQL verbs kept as-is in statement names; anything else is "OTHER"
+_VERBS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "CALL", "BEGIN", "COMMIT", "ROLLBACK"}
+
+# First table a statement reads from or writes to
+_TABLE = re.compile(r'\b(?:FROM|INTO|UPDATE|JOIN)\s+"?([A-Za-z_][\w.]*)', re.IGNORECASE)
+
+# Connection.info key holding start times of in-flight statements
+_START_TIMES = "ffbot_statement_start"
+
+
+@lru_cache(maxsize=2048)
+def statement_name(statement: str) -> str:
+    """
+    Reduce SQL to a low-cardinality label such as "SELECT signals".
+
+    Args:
+        statement: SQL text as sent to the driver
+
+    Returns:
+        "<VERB> <first table>" ("-" when no table is referenced)
+    """
+    words = statement.split(None, 1)
+    verb = words[0].upper() if words else "OTHER"
+    if verb not in _VERBS:
+        verb = "OTHER"
+
+    match = _TABLE.search(statement)
+    table = match.group(1).lower() if match else "-"
+    return f"{verb} {table}"
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    Attach latency and pool-usage hooks to a (sync) engine.
+
+    Records ffbot_db_statement_duration_seconds per normalized statement,
+    ffbot_db_statement_errors_total, and the connections currently checked
+    out of the pool. Pool checkout wait is recorded by the pool class (see
+    database.InstrumentedQueuePool).
+
+    Args:
+        engine: Engine to instrument (AsyncEngine.sync_engine for async engines)
+        name: Engine label ("primary" or "replica")
+    """
+    in_use = DB_POOL_CONNECTIONS_IN_USE.labels(role=PROCESS_ROLE, engine=name)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_START_TIMES, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info[_START_TIMES].pop()
+        DB_STATEMENT_DURATION.labels(
+            role=PROCESS_ROLE, engine=name, statement=statement_name(statement)
+        ).observe(time.perf_counter() - start)
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get(_START_TIMES):
+            conn.info[_START_TIMES].pop()
+        DB_STATEMENT_ERRORS.labels(
+            role=PROCESS_ROLE, engine=name, statement=statement_name(exception_context.statement or "")
+        ).inc()
+
+    @event.listens_for(engine, "checkout")
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        in_use.inc()
+
+    @event.listens_for(engine, "checkin")
+    def checkin(dbapi_connection, connection_record):
+        in_use.dec()
@@ -0,0 +1,196 @@
+"""Prometheus metrics shared by every process."""
+import logging
+
+from prometheus_client import Counter, Gauge, Histogram, CONTENT_TYPE_LATEST, generate_latest, start_http_server
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Every series carries the process role (api, scan_worker, bot, ...)
+PROCESS_ROLE = settings.process_role
+
+# Buckets for waits that are normally sub-millisecond but may hit pool_timeout
+WAIT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+# Buckets for SQL statements, from index lookups to heavy aggregates
+QUERY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Buckets for pipeline stages: Polygon calls, whole scans, signal computation
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Buckets for end-to-end lags, from near-immediate delivery to a stalled queue
+LAG_BUCKETS = (0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+
+# Buckets for option chain sizes (contracts per snapshot)
+CHAIN_SIZE_BUCKETS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000)
+
+
+# ============================================================================
+# Database connection pool
+# ============================================================================
+
+DB_POOL_CHECKOUTS = Counter(
+    "ffbot_db_pool_checkouts_total",
+    "Connections checked out of the SQLAlchemy pool",
+    ["role", "engine"]
+)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "ffbot_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    ["role", "engine"],
+    buckets=WAIT_BUCKETS
+)
+
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "ffbot_db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout",
+    ["role", "engine"]
+)
+
+
+DB_POOL_CONNECTIONS_IN_USE = Gauge(
+    "ffbot_db_pool_connections_in_use",
+    "Connections currently checked out of the SQLAlchemy pool",
+    ["role", "engine"]
+)
+
+
+# ============================================================================
+# Database statements
+# ============================================================================
+
+DB_STATEMENT_DURATION = Histogram(
+    "ffbot_db_statement_duration_seconds",
+    "SQL statement latency by normalized statement (verb and first table)",
+    ["role", "engine", "statement"],
+    buckets=QUERY_BUCKETS
+)
+
+DB_STATEMENT_ERRORS = Counter(
+    "ffbot_db_statement_errors_total",
+    "SQL statements that raised an error",
+    ["role", "engine", "statement"]
+)
+
+
+# ============================================================================
+# Scan pipeline
+# ============================================================================
+
+POLYGON_REQUEST_DURATION = Histogram(
+    "ffbot_polygon_request_duration_seconds",
+    "Polygon HTTP request latency per attempt",
+    ["role", "endpoint", "status"],
+    buckets=STAGE_BUCKETS
+)
+
+CHAIN_CONTRACTS = Histogram(
+    "ffbot_chain_contracts",
+    "Contracts in a fetched option chain snapshot",
+    ["role"],
+    buckets=CHAIN_SIZE_BUCKETS
+)
+
+SCANS = Counter(
+    "ffbot_scans_total",
+    "Ticker scans by queue and result",
+    ["role", "mode", "result"]
+)
+
+SCAN_DURATION = Histogram(
+    "ffbot_scan_duration_seconds",
+    "Time to scan one ticker, from chain fetch to queued notifications",
+    ["role", "mode"],
+    buckets=STAGE_BUCKETS
+)
+
+COMPUTE_SIGNALS_DURATION = Histogram(
+    "ffbot_compute_signals_duration_seconds",
+    "Time spent in compute_signals for one user's settings",
+    ["role"],
+    buckets=QUERY_BUCKETS
+)
+
+STABILITY_CHECKS = Counter(
+    "ffbot_stability_checks_total",
+    "Stability checks by outcome reason",
+    ["role", "reason"]
+)
+
+SIGNALS_CREATED = Counter(
+    "ffbot_signals_created_total",
+    "Signals persisted and queued for notification",
+    ["role"]
+)
+
+
+PIPELINE_STAGE_DURATION = Histogram(
+    "ffbot_pipeline_stage_duration_seconds",
+    "Time spent in each traced alert pipeline stage (fetch ... send)",
+    ["role", "stage"],
+    buckets=STAGE_BUCKETS
+)
+
+ALERT_LATENCY = Histogram(
+    "ffbot_alert_latency_seconds",
+    "Time from Polygon returning the chain to the alert's Telegram message",
+    ["role"],
+    buckets=LAG_BUCKETS
+)
+
+
+# ============================================================================
+# Delivery
+# ============================================================================
+
+NOTIFICATIONS = Counter(
+    "ffbot_notifications_total",
+    "Signal notifications by result",
+    ["role", "result"]
+)
+
+NOTIFICATION_LAG = Histogram(
+    "ffbot_notification_lag_seconds",
+    "Time from the signal's chain snapshot to its Telegram message",
+    ["role"],
+    buckets=LAG_BUCKETS
+)
+
+REMINDERS = Counter(
+    "ffbot_reminders_total",
+    "Trade reminders by result",
+    ["role", "result"]
+)
+
+REMINDER_LAG = Histogram(
+    "ffbot_reminder_lag_seconds",
+    "Time from a reminder's due time to its processing",
+    ["role"],
+    buckets=LAG_BUCKETS
+)
+
+
+def render_metrics():
+    """
+    Render every registered metric in the Prometheus text format.
+
+    Returns:
+        Tuple of (body, content type)
+    """
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def start_metrics_server() -> None:
+    """
+    Serve this process's metrics over HTTP (for processes without the API).
+
+    Listens on METRICS_PORT; a port of 0 disables the exporter.
+    """
+    if not settings.metrics_port:
+        logger.info("Metrics exporter disabled (METRICS_PORT=0)")
+        return
+
+    start_http_server(settings.metrics_port)
+    logger.info(f"Metrics exporter for role '{PROCESS_ROLE}' listening on :{settings.metrics_port}")
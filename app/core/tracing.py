@@ -0,0 +1,327 @@
+"""Lightweight alert pipeline tracing with OpenTelemetry-compatible export.
+
+A trace starts in ScanWorker.scan_ticker and follows each new signal through
+the notification queue into NotificationRouter.send_signal_to_user. Stages
+(fetch, parse, compute, stability, persist, enqueue, dequeue, send) become
+child spans of the scan or notify span. Every stage is observed in
+ffbot_pipeline_stage_duration_seconds, so per-stage percentiles are always
+queryable; spans are exported as OTLP/JSON only when TRACE_EXPORT_PATH or
+TRACE_OTLP_ENDPOINT is set (both readable by the OpenTelemetry collector).
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+from app.core.metrics import PROCESS_ROLE, PIPELINE_STAGE_DURATION, ALERT_LATENCY
+
+logger = logging.getLogger(__name__)
+
+# Stages in pipeline order
+PIPELINE_STAGES = ("fetch", "parse", "compute", "stability", "persist", "enqueue", "dequeue", "send")
+
+# Trace of the scan or notification handled by the current task
+_current_trace: ContextVar[Optional["PipelineTrace"]] = ContextVar("pipeline_trace", default=None)
+
+
+def _new_id(num_bytes: int) -> str:
+    """Random lowercase hex ID (16 bytes for traces, 8 for spans)."""
+    return os.urandom(num_bytes).hex()
+
+
+@dataclass
+class Span:
+    """A finished (or in-progress) span with OTLP-style hex IDs."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def to_otlp(self) -> dict:
+        """Encode as an OTLP/JSON span."""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": {"stringValue": str(value)}}
+                for key, value in self.attributes.items()
+            ]
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class PipelineTrace:
+    """
+    Root span of one scan or notification plus its stage spans.
+
+    The scan side creates a fresh trace; the notification side continues it
+    from the context carried in the queue payload, so both halves share one
+    trace ID and the notify span is a child of the scan span.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: Optional[str] = None,
+        parent_id: Optional[str] = None,
+        fetched_at: Optional[float] = None,
+        **attributes: Any
+    ):
+        self.root = Span(
+            name=name,
+            trace_id=trace_id or _new_id(16),
+            span_id=_new_id(8),
+            parent_id=parent_id,
+            start_ns=time.time_ns(),
+            attributes=attributes
+        )
+        self.spans: List[Span] = []
+        # Wall-clock time the chain arrived from Polygon (end of the fetch stage)
+        self.fetched_at = fetched_at
+
+    @classmethod
+    def from_context(cls, context: Dict[str, Any], name: str, **attributes: Any) -> "PipelineTrace":
+        """Continue a trace from a context produced by context()."""
+        return cls(
+            name,
+            trace_id=context["trace_id"],
+            parent_id=context["span_id"],
+            fetched_at=context.get("fetched_at"),
+            **attributes
+        )
+
+    def context(self) -> Dict[str, Any]:
+        """Propagation context to carry across the notification queue."""
+        return {
+            "trace_id": self.root.trace_id,
+            "span_id": self.root.span_id,
+            "fetched_at": self.fetched_at,
+            "enqueued_at": time.time()
+        }
+
+    def record(self, stage: str, start: float, end: float, **attributes: Any) -> None:
+        """
+        Record a stage that already happened (e.g. time spent queued).
+
+        Args:
+            stage: Stage name from PIPELINE_STAGES
+            start: Wall-clock start (seconds since the epoch)
+            end: Wall-clock end (seconds since the epoch)
+            **attributes: Extra span attributes
+        """
+        end = max(end, start)
+        self.spans.append(Span(
+            name=stage,
+            trace_id=self.root.trace_id,
+            span_id=_new_id(8),
+            parent_id=self.root.span_id,
+            start_ns=int(start * 1e9),
+            end_ns=int(end * 1e9),
+            attributes=attributes
+        ))
+        PIPELINE_STAGE_DURATION.labels(role=PROCESS_ROLE, stage=stage).observe(end - start)
+        if stage == "fetch":
+            self.fetched_at = end
+
+    @contextmanager
+    def stage(self, stage: str, **attributes: Any) -> Iterator[None]:
+        """Time the enclosed block as a stage span (recorded even if it raises)."""
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.record(stage, start, time.time(), **attributes)
+
+    def alert_sent(self) -> None:
+        """Observe the chain-to-Telegram latency after a successful send."""
+        if self.fetched_at is not None:
+            ALERT_LATENCY.labels(role=PROCESS_ROLE).observe(max(time.time() - self.fetched_at, 0.0))
+
+    def finish(self) -> List[Span]:
+        """End the root span and return it with its stage spans."""
+        self.root.end_ns = time.time_ns()
+        return [self.root] + self.spans
+
+
+class SpanExporter:
+    """
+    Export finished spans as OTLP/JSON to a file and/or an OTLP/HTTP collector.
+
+    export() only queues the spans; a background task started on first use
+    batches whatever is queued into one request, writes the file off the
+    event loop and posts to the collector, so a slow disk or collector never
+    holds up a scan or notification. When the queue is full, new spans are
+    dropped.
+    """
+
+    QUEUE_SIZE = 1000  # Traces waiting to be exported
+    BATCH_SIZE = 100  # Traces per file line / collector request
+
+    def __init__(self, path: Optional[str] = None, endpoint: Optional[str] = None):
+        self.path = path
+        self.endpoint = endpoint
+        self.client: Optional[httpx.AsyncClient] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._sender: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans go anywhere (otherwise only metrics are recorded)."""
+        return bool(self.path or self.endpoint)
+
+    @staticmethod
+    def encode(spans: List[Span]) -> dict:
+        """Wrap spans in an OTLP ExportTraceServiceRequest (JSON mapping)."""
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    {"key": "service.name", "value": {"stringValue": f"ffbot-{PROCESS_ROLE}"}}
+                ]},
+                "scopeSpans": [{
+                    "scope": {"name": "ffbot.pipeline"},
+                    "spans": [span.to_otlp() for span in spans]
+                }]
+            }]
+        }
+
+    async def export(self, spans: List[Span]) -> None:
+        """Queue spans for export (best effort; never blocks or raises)."""
+        if not self.enabled or not spans:
+            return
+
+        if self._sender is None or self._sender.done():
+            self._queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+            self._sender = asyncio.create_task(self._send_loop())
+
+        try:
+            self._queue.put_nowait(spans)
+        except asyncio.QueueFull:
+            logger.warning(f"Dropping {len(spans)} spans: export queue full")
+
+    async def flush(self) -> None:
+        """Wait until every queued span has been exported (or failed)."""
+        if self._queue is not None and self._sender is not None and not self._sender.done():
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Export what is queued, then stop the background task and the HTTP client."""
+        await self.flush()
+        if self._sender is not None:
+            self._sender.cancel()
+            await asyncio.gather(self._sender, return_exceptions=True)
+            self._sender = None
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def _send_loop(self) -> None:
+        """Export queued spans in batches, forever."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.BATCH_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._send([span for spans in batch for span in spans])
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, line: str) -> None:
+        """Append one line to the export file (runs in a thread)."""
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    async def _send(self, spans: List[Span]) -> None:
+        """Write and post one batch of spans (failures are logged, never raised)."""
+        payload = self.encode(spans)
+        try:
+            if self.path:
+                await asyncio.to_thread(self._write, json.dumps(payload, separators=(",", ":")) + "\n")
+            if self.endpoint:
+                if self.client is None:
+                    self.client = httpx.AsyncClient(timeout=2.0)
+                response = await self.client.post(self.endpoint, json=payload)
+                response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"Failed to export {len(spans)} spans: {e}")
+
+
+# Global instance
+span_exporter = SpanExporter(path=settings.trace_export_path, endpoint=settings.trace_otlp_endpoint)
+
+
+def current_trace() -> Optional[PipelineTrace]:
+    """Trace of the current task, if any."""
+    return _current_trace.get()
+
+
+@contextmanager
+def trace_stage(stage: str, **attributes: Any) -> Iterator[None]:
+    """Time a stage in the current trace; a no-op outside a traced task."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    with trace.stage(stage, **attributes):
+        yield
+
+
+@contextmanager
+def use_trace(trace: PipelineTrace) -> Iterator[PipelineTrace]:
+    """Make a trace current for the enclosed block (and the calls it awaits)."""
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+def inject_payload(signal_ref: str) -> str:
+    """
+    Build a notification queue payload carrying the current trace context.
+
+    Args:
+        signal_ref: Encoded signal reference
+
+    Returns:
+        JSON payload, or the bare ref when no trace is active
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return signal_ref
+    return json.dumps({"ref": signal_ref, "trace": trace.context()})
+
+
+def extract_payload(payload: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Split a notification queue payload into signal ref and trace context.
+
+    Bare refs (queued before tracing, or without a trace) are accepted.
+
+    Args:
+        payload: Queue payload from inject_payload()
+
+    Returns:
+        (signal_ref, trace context or None) tuple
+    """
+    if not payload.startswith("{"):
+        return payload, None
+    data = json.loads(payload)
+    return data["ref"], data.get("trace")
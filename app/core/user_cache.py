@@ -0,0 +1,108 @@
+"""Per-process cache of authenticated users for get_current_user."""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.models.user import User
+
+
+class AuthUserCache:
+    """
+    LRU cache with TTL of User rows, validated against a Redis version.
+
+    Every API process keeps its own cache of recently authenticated users.
+    Each entry records the user's version counter from Redis at load time;
+    invalidate() bumps the counter, so every process reloads the user from
+    Postgres on its next request. Each request therefore costs one Redis GET
+    instead of a user query, and the database is only hit on a miss, after
+    the TTL, or after the user changed.
+
+    Entries hold column values, not ORM instances: each hit builds a fresh
+    detached User, so a request mutating it (or adding it to its session)
+    never affects other requests.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 60):
+        self.redis = None
+        self._lock = asyncio.Lock()
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # user_id -> (column values, version, loaded_at)
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], str, float]]" = OrderedDict()
+
+    async def _get_redis(self):
+        """Get Redis connection."""
+        if self.redis is None:
+            async with self._lock:
+                if self.redis is None:
+                    self.redis = await get_redis()
+        return self.redis
+
+    def _version_key(self, user_id: str) -> str:
+        """Redis key of a user's version counter."""
+        return f"auth_user_version:{user_id}"
+
+    async def get_version(self, user_id: str) -> str:
+        """Current version of a user ("0" until first invalidated)."""
+        redis = await self._get_redis()
+        return await redis.get(self._version_key(user_id)) or "0"
+
+    def get(self, user_id: str, version: str) -> Optional[User]:
+        """
+        Return a cached user if present, fresh and at the given version.
+
+        Args:
+            user_id: User ID from the access token
+            version: Current version from get_version()
+
+        Returns:
+            Detached User built from the cached columns, or None on a miss
+        """
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+
+        columns, cached_version, loaded_at = entry
+        if cached_version != version or time.monotonic() - loaded_at > self.ttl_seconds:
+            del self._entries[user_id]
+            return None
+
+        self._entries.move_to_end(user_id)
+        user = User(**columns)
+        make_transient_to_detached(user)
+        return user
+
+    def put(self, user_id: str, user: User, version: str) -> None:
+        """Cache a user loaded from the database at the given version."""
+        columns = {
+            attr.key: getattr(user, attr.key)
+            for attr in inspect(User).column_attrs
+        }
+        self._entries[user_id] = (columns, version, time.monotonic())
+        self._entries.move_to_end(user_id)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, user_id: str) -> None:
+        """Drop a user from every process's cache (status change, logout, etc.)."""
+        self._entries.pop(user_id, None)
+        redis = await self._get_redis()
+        await redis.incr(self._version_key(user_id))
+
+    def clear(self) -> None:
+        """Drop all entries cached by this process."""
+        self._entries.clear()
+
+
+# Global instance
+auth_user_cache = AuthUserCache(
+    max_size=settings.auth_user_cache_size,
+    ttl_seconds=settings.auth_user_cache_ttl_seconds
+)
@@ -1,5 +1,5 @@
 """Signal user decision model."""
-from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Float, ForeignKeyConstraint
+from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Float, ForeignKeyConstraint, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 import uuid
@@ -19,6 +19,8 @@ class SignalUserDecision(Base):
             ondelete='CASCADE',
             name='signal_user_decisions_signal_composite_fkey'
         ),
+        # Keyset pagination of a user's history on (decision_ts, id)
+        Index('ix_signal_user_decisions_user_time', 'user_id', 'decision_ts', 'id'),
     )
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
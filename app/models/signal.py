@@ -1,5 +1,5 @@
 """Signal model for storing computed Forward Factor signals."""
-from sqlalchemy import Column, String, DateTime, Integer, Float, JSON, Date, Boolean
+from sqlalchemy import Column, String, DateTime, Integer, Float, JSON, Date, Boolean, Index
 from datetime import datetime, timezone
 import uuid
 from app.core.database import Base
@@ -10,6 +10,13 @@ class Signal(Base):
     
     __tablename__ = "signals"
     
+    # Unique index must include the partitioning column on a hypertable.
+    # Mirrors ix_signals_dedupe_key_time from the initial migration and is the
+    # ON CONFLICT target for signal inserts.
+    __table_args__ = (
+        Index('ix_signals_dedupe_key_time', 'dedupe_key', 'as_of_ts', unique=True),
+    )
+    
     # Composite primary key for TimescaleDB hypertable
     # TimescaleDB requires partitioning column (as_of_ts) to be part of primary key
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
@@ -0,0 +1,205 @@
+"""Vectorized Black-Scholes implied volatility and delta for contracts missing greeks."""
+import math
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from app.providers.models import Expiry
+
+# Search bounds for implied volatility (annualized, decimal)
+IV_MIN = 1e-4
+IV_MAX = 5.0
+
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+
+def norm_pdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal density."""
+    return np.exp(-0.5 * x * x) / _SQRT_2PI
+
+
+def norm_cdf(x: np.ndarray) -> np.ndarray:
+    """
+    Standard normal CDF (Abramowitz & Stegun 26.2.17, |error| < 7.5e-8).
+
+    NumPy has no erf and SciPy isn't a dependency; this is accurate well
+    beyond quoted option prices.
+    """
+    z = np.abs(x)
+    t = 1.0 / (1.0 + 0.2316419 * z)
+    poly = t * (0.319381530 + t * (-0.356563782 + t * (1.781477937 + t * (-1.821255978 + t * 1.330274429))))
+    upper = 1.0 - norm_pdf(z) * poly
+    return np.where(x >= 0, upper, 1.0 - upper)
+
+
+def _d1(spot, strike, t, rate, sigma):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (np.log(spot / strike) + (rate + 0.5 * sigma * sigma) * t) / (sigma * np.sqrt(t))
+
+
+def bs_price(spot, strike, t, rate, sigma, is_call) -> np.ndarray:
+    """
+    Black-Scholes price (no dividends) for arrays of contracts.
+
+    Args:
+        spot: Underlying price
+        strike: Strike price
+        t: Time to expiry in years
+        rate: Continuously compounded risk-free rate
+        sigma: Volatility (decimal)
+        is_call: True for calls, False for puts
+
+    Returns:
+        Option prices
+    """
+    d1 = _d1(spot, strike, t, rate, sigma)
+    d2 = d1 - sigma * np.sqrt(t)
+    discounted = strike * np.exp(-rate * t)
+    call = spot * norm_cdf(d1) - discounted * norm_cdf(d2)
+    put = discounted * norm_cdf(-d2) - spot * norm_cdf(-d1)
+    return np.where(is_call, call, put)
+
+
+def bs_delta(spot, strike, t, rate, sigma, is_call) -> np.ndarray:
+    """Black-Scholes delta (calls 0..1, puts -1..0)."""
+    n_d1 = norm_cdf(_d1(spot, strike, t, rate, sigma))
+    return np.where(is_call, n_d1, n_d1 - 1.0)
+
+
+def implied_vol(
+    price,
+    spot,
+    strike,
+    t,
+    rate,
+    is_call,
+    tol: float = 1e-6,
+    max_iter: int = 100
+) -> np.ndarray:
+    """
+    Solve Black-Scholes implied volatility for arrays of contracts at once.
+
+    Newton's method on vega, falling back to bisection inside a bracket that
+    tightens every iteration whenever a Newton step would leave it (deep
+    OTM/ITM options with vanishing vega). Prices outside no-arbitrage bounds,
+    or needing an IV outside [IV_MIN, IV_MAX], have no solution.
+
+    Args:
+        price: Option prices (e.g. bid/ask mids)
+        spot, strike, t, rate, is_call: As for bs_price()
+        tol: Price tolerance for convergence
+        max_iter: Iteration limit
+
+    Returns:
+        Implied volatilities, NaN where there is no solution
+    """
+    price, spot, strike, t, rate, is_call = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (price, spot, strike, t, rate)),
+        np.asarray(is_call, dtype=bool)
+    )
+    discounted = strike * np.exp(-rate * t)
+    with np.errstate(invalid="ignore"):
+        lower = np.where(is_call, np.maximum(spot - discounted, 0.0), np.maximum(discounted - spot, 0.0))
+        upper = np.where(is_call, spot, discounted)
+        solvable = (t > 0) & (spot > 0) & (strike > 0) & (price > lower) & (price < upper)
+
+    lo = np.full(price.shape, IV_MIN)
+    hi = np.full(price.shape, IV_MAX)
+    # Roots outside [IV_MIN, IV_MAX] (prices hugging intrinsic value) are not searched for
+    with np.errstate(invalid="ignore"):
+        solvable &= (bs_price(spot, strike, t, rate, lo, is_call) - price < tol)
+        solvable &= (bs_price(spot, strike, t, rate, hi, is_call) - price > -tol)
+    # Brenner-Subrahmanyam starting point
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigma = np.clip(np.sqrt(2.0 * math.pi / t) * price / spot, 0.05, 2.0)
+    sigma = np.where(solvable, sigma, 0.2)
+    done = ~solvable
+
+    for _ in range(max_iter):
+        diff = bs_price(spot, strike, t, rate, sigma, is_call) - price
+        done |= np.abs(diff) < tol
+        if done.all():
+            break
+        # Price rises with volatility: shrink the bracket around the root
+        hi = np.where(diff > 0, sigma, hi)
+        lo = np.where(diff < 0, sigma, lo)
+        vega = spot * norm_pdf(_d1(spot, strike, t, rate, sigma)) * np.sqrt(t)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            newton = sigma - diff / vega
+        step_ok = np.isfinite(newton) & (newton > lo) & (newton < hi)
+        sigma = np.where(done, sigma, np.where(step_ok, newton, 0.5 * (lo + hi)))
+
+    return np.where(solvable & done, sigma, np.nan)
+
+
+def rate_for_dte(curve: Sequence[Tuple[float, float]], dte) -> np.ndarray:
+    """
+    Risk-free rate for each DTE from (dte, rate) points, linearly interpolated.
+
+    Flat beyond the first and last points; a single point is a flat curve.
+    """
+    points = sorted(curve)
+    return np.interp(np.asarray(dte, dtype=float), [p[0] for p in points], [p[1] for p in points])
+
+
+def fill_missing_greeks(
+    expiries: List[Expiry],
+    underlying_price: float,
+    rate_curve: Sequence[Tuple[float, float]],
+    sigma_min: float = 0.01
+) -> int:
+    """
+    Solve IV and delta for contracts the provider left without them (in place).
+
+    All such contracts in the chain are solved in one vectorized pass from
+    their bid/ask mid. Contracts without a two-sided quote, or whose mid has
+    no Black-Scholes solution, are left unchanged.
+
+    Args:
+        expiries: Chain expiries (contracts are updated in place)
+        underlying_price: Spot price
+        rate_curve: (dte, rate) points, see rate_for_dte()
+        sigma_min: Solutions below this IV are discarded as bad quotes
+
+    Returns:
+        Number of contracts that received an IV or delta
+    """
+    missing = []
+    for expiry in expiries:
+        if expiry.dte <= 0:
+            continue
+        for contract in expiry.contracts:
+            if contract.implied_volatility is not None and contract.delta is not None:
+                continue
+            if contract.bid is None or contract.ask is None or contract.ask < contract.bid or contract.ask <= 0:
+                continue
+            missing.append((contract, expiry.dte))
+
+    if not missing or underlying_price is None or underlying_price <= 0:
+        return 0
+
+    contracts = [c for c, _ in missing]
+    dte = np.array([d for _, d in missing], dtype=float)
+    t = dte / 365.0
+    strike = np.array([c.strike for c in contracts], dtype=float)
+    mid = np.array([(c.bid + c.ask) / 2.0 for c in contracts], dtype=float)
+    is_call = np.array([c.option_type == "call" for c in contracts])
+    rate = rate_for_dte(rate_curve, dte)
+
+    # Keep the provider's IV where it has one; solve the rest
+    given = np.array([np.nan if c.implied_volatility is None else c.implied_volatility for c in contracts])
+    solved = implied_vol(mid, underlying_price, strike, t, rate, is_call)
+    sigma = np.where(np.isnan(given), solved, given)
+    sigma = np.where(sigma >= sigma_min, sigma, np.nan)
+    delta = bs_delta(underlying_price, strike, t, rate, sigma, is_call)
+
+    filled = 0
+    for contract, iv, d in zip(contracts, sigma.tolist(), delta.tolist()):
+        if math.isnan(iv):
+            continue
+        if contract.implied_volatility is None:
+            contract.implied_volatility = iv
+        if contract.delta is None:
+            contract.delta = d
+        filled += 1
+    return filled
@@ -1,7 +1,8 @@
 """Data models for option chain snapshots."""
-from dataclasses import dataclass
+import bisect
+from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -59,11 +60,41 @@ class ChainSnapshot:
     underlying_price: float
     expiries: List[Expiry]
     provider: str
+    # Values derived from this snapshot (e.g. FF term structures), computed on
+    # first use and shared by every user's evaluation; dropped with the chain
+    derived: Dict[Any, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def dte_index(self) -> Tuple[List[int], List[int]]:
+        """Expiry DTEs in ascending order, with each one's position in expiries (stable)."""
+        index = self.derived.get("dte_index")
+        if index is None:
+            order = sorted(range(len(self.expiries)), key=lambda i: self.expiries[i].dte)
+            index = ([self.expiries[i].dte for i in order], order)
+            self.derived["dte_index"] = index
+        return index
     
     def get_expiry_by_dte(self, target_dte: int, tolerance: int = 5) -> Optional[Expiry]:
-        """Get expiry closest to target DTE within tolerance."""
-        candidates = [e for e in self.expiries if abs(e.dte - target_dte) <= tolerance]
-        if not candidates:
-            return None
+        """
+        Get expiry closest to target DTE within tolerance.
+        
+        Bisects the sorted DTE index and memoizes each (target, tolerance), so
+        pairing costs O(log E) once per chain. Ties go to the expiry listed first.
+        """
+        key = ("expiry_by_dte", target_dte, tolerance)
+        if key in self.derived:
+            return self.derived[key]
+        
+        dtes, order = self.dte_index()
+        above = bisect.bisect_left(dtes, target_dte)
+        best = None
+        # Nearest DTE below the target and nearest at or above it
+        for i in (above - 1, above):
+            if 0 <= i < len(dtes) and abs(dtes[i] - target_dte) <= tolerance:
+                # First expiry listed with this DTE
+                candidate = (abs(dtes[i] - target_dte), order[bisect.bisect_left(dtes, dtes[i])])
+                if best is None or candidate < best:
+                    best = candidate
         
-        return min(candidates, key=lambda e: abs(e.dte - target_dte))
+        expiry = self.expiries[best[1]] if best is not None else None
+        self.derived[key] = expiry
+        return expiry
@@ -1,5 +1,6 @@
 """Polygon.io option chain provider implementation."""
 import httpx
+import time
 from datetime import datetime, date, timezone, timedelta
 from typing import List, Optional
 from tenacity import (
@@ -12,7 +13,10 @@ from tenacity import (
 import logging
 from app.providers import OptionChainProvider, ProviderError
 from app.providers.models import ChainSnapshot, Expiry, Contract
+from app.providers.greeks import fill_missing_greeks
 from app.core.config import settings
+from app.core.metrics import PROCESS_ROLE, POLYGON_REQUEST_DURATION, CHAIN_CONTRACTS
+from app.core.tracing import trace_stage
 
 
 logger = logging.getLogger(__name__)
@@ -21,19 +25,47 @@ logger = logging.getLogger(__name__)
 class PolygonProvider(OptionChainProvider):
     """Polygon.io implementation of option chain provider."""
     
-    BASE_URL = "https://api.polygon.io"
-    
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
         self.api_key = api_key or settings.polygon_api_key
+        self.base_url = (base_url or settings.polygon_base_url).rstrip("/")
         self.client = httpx.AsyncClient(timeout=30.0)
     
+    async def _get(self, endpoint: str, url: str, params: dict) -> httpx.Response:
+        """GET a Polygon URL, recording latency per endpoint and outcome.
+        
+        Args:
+            endpoint: Low-cardinality endpoint label ("snapshot", "prev", ...)
+            url: Request URL
+            params: Query parameters
+        
+        Returns:
+            Successful response (raise_for_status already applied)
+        """
+        status = "error"
+        start = time.perf_counter()
+        try:
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            status = "ok"
+            return response
+        except httpx.HTTPStatusError as e:
+            status = str(e.response.status_code)
+            raise
+        except httpx.TimeoutException:
+            status = "timeout"
+            raise
+        finally:
+            POLYGON_REQUEST_DURATION.labels(
+                role=PROCESS_ROLE, endpoint=endpoint, status=status
+            ).observe(time.perf_counter() - start)
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
         retry=retry_if_exception_type((httpx.TimeoutException, httpx.ConnectError)),
         before_sleep=before_sleep_log(logger, logging.WARNING)
     )
-    async def _make_request(self, url: str, params: dict) -> dict:
+    async def _make_request(self, url: str, params: dict, endpoint: str = "other") -> dict:
         """Make HTTP request with retry logic for transient failures.
         
         Retries up to 3 times with exponential backoff for:
@@ -43,8 +75,7 @@ class PolygonProvider(OptionChainProvider):
         Does NOT retry for:
         - HTTP errors (4xx, 5xx) - those need different handling
         """
-        response = await self.client.get(url, params=params)
-        response.raise_for_status()
+        response = await self._get(endpoint, url, params)
         return response.json()
     
     async def get_chain_snapshot(self, ticker: str) -> ChainSnapshot:
@@ -55,23 +86,30 @@ class PolygonProvider(OptionChainProvider):
         Includes retry logic for transient network failures.
         """
         try:
-            # Get underlying price first
-            underlying_price = await self._get_underlying_price(ticker)
-            
-            # Get option chain
-            url = f"{self.BASE_URL}/v3/snapshot/options/{ticker}"
-            params = {"apiKey": self.api_key}
-            
-            data = await self._make_request(url, params)
+            with trace_stage("fetch", ticker=ticker):
+                # Get underlying price first
+                underlying_price = await self._get_underlying_price(ticker)
+                
+                # Get option chain
+                url = f"{self.base_url}/v3/snapshot/options/{ticker}"
+                params = {"apiKey": self.api_key}
+                
+                data = await self._make_request(url, params, endpoint="snapshot")
             
             if data.get("status") != "OK":
                 raise ProviderError(f"Polygon API returned status: {data.get('status')}")
             
-            # Parse contracts
-            contracts = self._parse_contracts(data.get("results", []))
-            
-            # Group by expiry
-            expiries = self._group_by_expiry(contracts)
+            with trace_stage("parse"):
+                # Parse contracts
+                contracts = self._parse_contracts(data.get("results", []))
+                CHAIN_CONTRACTS.labels(role=PROCESS_ROLE).observe(len(contracts))
+                
+                # Group by expiry
+                expiries = self._group_by_expiry(contracts)
+                
+                # Polygon omits greeks for illiquid/new contracts; solve them from quotes
+                if settings.solve_missing_greeks:
+                    fill_missing_greeks(expiries, underlying_price, settings.risk_free_rate_curve_points)
             
             return ChainSnapshot(
                 ticker=ticker,
@@ -108,11 +146,10 @@ class PolygonProvider(OptionChainProvider):
     )
     async def _get_underlying_price(self, ticker: str) -> float:
         """Get current underlying stock price with retry logic."""
-        url = f"{self.BASE_URL}/v2/aggs/ticker/{ticker}/prev"
+        url = f"{self.base_url}/v2/aggs/ticker/{ticker}/prev"
         params = {"apiKey": self.api_key}
         
-        response = await self.client.get(url, params=params)
-        response.raise_for_status()
+        response = await self._get("prev", url, params)
         data = response.json()
         
         if not data.get("results"):
@@ -120,7 +157,8 @@ class PolygonProvider(OptionChainProvider):
         
         return data["results"][0]["c"]  # Close price
     
-    def _parse_contracts(self, results: List[dict]) -> List[Contract]:
+    @staticmethod
+    def _parse_contracts(results: List[dict]) -> List[Contract]:
         """Parse Polygon contract data into Contract objects."""
         contracts = []
         
@@ -158,8 +196,9 @@ class PolygonProvider(OptionChainProvider):
         
         return contracts
     
-    def _group_by_expiry(self, contracts: List[Contract]) -> List[Expiry]:
-        """Group contracts by expiry date."""
+    @staticmethod
+    def _group_by_expiry(contracts: List[Contract], today: Optional[date] = None) -> List[Expiry]:
+        """Group contracts by expiry date, with DTE counted from today (or the given date)."""
         expiry_map = {}
         
         for contract in contracts:
@@ -168,7 +207,7 @@ class PolygonProvider(OptionChainProvider):
             expiry_map[contract.expiry].append(contract)
         
         expiries = []
-        today = date.today()
+        today = today or date.today()
         
         for expiry_date, expiry_contracts in sorted(expiry_map.items()):
             dte = (expiry_date - today).days
@@ -209,13 +248,13 @@ class PolygonProvider(OptionChainProvider):
             while target_date.weekday() >= 5:  # Saturday = 5, Sunday = 6
                 target_date -= timedelta(days=1)
             
-            url = f"{self.BASE_URL}/v2/aggs/grouped/locale/us/market/stocks/{target_date.strftime('%Y-%m-%d')}"
+            url = f"{self.base_url}/v2/aggs/grouped/locale/us/market/stocks/{target_date.strftime('%Y-%m-%d')}"
             params = {
                 "apiKey": self.api_key,
                 "adjusted": "true"
             }
             
-            data = await self._make_request(url, params)
+            data = await self._make_request(url, params, endpoint="grouped")
             
             if data.get("status") != "OK":
                 raise ProviderError(f"Polygon API returned status: {data.get('status')}")
@@ -0,0 +1,239 @@
+"""Offline provider replaying recorded option chain snapshots."""
+import bisect
+import gzip
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import PROCESS_ROLE, CHAIN_CONTRACTS
+from app.core.tracing import trace_stage
+from app.providers import OptionChainProvider, ProviderError
+from app.providers.greeks import fill_missing_greeks
+from app.providers.models import ChainSnapshot
+from app.providers.polygon import PolygonProvider
+
+
+@dataclass
+class ReplayFrame:
+    """One recorded snapshot: raw Polygon-format results plus metadata."""
+    ticker: str
+    as_of: datetime
+    underlying_price: float
+    results: List[dict]
+    provider: str = "polygon"
+
+    @classmethod
+    def from_chain(cls, chain: ChainSnapshot) -> "ReplayFrame":
+        """Record a parsed chain in the Polygon snapshot format."""
+        results = []
+        for expiry in chain.expiries:
+            for contract in expiry.contracts:
+                results.append({
+                    "details": {
+                        "ticker": contract.symbol,
+                        "strike_price": contract.strike,
+                        "expiration_date": contract.expiry.isoformat(),
+                        "contract_type": contract.option_type
+                    },
+                    "greeks": {
+                        "implied_volatility": contract.implied_volatility,
+                        "delta": contract.delta,
+                        "gamma": contract.gamma,
+                        "theta": contract.theta,
+                        "vega": contract.vega
+                    },
+                    "last_quote": {"bid": contract.bid, "ask": contract.ask},
+                    "last_trade": {"price": contract.last},
+                    "day": {"volume": contract.volume},
+                    "open_interest": contract.open_interest
+                })
+        return cls(
+            ticker=chain.ticker,
+            as_of=chain.as_of,
+            underlying_price=chain.underlying_price,
+            results=results,
+            provider=chain.provider
+        )
+
+    @classmethod
+    def from_json(cls, data: dict) -> "ReplayFrame":
+        """Load a frame from one line of a replay file."""
+        as_of = datetime.fromisoformat(data["as_of"])
+        if as_of.tzinfo is None:
+            as_of = as_of.replace(tzinfo=timezone.utc)
+        return cls(
+            ticker=data["ticker"],
+            as_of=as_of,
+            underlying_price=data["underlying_price"],
+            results=data["results"],
+            provider=data.get("provider", "polygon")
+        )
+
+    def to_chain(self) -> ChainSnapshot:
+        """Parse into a ChainSnapshot, with DTEs counted from the snapshot's date."""
+        contracts = PolygonProvider._parse_contracts(self.results)
+        expiries = PolygonProvider._group_by_expiry(contracts, today=self.as_of.date())
+        if settings.solve_missing_greeks:
+            fill_missing_greeks(expiries, self.underlying_price, settings.risk_free_rate_curve_points)
+        return ChainSnapshot(
+            ticker=self.ticker.upper(),
+            as_of=self.as_of,
+            underlying_price=self.underlying_price,
+            expiries=expiries,
+            provider=self.provider
+        )
+
+    def to_json(self) -> dict:
+        """Encode as one line of a replay file."""
+        return {
+            "ticker": self.ticker,
+            "as_of": self.as_of.isoformat(),
+            "underlying_price": self.underlying_price,
+            "provider": self.provider,
+            "results": self.results
+        }
+
+
+def read_frames(path: str, tickers: Optional[Iterable[str]] = None) -> List[ReplayFrame]:
+    """
+    Read frames from a replay file or a directory of them.
+
+    Replay files are JSON Lines (optionally gzipped, *.jsonl.gz), one frame
+    per line as written by write_frames().
+
+    Args:
+        path: File or directory
+        tickers: Only keep these tickers (default: all)
+
+    Returns:
+        Frames in file order
+    """
+    root = Path(path)
+    files = sorted(root.glob("*.jsonl")) + sorted(root.glob("*.jsonl.gz")) if root.is_dir() else [root]
+    wanted = {t.upper() for t in tickers} if tickers else None
+    frames = []
+
+    for file in files:
+        opener = gzip.open if file.suffix == ".gz" else open
+        with opener(file, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                frame = ReplayFrame.from_json(json.loads(line))
+                if wanted is None or frame.ticker in wanted:
+                    frames.append(frame)
+
+    return frames
+
+
+def write_frames(path: str, frames: Iterable[ReplayFrame]) -> int:
+    """
+    Append frames to a replay file (gzipped when the name ends in .gz).
+
+    Returns:
+        Number of frames written
+    """
+    opener = gzip.open if str(path).endswith(".gz") else open
+    count = 0
+    with opener(path, "at", encoding="utf-8") as f:
+        for frame in frames:
+            f.write(json.dumps(frame.to_json(), separators=(",", ":")) + "\n")
+            count += 1
+    return count
+
+
+class ReplayProvider(OptionChainProvider):
+    """
+    Serve recorded snapshots instead of calling Polygon.
+
+    With a speed, a replay clock starts at the earliest recorded snapshot on
+    the first request and runs speed times faster than wall-clock time; each
+    request returns the ticker's latest snapshot at or before the replay
+    clock (speed=60 replays an hour per minute). Without a speed (step mode),
+    each request returns the ticker's next snapshot, so a replay is fully
+    deterministic regardless of how fast the pipeline runs.
+
+    DTEs are counted from each snapshot's date, and the scan worker debounces
+    on each chain's as_of, so signals and alerts match what the live pipeline
+    produced at the time.
+    """
+
+    def __init__(self, frames: Iterable[ReplayFrame], speed: Optional[float] = 60.0):
+        self.speed = speed
+        self.frames: Dict[str, List[ReplayFrame]] = {}
+        for frame in frames:
+            self.frames.setdefault(frame.ticker.upper(), []).append(frame)
+        for ticker_frames in self.frames.values():
+            ticker_frames.sort(key=lambda f: f.as_of)
+
+        self._times: Dict[str, List[datetime]] = {
+            ticker: [f.as_of for f in ticker_frames] for ticker, ticker_frames in self.frames.items()
+        }
+        self.start: Optional[datetime] = min((t[0] for t in self._times.values()), default=None)
+        self.end: Optional[datetime] = max((t[-1] for t in self._times.values()), default=None)
+        self._started: Optional[float] = None
+        self._positions: Dict[str, int] = {ticker: 0 for ticker in self.frames}
+        # Parsed chains by (ticker, frame index); frames are served repeatedly in clock mode
+        self._chains: Dict[Tuple[str, int], ChainSnapshot] = {}
+
+    @property
+    def tickers(self) -> List[str]:
+        """Tickers with recorded snapshots."""
+        return sorted(self.frames)
+
+    def replay_time(self) -> Optional[datetime]:
+        """Current replay clock (None in step mode or before the first request)."""
+        if self.speed is None or self._started is None or self.start is None:
+            return None
+        elapsed = (time.monotonic() - self._started) * self.speed
+        return self.start + timedelta(seconds=elapsed)
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether every recorded snapshot has been served (or passed)."""
+        if self.speed is None:
+            return all(self._positions[t] >= len(f) for t, f in self.frames.items())
+        now = self.replay_time()
+        return now is not None and now > self.end
+
+    def _select(self, ticker: str) -> int:
+        """Index of the frame to serve for a ticker."""
+        times = self._times.get(ticker)
+        if not times:
+            raise ProviderError(f"No recorded snapshots for {ticker}")
+
+        if self.speed is None:
+            index = self._positions[ticker]
+            if index >= len(times):
+                raise ProviderError(f"Replay exhausted for {ticker}")
+            self._positions[ticker] = index + 1
+            return index
+
+        if self._started is None:
+            self._started = time.monotonic()
+        index = bisect.bisect_right(times, self.replay_time()) - 1
+        if index < 0:
+            raise ProviderError(f"No snapshot for {ticker} before {self.replay_time().isoformat()}")
+        return index
+
+    async def get_chain_snapshot(self, ticker: str) -> ChainSnapshot:
+        """Return the recorded snapshot due for this ticker."""
+        ticker = ticker.upper()
+        with trace_stage("fetch", ticker=ticker, provider="replay"):
+            index = self._select(ticker)
+
+        key = (ticker, index)
+        if key not in self._chains:
+            with trace_stage("parse"):
+                chain = self.frames[ticker][index].to_chain()
+                CHAIN_CONTRACTS.labels(role=PROCESS_ROLE).observe(sum(len(e.contracts) for e in chain.expiries))
+            self._chains[key] = chain
+        return self._chains[key]
+
+    async def close(self):
+        """Nothing to release (parity with PolygonProvider)."""
+        self._chains.clear()
@@ -4,6 +4,7 @@ import asyncio
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from app.core.config import settings
+from app.core.metrics import start_metrics_server
 from app.core.database import AsyncSessionLocal
 from app.core.redis import get_redis
 from app.services import TickerService
@@ -147,6 +148,7 @@ class ScanScheduler:
 
 async def main():
     """Main entry point for scheduler."""
+    start_metrics_server()
     scheduler = ScanScheduler()
     await scheduler.run()
 
@@ -4,8 +4,14 @@ from app.services.subscription_service import SubscriptionService
 from app.services.ticker_service import TickerService
 from app.services.signal_service import SignalService
 from app.services.stability_tracker import stability_tracker
+from app.services.signal_dedupe import signal_dedupe_cache
+from app.services.signal_stream import signal_stream
+from app.services.signal_feed import signal_feed_cache
+from app.services.response_cache import response_cache
 from app.services.auth_service import AuthService
 from app.services.reminder_service import ReminderService
+from app.services.snapshot_service import SnapshotService
+from app.services.scan_fingerprint import scan_fingerprint_cache
 
 __all__ = [
     "UserService",
@@ -13,6 +19,12 @@ __all__ = [
     "TickerService",
     "SignalService",
     "stability_tracker",
+    "signal_dedupe_cache",
+    "signal_stream",
+    "signal_feed_cache",
+    "response_cache",
     "AuthService",
-    "ReminderService"
+    "ReminderService",
+    "SnapshotService",
+    "scan_fingerprint_cache"
 ]
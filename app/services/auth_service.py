@@ -7,7 +7,8 @@ import logging
 
 import secrets
 from app.models.user import User, UserSettings
-from app.core.auth import hash_password, verify_password
+from app.core.auth import hash_password_async, verify_and_update_password_async
+from app.core.user_cache import auth_user_cache
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +56,7 @@ class AuthService:
             logger.debug(f"Creating new user: {email}")
             user = User(
                 email=email,
-                password_hash=hash_password(password),
+                password_hash=await hash_password_async(password),
                 status="active",
                 link_code=AuthService.generate_link_code()
             )
@@ -87,6 +88,9 @@ class AuthService:
         """
         Authenticate a user with email and password.
         
+        Hashes made with an outdated bcrypt cost are transparently upgraded
+        to the configured cost on successful login.
+        
         Args:
             email: User's email address
             password: Plain text password
@@ -104,9 +108,16 @@ class AuthService:
         if not user.password_hash:
             return None
         
-        if not verify_password(password, user.password_hash):
+        valid, new_hash = await verify_and_update_password_async(password, user.password_hash)
+        if not valid:
             return None
         
+        if new_hash:
+            user.password_hash = new_hash
+            await db.commit()
+            await auth_user_cache.invalidate(str(user.id))
+            logger.info(f"Rehashed password for user {user.id} with updated bcrypt cost")
+        
         return user
     
     @staticmethod
@@ -180,6 +191,7 @@ class AuthService:
         db.add(user)
         await db.commit()
         await db.refresh(user)
+        await auth_user_cache.invalidate(str(user.id))
         return user.link_code
 
 
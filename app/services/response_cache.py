@@ -0,0 +1,107 @@
+"""Version counters and cached bodies for ETag-validated API responses."""
+from typing import Dict, Iterable, Optional
+from app.core.redis import get_redis
+import asyncio
+import hashlib
+import json
+
+
+# Data scopes a cached response can depend on
+SIGNALS = "signals"  # Global: any new signal
+SUBSCRIPTIONS = "subscriptions"  # Per user: watchlist changes
+SETTINGS = "settings"  # Per user: settings changes
+
+_GLOBAL_SCOPES = {SIGNALS}
+
+
+class ResponseCache:
+    """
+    Cache serialized GET responses keyed by (user, route, params, versions).
+
+    Writers bump a version counter whenever the data behind a scope changes.
+    A response's ETag hashes the user, route, query parameters and the
+    current versions of the scopes it depends on, so it changes exactly when
+    the response could. Matching If-None-Match requests get 304 without
+    running the route, and other repeats are served from the stored body.
+    """
+
+    BODY_TTL_SECONDS = 300
+
+    def __init__(self):
+        self.redis = None
+        self._lock = asyncio.Lock()
+
+    async def _get_redis(self):
+        """Get Redis connection."""
+        if self.redis is None:
+            async with self._lock:
+                if self.redis is None:
+                    self.redis = await get_redis()
+        return self.redis
+
+    def _version_key(self, scope: str, user_id: Optional[str]) -> str:
+        """Redis key of a scope's version counter."""
+        if scope in _GLOBAL_SCOPES or user_id is None:
+            return f"cache_version:{scope}"
+        return f"cache_version:{scope}:{user_id}"
+
+    def _body_key(self, etag: str) -> str:
+        """Redis key of the cached response for an ETag."""
+        return f"response_cache:{etag}"
+
+    async def bump(self, scope: str, user_id: Optional[str] = None) -> None:
+        """
+        Invalidate every cached response depending on a scope.
+
+        Args:
+            scope: SIGNALS, SUBSCRIPTIONS or SETTINGS
+            user_id: Owner of per-user scopes (ignored for global scopes)
+        """
+        redis = await self._get_redis()
+        await redis.incr(self._version_key(scope, user_id))
+
+    async def make_etag(
+        self,
+        user_id: str,
+        route: str,
+        params: str,
+        scopes: Iterable[str],
+        auth_version: Optional[str] = None
+    ) -> str:
+        """
+        Compute the current ETag for a response.
+
+        Args:
+            user_id: Requesting user ("public" for unauthenticated routes)
+            route: Request path
+            params: Normalized query string
+            scopes: Data scopes the response depends on
+            auth_version: The user's auth_user_cache version, so invalidating
+                the user (status change, logout) also retires their ETags
+
+        Returns:
+            Quoted strong ETag
+        """
+        scopes = list(scopes)
+        redis = await self._get_redis()
+        versions = await redis.mget([self._version_key(scope, user_id) for scope in scopes])
+
+        key_str = "|".join([user_id, route, params] + [
+            f"{scope}={version or 0}" for scope, version in zip(scopes, versions)
+        ] + ([f"auth={auth_version}"] if auth_version is not None else []))
+        return '"' + hashlib.sha256(key_str.encode()).hexdigest()[:32] + '"'
+
+    async def get_body(self, etag: str) -> Optional[Dict]:
+        """Return the cached response ({"headers", "body"}) for an ETag."""
+        redis = await self._get_redis()
+        raw = await redis.get(self._body_key(etag))
+        return json.loads(raw) if raw else None
+
+    async def set_body(self, etag: str, cached: Dict) -> None:
+        """Store a response ({"headers", "body"}) under its ETag."""
+        redis = await self._get_redis()
+        await redis.setex(self._body_key(etag), self.BODY_TTL_SECONDS, json.dumps(cached))
+
+
+# Global instance
+response_cache = ResponseCache()
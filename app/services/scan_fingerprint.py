@@ -0,0 +1,90 @@
+"""Redis record of each ticker's last full scan, keyed by chain fingerprint."""
+from typing import Iterable, List, Optional, Tuple
+from datetime import date
+from app.core.redis import get_redis
+import asyncio
+import json
+
+
+class ScanFingerprintCache:
+    """
+    Remember what each ticker's last full scan saw and did.
+
+    One small JSON record per ticker and scan mode holds the chain
+    fingerprint (see signal_engine.chain_fingerprint()), the expiry pairs
+    whose stability was checked, and whether every check was settled (see
+    StabilityTracker.is_settled()). A rescan of an identical chain after a
+    settled scan cannot create signals, so the scan worker only refreshes
+    stability for those pairs and the ticker's last_scan_at. Records expire, forcing a full scan at least
+    that often so new subscribers and settings changes are picked up.
+    """
+
+    def __init__(self):
+        self.redis = None
+        self._lock = asyncio.Lock()
+
+    async def _get_redis(self):
+        """Get Redis connection."""
+        if self.redis is None:
+            async with self._lock:
+                if self.redis is None:
+                    self.redis = await get_redis()
+        return self.redis
+
+    def _make_key(self, ticker: str, mode: str) -> str:
+        """Create Redis key for a ticker's last full scan in one mode."""
+        return f"scan_fingerprint:{mode}:{ticker}"
+
+    async def unchanged_pairs(self, ticker: str, mode: str, fingerprint: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        Pairs to refresh if the last full scan saw this chain and settled.
+
+        Args:
+            ticker: Ticker symbol
+            mode: "scan" or "discovery"
+            fingerprint: Fingerprint of the chain just fetched
+
+        Returns:
+            (front_expiry, back_expiry) ISO date pairs, or None if a full scan is needed
+        """
+        redis = await self._get_redis()
+        raw = await redis.get(self._make_key(ticker, mode))
+        if not raw:
+            return None
+
+        record = json.loads(raw)
+        if record["fingerprint"] != fingerprint or not record["settled"]:
+            return None
+        return [tuple(pair) for pair in record["pairs"]]
+
+    async def store(
+        self,
+        ticker: str,
+        mode: str,
+        fingerprint: str,
+        pairs: Iterable[Tuple[date, date]],
+        settled: bool,
+        ttl_seconds: int
+    ):
+        """
+        Record the outcome of a full scan.
+
+        Args:
+            ticker: Ticker symbol
+            mode: "scan" or "discovery"
+            fingerprint: Fingerprint of the scanned chain
+            pairs: (front_expiry, back_expiry) pairs checked for stability
+            settled: Whether every stability check was settled
+            ttl_seconds: How long identical chains may skip the full scan
+        """
+        record = {
+            "fingerprint": fingerprint,
+            "pairs": sorted({(str(front), str(back)) for front, back in pairs}),
+            "settled": settled
+        }
+        redis = await self._get_redis()
+        await redis.setex(self._make_key(ticker, mode), ttl_seconds, json.dumps(record))
+
+
+# Global instance
+scan_fingerprint_cache = ScanFingerprintCache()
@@ -0,0 +1,83 @@
+"""Redis front-cache of signal dedupe keys seen today."""
+from typing import Any, Dict, List
+from app.core.redis import get_redis
+from app.services.signal_service import SignalService
+import asyncio
+
+
+class SignalDedupeCache:
+    """
+    Track which signal dedupe keys have already been claimed each day.
+    
+    Keys live in one Redis set per calendar day. SADD is atomic, so only one
+    scan worker can claim a given key; a key that is already a member is a
+    certain duplicate and never needs a database round trip. The database
+    check in SignalService stays authoritative if Redis loses its data.
+    """
+    
+    # Keep yesterday's set around across the UTC day boundary
+    KEY_TTL_SECONDS = 2 * 86400
+    
+    def __init__(self):
+        self.redis = None
+        self._lock = asyncio.Lock()
+    
+    async def _get_redis(self):
+        """Get Redis connection."""
+        if self.redis is None:
+            async with self._lock:
+                if self.redis is None:
+                    self.redis = await get_redis()
+        return self.redis
+    
+    def _make_key(self, signal_data: Dict[str, Any]) -> str:
+        """Create Redis set key for the day of a signal."""
+        return f"signal_dedupe:{signal_data['as_of_ts'].strftime('%Y-%m-%d')}"
+    
+    async def claim(self, signals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Claim dedupe keys for signals, dropping certain duplicates.
+        
+        Args:
+            signals: Signal dictionaries from compute_signals()
+            
+        Returns:
+            Signals whose keys were not yet claimed today, in input order.
+            Repeats within the batch are dropped as well.
+        """
+        if not signals:
+            return []
+        
+        redis = await self._get_redis()
+        pipe = redis.pipeline(transaction=False)
+        day_keys = set()
+        
+        for signal_data in signals:
+            day_key = self._make_key(signal_data)
+            day_keys.add(day_key)
+            pipe.sadd(day_key, SignalService.generate_dedupe_key(signal_data))
+        for day_key in day_keys:
+            pipe.expire(day_key, self.KEY_TTL_SECONDS)
+        
+        results = await pipe.execute()
+        
+        return [
+            signal_data
+            for signal_data, added in zip(signals, results)
+            if added
+        ]
+    
+    async def release(self, signals: List[Dict[str, Any]]):
+        """Release claimed keys, e.g. when persisting the signals failed."""
+        if not signals:
+            return
+        
+        redis = await self._get_redis()
+        pipe = redis.pipeline(transaction=False)
+        for signal_data in signals:
+            pipe.srem(self._make_key(signal_data), SignalService.generate_dedupe_key(signal_data))
+        await pipe.execute()
+
+
+# Global instance
+signal_dedupe_cache = SignalDedupeCache()
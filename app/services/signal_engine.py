@@ -1,5 +1,8 @@
 """Core signal engine for Forward Factor calculation."""
+import hashlib
+import math
 import numpy as np
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import date
 from app.providers.models import ChainSnapshot, Expiry, Contract
@@ -45,8 +48,8 @@ def forward_factor(front_iv: float, front_dte: int, back_iv: float, back_dte: in
     if v_fwd < 0:
         return None
     
-    # Forward volatility
-    sigma_fwd = np.sqrt(v_fwd)
+    # Forward volatility (math.sqrt: np.sqrt is several times slower on Python floats)
+    sigma_fwd = math.sqrt(v_fwd)
     
     # Avoid division by zero
     if sigma_fwd <= 0:
@@ -58,6 +61,53 @@ def forward_factor(front_iv: float, front_dte: int, back_iv: float, back_dte: in
     return ff
 
 
+def forward_factor_arrays(
+    front_iv: np.ndarray,
+    front_dte: np.ndarray,
+    back_iv: np.ndarray,
+    back_dte: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    forward_factor() over NumPy arrays of any (broadcastable) shape.
+    
+    Same formula and validity rules as forward_factor(); NaN IVs are invalid.
+    
+    Returns:
+        (ff, sigma_fwd, valid) arrays; ff and sigma_fwd are NaN where invalid
+    """
+    t1 = front_dte / 365.0
+    t2 = back_dte / 365.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        v_fwd = (back_iv ** 2 * t2 - front_iv ** 2 * t1) / (t2 - t1)
+        valid = np.isfinite(v_fwd) & (t1 > 0) & (t2 > t1) & (v_fwd >= 0)
+        sigma_fwd = np.sqrt(np.where(valid, v_fwd, np.nan))
+        valid &= sigma_fwd > 0
+        sigma_fwd = np.where(valid, sigma_fwd, np.nan)
+        ff = (front_iv - sigma_fwd) / sigma_fwd
+    return ff, sigma_fwd, valid
+
+
+def _choose_contract(
+    expiry: Expiry,
+    underlying_price: float,
+    method: str,
+    option_type: str
+) -> Optional[Contract]:
+    """Contract a vol point method reads its IV from (see select_vol_point())."""
+    if method == "ATM":
+        return expiry.get_atm_contract(underlying_price, option_type)
+    elif method.endswith("d_put"):
+        # Extract delta value (e.g., "35d_put" -> 0.35)
+        delta_str = method.split("d_")[0]
+        target_delta = float(delta_str) / 100.0
+        return expiry.get_delta_contract(target_delta, "put")
+    elif method.endswith("d_call"):
+        delta_str = method.split("d_")[0]
+        target_delta = float(delta_str) / 100.0
+        return expiry.get_delta_contract(target_delta, "call")
+    return None
+
+
 def select_vol_point(
     expiry: Expiry,
     underlying_price: float,
@@ -76,19 +126,7 @@ def select_vol_point(
     Returns:
         Implied volatility (decimal), or None if not found
     """
-    if method == "ATM":
-        contract = expiry.get_atm_contract(underlying_price, option_type)
-    elif method.endswith("d_put"):
-        # Extract delta value (e.g., "35d_put" -> 0.35)
-        delta_str = method.split("d_")[0]
-        target_delta = float(delta_str) / 100.0
-        contract = expiry.get_delta_contract(target_delta, "put")
-    elif method.endswith("d_call"):
-        delta_str = method.split("d_")[0]
-        target_delta = float(delta_str) / 100.0
-        contract = expiry.get_delta_contract(target_delta, "call")
-    else:
-        return None
+    contract = _choose_contract(expiry, underlying_price, method, option_type)
     
     if contract is None or contract.implied_volatility is None:
         return None
@@ -96,6 +134,146 @@ def select_vol_point(
     return contract.implied_volatility
 
 
+@dataclass
+class ContractSelection:
+    """A contract chosen from one expiry of a chain, with its liquidity verdicts."""
+    contract: Optional[Contract]
+    iv: Optional[float]  # None if no contract or no IV
+    # apply_liquidity_filters() results by (min_oi, min_volume, max_bid_ask_pct)
+    verdicts: Dict[Tuple[int, int, float], Tuple[bool, List[str]]] = field(default_factory=dict)
+    
+    def liquidity(self, min_oi: int, min_volume: int, max_bid_ask_pct: float) -> Tuple[bool, List[str]]:
+        """apply_liquidity_filters() for the contract, once per set of thresholds."""
+        key = (min_oi, min_volume, max_bid_ask_pct)
+        verdict = self.verdicts.get(key)
+        if verdict is None:
+            verdict = apply_liquidity_filters(self.contract, min_oi, min_volume, max_bid_ask_pct)
+            self.verdicts[key] = verdict
+        return verdict
+
+
+def select_contract(
+    chain: ChainSnapshot,
+    expiry: Expiry,
+    method: str = "ATM",
+    option_type: str = "call"
+) -> ContractSelection:
+    """
+    Contract selection for one of the chain's expiries, cached on the chain.
+    
+    The vol point's IV and the ATM liquidity check read the same entry, so each
+    (expiry, method, option_type) is scanned once per snapshot however many
+    users and pairs visit it.
+    
+    Args:
+        chain: ChainSnapshot the expiry belongs to
+        expiry: One of chain.expiries
+        method: "ATM", "35d_put", "35d_call", etc.
+        option_type: "call" or "put" for ATM selection
+        
+    Returns:
+        ContractSelection (contract None if nothing matched)
+    """
+    key = ("selection", id(expiry), method, option_type)
+    selection = chain.derived.get(key)
+    if selection is None:
+        contract = _choose_contract(expiry, chain.underlying_price, method, option_type)
+        selection = ContractSelection(
+            contract=contract,
+            iv=contract.implied_volatility if contract is not None else None
+        )
+        chain.derived[key] = selection
+    return selection
+
+
+@dataclass
+class TermStructure:
+    """
+    Forward Factor for every (front, back) expiry pair of a chain at one vol point.
+    
+    Matrices are indexed [front, back] by position in chain.expiries; entries
+    are NaN where the pair is invalid (see forward_factor()).
+    """
+    vol_point: str
+    dte: np.ndarray  # (E,)
+    iv: np.ndarray  # (E,) NaN where the vol point is unavailable
+    ff: np.ndarray  # (E, E)
+    sigma_fwd: np.ndarray  # (E, E)
+    positions: Dict[int, int]  # id(expiry) -> position in chain.expiries
+    
+    def position(self, expiry: Expiry) -> int:
+        """Position of one of the chain's expiries in the matrices."""
+        return self.positions[id(expiry)]
+
+
+def term_structure(chain: ChainSnapshot, vol_point: str = "ATM") -> TermStructure:
+    """
+    Forward Factor term structure of a chain, computed once per vol point.
+    
+    The result is kept in chain.derived, so every user, pair and caller
+    evaluating the same snapshot indexes into it instead of recomputing.
+    
+    Args:
+        chain: ChainSnapshot from provider
+        vol_point: "ATM", "35d_put", "35d_call", etc.
+        
+    Returns:
+        TermStructure for the chain's expiries
+    """
+    key = ("term_structure", vol_point)
+    structure = chain.derived.get(key)
+    if structure is None:
+        ivs = [select_contract(chain, e, vol_point).iv for e in chain.expiries]
+        iv = np.array([np.nan if v is None else v for v in ivs], dtype=float)
+        dte = np.array([e.dte for e in chain.expiries], dtype=float)
+        ff, sigma_fwd, _ = forward_factor_arrays(iv[:, None], dte[:, None], iv[None, :], dte[None, :])
+        structure = TermStructure(
+            vol_point=vol_point,
+            dte=dte,
+            iv=iv,
+            ff=ff,
+            sigma_fwd=sigma_fwd,
+            positions={id(e): i for i, e in enumerate(chain.expiries)}
+        )
+        chain.derived[key] = structure
+    return structure
+
+
+def chain_fingerprint(chain: ChainSnapshot) -> str:
+    """
+    Digest of everything compute_signals() reads from a chain.
+    
+    Covers each expiry's date and DTE, its ATM call (strike, quotes, IV,
+    open interest, volume) and the strike, IV and delta of every contract
+    delta vol points choose between. Chains with equal fingerprints give the
+    same signals (FF, expiries, reason codes) for any user settings; only
+    as_of_ts and underlying_price may differ.
+    
+    Args:
+        chain: ChainSnapshot from provider
+        
+    Returns:
+        Hex digest
+    """
+    values: List[Optional[float]] = []
+    for expiry in chain.expiries:
+        atm = select_contract(chain, expiry).contract
+        values += [expiry.expiry_date.toordinal(), expiry.dte]
+        if atm is None:
+            values += [None] * 6
+        else:
+            values += [atm.strike, atm.bid, atm.ask, atm.implied_volatility, atm.open_interest, atm.volume]
+        for contract in expiry.contracts:
+            values += [
+                contract.strike if contract.option_type == "call" else -contract.strike,
+                contract.implied_volatility,
+                contract.delta
+            ]
+    
+    packed = np.array([np.nan if v is None else v for v in values], dtype=float)
+    return hashlib.blake2b(packed.tobytes(), digest_size=16).hexdigest()
+
+
 def pair_expiries(
     chain: ChainSnapshot,
     dte_pairs: List[Dict[str, int]]
@@ -211,29 +389,32 @@ def compute_signals(
     
     # Pair expiries
     expiry_pairs = pair_expiries(chain, dte_pairs)
+    if not expiry_pairs:
+        return signals
+    
+    # FF for every expiry pair at this vol point (shared across users)
+    structure = term_structure(chain, vol_point)
     
     for front_expiry, back_expiry, dte_config in expiry_pairs:
+        front, back = structure.position(front_expiry), structure.position(back_expiry)
+        
         # Select vol points
-        front_iv = select_vol_point(front_expiry, chain.underlying_price, vol_point)
-        back_iv = select_vol_point(back_expiry, chain.underlying_price, vol_point)
+        front_iv = float(structure.iv[front])
+        back_iv = float(structure.iv[back])
         
-        if front_iv is None or back_iv is None:
+        if math.isnan(front_iv) or math.isnan(back_iv):
             continue
         
-        # Get contracts for liquidity checks
-        front_contract = front_expiry.get_atm_contract(chain.underlying_price)
-        back_contract = back_expiry.get_atm_contract(chain.underlying_price)
+        # Get contracts for liquidity checks (ATM calls, cached per chain)
+        front_atm = select_contract(chain, front_expiry)
+        back_atm = select_contract(chain, back_expiry)
         
-        if front_contract is None or back_contract is None:
+        if front_atm.contract is None or back_atm.contract is None:
             continue
         
         # Apply liquidity filters
-        front_passes, front_reasons = apply_liquidity_filters(
-            front_contract, min_oi, min_volume, max_bid_ask_pct
-        )
-        back_passes, back_reasons = apply_liquidity_filters(
-            back_contract, min_oi, min_volume, max_bid_ask_pct
-        )
+        front_passes, front_reasons = front_atm.liquidity(min_oi, min_volume, max_bid_ask_pct)
+        back_passes, back_reasons = back_atm.liquidity(min_oi, min_volume, max_bid_ask_pct)
         
         reason_codes = []
         if not front_passes:
@@ -241,20 +422,14 @@ def compute_signals(
         if not back_passes:
             reason_codes.extend([f"back_{r}" for r in back_reasons])
         
-        # Calculate Forward Factor
-        ff = forward_factor(front_iv, front_expiry.dte, back_iv, back_expiry.dte)
+        # Forward Factor and sigma_fwd from the term structure
+        ff = float(structure.ff[front, back])
         
-        if ff is None:
+        if math.isnan(ff):
             reason_codes.append("invalid_ff_calculation")
             continue
         
-        # Calculate sigma_fwd for floor check
-        t1 = front_expiry.dte / 365.0
-        t2 = back_expiry.dte / 365.0
-        v1 = (front_iv ** 2) * t1
-        v2 = (back_iv ** 2) * t2
-        v_fwd = (v2 - v1) / (t2 - t1)
-        sigma_fwd = np.sqrt(v_fwd) if v_fwd >= 0 else 0.0
+        sigma_fwd = float(structure.sigma_fwd[front, back])
         
         # Check sigma_fwd floor
         if sigma_fwd < sigma_fwd_floor:
@@ -0,0 +1,145 @@
+"""Per-user Redis feed of the latest signals for the watchlist view."""
+from typing import Any, Dict, Iterable, List, Optional
+from datetime import datetime
+from app.core.redis import get_redis
+import asyncio
+import json
+
+
+class SignalFeedCache:
+    """
+    Materialize each user's latest watchlist signals in Redis.
+
+    Each user has a sorted set of signal refs scored by as_of_ts, trimmed to
+    the newest FEED_SIZE entries, plus one shared JSON payload per signal.
+    Scan workers push new signals to every subscriber's feed at creation
+    time, so the default "latest signals" view is served from Redis without
+    querying Postgres.
+
+    A feed is only trusted once it has been filled from the database (marked
+    by a ready key). Pushes to a feed that was never filled are harmless,
+    and watchlist changes drop the feed so it is rebuilt on the next read.
+    Fills merge into the feed rather than replacing it, so a push landing
+    between the route's database read and its fill is kept. The ready key
+    expires after READY_TTL_SECONDS, bounding how long a push lost to a
+    Redis error can stay missing from the feed.
+    """
+
+    FEED_SIZE = 100
+    FEED_TTL_SECONDS = 7 * 86400
+    READY_TTL_SECONDS = 600
+
+    def __init__(self):
+        self.redis = None
+        self._lock = asyncio.Lock()
+
+    async def _get_redis(self):
+        """Get Redis connection."""
+        if self.redis is None:
+            async with self._lock:
+                if self.redis is None:
+                    self.redis = await get_redis()
+        return self.redis
+
+    def _feed_key(self, user_id: str) -> str:
+        """Sorted set of a user's latest signal refs."""
+        return f"signal_feed:{user_id}"
+
+    def _ready_key(self, user_id: str) -> str:
+        """Marker set once a user's feed has been filled from the database."""
+        return f"signal_feed_ready:{user_id}"
+
+    def _payload_key(self, ref: str) -> str:
+        """JSON payload of one signal, shared by every feed that lists it."""
+        return f"signal_payload:{ref}"
+
+    @staticmethod
+    def _score(payload: Dict[str, Any]) -> float:
+        """Sort score (epoch seconds) from a payload's ISO as_of_ts."""
+        return datetime.fromisoformat(payload["as_of_ts"]).timestamp()
+
+    def _add_to_feed(self, pipe, user_id: str, payloads: List[Dict[str, Any]]) -> None:
+        """Queue commands adding payload refs to one feed and trimming it."""
+        feed_key = self._feed_key(user_id)
+        pipe.zadd(feed_key, {payload["ref"]: self._score(payload) for payload in payloads})
+        pipe.zremrangebyrank(feed_key, 0, -self.FEED_SIZE - 1)
+        pipe.expire(feed_key, self.FEED_TTL_SECONDS)
+
+    async def push(self, user_ids: Iterable[str], payloads: List[Dict[str, Any]]) -> None:
+        """
+        Add newly created signals to the feeds of their ticker's subscribers.
+
+        Args:
+            user_ids: Users subscribed to the signals' ticker
+            payloads: Signal payloads (see SignalStream.build_payload)
+        """
+        if not payloads:
+            return
+
+        redis = await self._get_redis()
+        pipe = redis.pipeline(transaction=False)
+
+        for payload in payloads:
+            pipe.setex(self._payload_key(payload["ref"]), self.FEED_TTL_SECONDS, json.dumps(payload))
+        for user_id in user_ids:
+            self._add_to_feed(pipe, user_id, payloads)
+
+        await pipe.execute()
+
+    async def fill(self, user_id: str, payloads: List[Dict[str, Any]]) -> None:
+        """
+        Merge database rows into a user's feed and mark it ready.
+
+        Args:
+            user_id: User ID
+            payloads: Latest signal payloads for the user's watchlist
+        """
+        redis = await self._get_redis()
+        pipe = redis.pipeline(transaction=True)
+
+        for payload in payloads:
+            pipe.setex(self._payload_key(payload["ref"]), self.FEED_TTL_SECONDS, json.dumps(payload))
+        if payloads:
+            self._add_to_feed(pipe, user_id, payloads)
+        pipe.setex(self._ready_key(user_id), self.READY_TTL_SECONDS, "1")
+
+        await pipe.execute()
+
+    async def get_latest(self, user_id: str, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Read a user's newest signals from Redis.
+
+        Args:
+            user_id: User ID
+            limit: Maximum number of signals (at most FEED_SIZE)
+
+        Returns:
+            Payloads newest first, or None if the feed is not ready or a
+            payload has expired (caller should query the database and fill)
+        """
+        redis = await self._get_redis()
+
+        pipe = redis.pipeline(transaction=False)
+        pipe.exists(self._ready_key(user_id))
+        pipe.zrevrange(self._feed_key(user_id), 0, limit - 1)
+        ready, refs = await pipe.execute()
+
+        if not ready:
+            return None
+        if not refs:
+            return []
+
+        raw_payloads = await redis.mget([self._payload_key(ref) for ref in refs])
+        if any(raw is None for raw in raw_payloads):
+            return None
+
+        return [json.loads(raw) for raw in raw_payloads]
+
+    async def invalidate(self, user_id: str) -> None:
+        """Drop a user's feed after their watchlist changes."""
+        redis = await self._get_redis()
+        await redis.delete(self._feed_key(user_id), self._ready_key(user_id))
+
+
+# Global instance
+signal_feed_cache = SignalFeedCache()
@@ -1,10 +1,12 @@
 """Signal service for persistence and retrieval."""
-from typing import List, Optional, Dict, Any
-from sqlalchemy import select, desc
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import select, desc, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import Signal, SignalUserDecision
-from datetime import datetime
+from app.utils.signal_ref import decode_signal_ref
+from datetime import datetime, time, timedelta
 import hashlib
+import uuid
 
 
 class SignalService:
@@ -27,26 +29,21 @@ class SignalService:
         return hashlib.sha256(key_str.encode()).hexdigest()
     
     @staticmethod
-    async def create_signal(
-        db: AsyncSession,
-        signal_data: Dict[str, Any]
-    ) -> Optional[Signal]:
+    def dedupe_day_bounds(as_of_ts: datetime) -> Tuple[datetime, datetime]:
         """
-        Create a new signal record using INSERT ON CONFLICT for atomic upsert.
+        Get the [start, end) as_of_ts range of the day a dedupe key covers.
         
-        Uses database-specific insert dialects for PostgreSQL or SQLite.
-        
-        Args:
-            db: Database session
-            signal_data: Signal dictionary from compute_signals()
-            
-        Returns:
-            Signal object, or None if duplicate
+        The dedupe key embeds the calendar date of as_of_ts, so any duplicate
+        must fall inside that day. Filtering on these bounds lets TimescaleDB
+        exclude every chunk except the one holding that day (1-day chunks).
         """
-        dedupe_key = SignalService.generate_dedupe_key(signal_data)
-        
-        # Build signal values dict
-        signal_values = {
+        start = datetime.combine(as_of_ts.date(), time.min, tzinfo=as_of_ts.tzinfo)
+        return start, start + timedelta(days=1)
+    
+    @staticmethod
+    def _build_signal_values(signal_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a compute_signals() dictionary onto Signal column values."""
+        return {
             "ticker": signal_data["ticker"],
             "as_of_ts": signal_data["as_of_ts"],
             "front_expiry": signal_data["front_expiry"],
@@ -60,14 +57,19 @@ class SignalService:
             "vol_point": signal_data["vol_point"],
             "quality_score": signal_data.get("quality_score"),
             "reason_codes": signal_data.get("reason_codes", []),
-            "dedupe_key": dedupe_key,
+            "dedupe_key": SignalService.generate_dedupe_key(signal_data),
             "underlying_price": signal_data.get("underlying_price"),
             "provider": signal_data.get("provider"),
             "is_discovery": signal_data.get("is_discovery", False)
         }
+    
+    @staticmethod
+    def _get_insert(db: AsyncSession):
+        """
+        Return the dialect-specific insert() supporting ON CONFLICT.
         
-        # Use database-specific insert with conflict handling
-        # Detect dialect and use appropriate insert function
+        Detects the bound dialect and uses the PostgreSQL or SQLite insert.
+        """
         dialect_name = db.bind.dialect.name
         
         if dialect_name == 'postgresql':
@@ -78,8 +80,35 @@ class SignalService:
             # Fallback to standard insert (might not support on_conflict_do_nothing)
             from sqlalchemy import insert
         
+        return insert
+    
+    @staticmethod
+    async def create_signal(
+        db: AsyncSession,
+        signal_data: Dict[str, Any]
+    ) -> Optional[Signal]:
+        """
+        Create a new signal record using INSERT ON CONFLICT for atomic upsert.
+        
+        Uses database-specific insert dialects for PostgreSQL or SQLite.
+        
+        Args:
+            db: Database session
+            signal_data: Signal dictionary from compute_signals()
+            
+        Returns:
+            Signal object, or None if duplicate
+        """
+        signal_values = SignalService._build_signal_values(signal_data)
+        dedupe_key = signal_values["dedupe_key"]
+        
+        # Skip if the same key already exists today (pruned to one chunk)
+        if await SignalService._existing_dedupe_keys(db, [signal_values]):
+            return None
+        
+        insert = SignalService._get_insert(db)
         stmt = insert(Signal).values(**signal_values).on_conflict_do_nothing(
-            index_elements=['dedupe_key']
+            index_elements=['dedupe_key', 'as_of_ts']
         )
         result = await db.execute(stmt)
         await db.commit()
@@ -88,12 +117,132 @@ class SignalService:
         if result.rowcount == 0:
             return None  # Already exists
         
-        # Fetch the newly created signal
+        # Fetch the newly created signal (as_of_ts pins the lookup to one chunk)
         fetch_result = await db.execute(
-            select(Signal).where(Signal.dedupe_key == dedupe_key)
+            select(Signal).where(
+                Signal.dedupe_key == dedupe_key,
+                Signal.as_of_ts == signal_values["as_of_ts"]
+            )
         )
         return fetch_result.scalar_one_or_none()
     
+    @staticmethod
+    async def _existing_dedupe_keys(
+        db: AsyncSession,
+        rows: List[Dict[str, Any]]
+    ) -> set:
+        """
+        Return the dedupe keys from rows that are already stored.
+        
+        The hypertable's unique index is (dedupe_key, as_of_ts), so it cannot
+        reject a repeat of a key at a later timestamp on its own. Each key is
+        looked up only within the day it encodes, keeping the probe on the
+        current chunk instead of every (possibly compressed) chunk.
+        """
+        keys_by_day: Dict[Tuple[datetime, datetime], List[str]] = {}
+        for row in rows:
+            bounds = SignalService.dedupe_day_bounds(row["as_of_ts"])
+            keys_by_day.setdefault(bounds, []).append(row["dedupe_key"])
+        
+        conditions = [
+            and_(
+                Signal.dedupe_key.in_(keys),
+                Signal.as_of_ts >= day_start,
+                Signal.as_of_ts < day_end
+            )
+            for (day_start, day_end), keys in keys_by_day.items()
+        ]
+        
+        result = await db.execute(select(Signal.dedupe_key).where(or_(*conditions)))
+        return {row[0] for row in result.all()}
+    
+    @staticmethod
+    async def create_signals_bulk(
+        db: AsyncSession,
+        signals: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Persist all signals from one scan with a single multi-row INSERT.
+        
+        Keys already stored for the same day are filtered out with one
+        chunk-pruned lookup, then the rest are written with INSERT ...
+        ON CONFLICT DO NOTHING RETURNING so only newly created rows come
+        back, followed by one commit. Signals sharing a dedupe key within the
+        batch (e.g. the same pair stable for several users) are collapsed to
+        the first occurrence.
+        
+        Args:
+            db: Database session
+            signals: Signal dictionaries from compute_signals()
+            
+        Returns:
+            List of dicts with id, as_of_ts and dedupe_key for inserted rows
+            (duplicates are omitted)
+        """
+        rows = []
+        seen_keys = set()
+        for signal_data in signals:
+            values = SignalService._build_signal_values(signal_data)
+            if values["dedupe_key"] in seen_keys:
+                continue
+            seen_keys.add(values["dedupe_key"])
+            # Assign ids up front so every row in the VALUES list is explicit
+            values["id"] = str(uuid.uuid4())
+            rows.append(values)
+        
+        if not rows:
+            return []
+        
+        existing_keys = await SignalService._existing_dedupe_keys(db, rows)
+        rows = [row for row in rows if row["dedupe_key"] not in existing_keys]
+        
+        if not rows:
+            return []
+        
+        insert = SignalService._get_insert(db)
+        stmt = (
+            insert(Signal)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=['dedupe_key', 'as_of_ts'])
+            .returning(Signal.id, Signal.as_of_ts, Signal.dedupe_key)
+        )
+        result = await db.execute(stmt)
+        created = [dict(row._mapping) for row in result.all()]
+        await db.commit()
+        
+        return created
+    
+    @staticmethod
+    async def get_signal_by_ref(
+        db: AsyncSession,
+        signal_ref: str
+    ) -> Optional[Signal]:
+        """
+        Look up a signal from a reference token ("<id>@<ts>" or bare ID).
+        
+        When the reference carries as_of_ts the query filters on the full
+        (id, as_of_ts) primary key, so TimescaleDB excludes every chunk but
+        one. Bare IDs from older messages fall back to an ID-only lookup.
+        
+        Args:
+            db: Database session
+            signal_ref: Reference from encode_signal_ref() or a bare signal ID
+            
+        Returns:
+            Signal object, or None if not found or the reference is malformed
+        """
+        try:
+            signal_id, as_of_ts = decode_signal_ref(signal_ref)
+        except ValueError:
+            return None
+        
+        query = select(Signal).where(Signal.id == signal_id)
+        if as_of_ts is not None:
+            query = query.where(Signal.as_of_ts == as_of_ts)
+        
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+    
     @staticmethod
     async def get_recent_signals(
         db: AsyncSession,
@@ -234,10 +383,13 @@ class SignalService:
         days: int = 7
     ) -> List[Dict[str, Any]]:
         """
-        Get hourly signal counts using TimescaleDB time_bucket.
+        Get hourly signal counts from the hourly continuous aggregates.
         
-        This leverages TimescaleDB's time_bucket function for efficient
-        time-series aggregation, which is much faster than manual grouping.
+        Reads pre-computed buckets from signals_hourly (or
+        signals_hourly_by_ticker when filtering by ticker) instead of
+        re-aggregating raw rows. The views are real-time, so buckets newer
+        than the last policy refresh are computed from raw signals and
+        unioned in by TimescaleDB.
         
         Args:
             db: Database session
@@ -264,24 +416,25 @@ class SignalService:
         logger = logging.getLogger(__name__)
         logger.debug(f"Getting hourly signal counts for {ticker or 'all tickers'} over {days} days")
         
-        # Build query with optional ticker filter
+        # Per-ticker aggregate when filtering, overall aggregate otherwise
+        view = "signals_hourly"
         ticker_filter = ""
         params = {"days": days}
         
         if ticker:
+            view = "signals_hourly_by_ticker"
             ticker_filter = "AND ticker = :ticker"
             params["ticker"] = ticker.upper()
         
         query = text(f"""
             SELECT
-                time_bucket('1 hour', as_of_ts) AS hour,
-                COUNT(*) as signal_count,
-                ROUND(AVG(ff_value)::numeric, 4) as avg_ff_value,
-                ROUND(MAX(ff_value)::numeric, 4) as max_ff_value
-            FROM signals
-            WHERE as_of_ts > NOW() - INTERVAL ':days days'
+                bucket AS hour,
+                signal_count,
+                ROUND(avg_ff_value::numeric, 4) as avg_ff_value,
+                ROUND(max_ff_value::numeric, 4) as max_ff_value
+            FROM {view}
+            WHERE bucket > NOW() - make_interval(days => :days)
             {ticker_filter}
-            GROUP BY hour
             ORDER BY hour DESC
         """)
         
@@ -298,7 +451,10 @@ class SignalService:
         days: int = 30
     ) -> List[Dict[str, Any]]:
         """
-        Get daily signal statistics using TimescaleDB time_bucket.
+        Get daily signal statistics from the daily continuous aggregates.
+        
+        Reads signals_daily (or signals_daily_by_ticker); today's bucket is
+        filled in from raw rows by real-time aggregation.
         
         Args:
             db: Database session
@@ -314,25 +470,26 @@ class SignalService:
         logger = logging.getLogger(__name__)
         logger.debug(f"Getting daily stats for {ticker or 'all tickers'} over {days} days")
         
+        view = "signals_daily"
         ticker_filter = ""
         params = {"days": days}
         
         if ticker:
+            view = "signals_daily_by_ticker"
             ticker_filter = "AND ticker = :ticker"
             params["ticker"] = ticker.upper()
         
         query = text(f"""
             SELECT
-                time_bucket('1 day', as_of_ts) AS day,
-                COUNT(*) as signal_count,
-                ROUND(AVG(ff_value)::numeric, 4) as avg_ff_value,
-                ROUND(MIN(ff_value)::numeric, 4) as min_ff_value,
-                ROUND(MAX(ff_value)::numeric, 4) as max_ff_value,
-                ROUND(STDDEV(ff_value)::numeric, 4) as stddev_ff_value
-            FROM signals
-            WHERE as_of_ts > NOW() - INTERVAL ':days days'
+                bucket AS day,
+                signal_count,
+                ROUND(avg_ff_value::numeric, 4) as avg_ff_value,
+                ROUND(min_ff_value::numeric, 4) as min_ff_value,
+                ROUND(max_ff_value::numeric, 4) as max_ff_value,
+                ROUND(stddev_ff_value::numeric, 4) as stddev_ff_value
+            FROM {view}
+            WHERE bucket > NOW() - make_interval(days => :days)
             {ticker_filter}
-            GROUP BY day
             ORDER BY day DESC
         """)
         
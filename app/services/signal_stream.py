@@ -0,0 +1,236 @@
+"""Live signal feed over Redis pub/sub for Server-Sent Events clients."""
+from typing import Any, Dict, List, Optional, Set, Tuple
+from datetime import date, datetime
+from app.core.redis import get_redis
+from app.utils.signal_ref import encode_signal_ref
+import asyncio
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SignalStream:
+    """
+    Publish newly created signals and fan them out to connected SSE clients.
+
+    Scan workers append each new signal to a capped Redis stream (the replay
+    buffer used for Last-Event-ID resume) and publish it on a pub/sub channel.
+    Each API process runs one pub/sub listener that routes events to the
+    queues of connected users whose in-memory subscription set contains the
+    signal's ticker, so no per-user database query runs per event.
+    """
+
+    CHANNEL = "signals:new"
+    EVENTS_KEY = "signals:events"
+    MAX_EVENTS = 1000  # Approximate length of the replay buffer
+    QUEUE_SIZE = 100  # Per-connection backlog before events are dropped
+
+    def __init__(self):
+        self.redis = None
+        self._lock = asyncio.Lock()
+        self._listener: Optional[asyncio.Task] = None
+        # user_id -> queues of that user's open connections
+        self._connections: Dict[str, Set[asyncio.Queue]] = {}
+        # user_id -> actively subscribed tickers
+        self._subscriptions: Dict[str, Set[str]] = {}
+
+    async def _get_redis(self):
+        """Get Redis connection."""
+        if self.redis is None:
+            async with self._lock:
+                if self.redis is None:
+                    self.redis = await get_redis()
+        return self.redis
+
+    @staticmethod
+    def build_payload(signal_data: Dict[str, Any], signal_id: str, as_of_ts: datetime) -> Dict[str, Any]:
+        """
+        Build the client-facing payload for a new signal.
+
+        Mirrors the fields of the signals API response so the dashboard can
+        render streamed and fetched signals the same way.
+
+        Args:
+            signal_data: Signal dictionary from compute_signals()
+            signal_id: ID of the stored signal
+            as_of_ts: Stored signal timestamp
+
+        Returns:
+            JSON-serializable signal dictionary
+        """
+        def _iso(value):
+            return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+        return {
+            "id": signal_id,
+            "ref": encode_signal_ref(signal_id, as_of_ts),
+            "ticker": signal_data["ticker"],
+            "ff_value": signal_data["ff_value"],
+            "front_iv": signal_data["front_iv"],
+            "back_iv": signal_data["back_iv"],
+            "sigma_fwd": signal_data["sigma_fwd"],
+            "front_expiry": _iso(signal_data["front_expiry"]),
+            "back_expiry": _iso(signal_data["back_expiry"]),
+            "front_dte": signal_data["front_dte"],
+            "back_dte": signal_data["back_dte"],
+            "as_of_ts": as_of_ts.isoformat(),
+            "quality_score": signal_data.get("quality_score"),
+            "vol_point": signal_data["vol_point"]
+        }
+
+    async def publish(self, payloads: List[Dict[str, Any]]) -> List[str]:
+        """
+        Record and broadcast new signals.
+
+        Args:
+            payloads: Signal payloads from build_payload()
+
+        Returns:
+            Event IDs assigned in the replay buffer
+        """
+        if not payloads:
+            return []
+
+        redis = await self._get_redis()
+
+        pipe = redis.pipeline(transaction=False)
+        for payload in payloads:
+            pipe.xadd(
+                self.EVENTS_KEY,
+                {"data": json.dumps(payload)},
+                maxlen=self.MAX_EVENTS,
+                approximate=True
+            )
+        event_ids = await pipe.execute()
+
+        pipe = redis.pipeline(transaction=False)
+        for event_id, payload in zip(event_ids, payloads):
+            pipe.publish(self.CHANNEL, json.dumps({"id": event_id, "data": payload}))
+        await pipe.execute()
+
+        return event_ids
+
+    @staticmethod
+    def _event_key(event_id: str) -> Tuple[int, int]:
+        """Sort key for a Redis stream ID ("<ms>-<seq>")."""
+        ms, _, seq = event_id.partition("-")
+        return int(ms), int(seq or 0)
+
+    @staticmethod
+    def is_after(event_id: str, last_event_id: Optional[str]) -> bool:
+        """Whether event_id comes strictly after last_event_id."""
+        if not last_event_id:
+            return True
+        try:
+            return SignalStream._event_key(event_id) > SignalStream._event_key(last_event_id)
+        except ValueError:
+            # Malformed client-supplied ID: deliver rather than drop
+            return True
+
+    async def replay(self, last_event_id: str, tickers: Set[str]) -> List[Dict[str, Any]]:
+        """
+        Return buffered events after last_event_id for the given tickers.
+
+        Args:
+            last_event_id: Last event ID the client received
+            tickers: Tickers the user is subscribed to
+
+        Returns:
+            Events ({"id", "data"}) in order, oldest first
+        """
+        try:
+            self._event_key(last_event_id)
+        except ValueError:
+            logger.debug(f"Ignoring malformed Last-Event-ID: {last_event_id}")
+            return []
+
+        redis = await self._get_redis()
+        entries = await redis.xrange(self.EVENTS_KEY, min=last_event_id, max="+")
+
+        events = []
+        for event_id, fields in entries:
+            if not self.is_after(event_id, last_event_id):
+                continue
+            payload = json.loads(fields["data"])
+            if payload["ticker"] in tickers:
+                events.append({"id": event_id, "data": payload})
+        return events
+
+    def set_subscriptions(self, user_id: str, tickers: Set[str]) -> None:
+        """Replace the in-memory ticker set used to filter a user's events."""
+        self._subscriptions[user_id] = {ticker.upper() for ticker in tickers}
+
+    async def connect(self, user_id: str, tickers: Set[str]) -> asyncio.Queue:
+        """
+        Register a client connection and start the listener if needed.
+
+        Args:
+            user_id: Connected user
+            tickers: Tickers the user is subscribed to
+
+        Returns:
+            Queue receiving the user's live events
+        """
+        self.set_subscriptions(user_id, tickers)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._connections.setdefault(user_id, set()).add(queue)
+
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+        return queue
+
+    def disconnect(self, user_id: str, queue: asyncio.Queue) -> None:
+        """Unregister a client connection."""
+        queues = self._connections.get(user_id)
+        if queues is None:
+            return
+
+        queues.discard(queue)
+        if not queues:
+            del self._connections[user_id]
+            self._subscriptions.pop(user_id, None)
+
+    def dispatch(self, event: Dict[str, Any]) -> None:
+        """Route one event to every connection subscribed to its ticker."""
+        ticker = event["data"]["ticker"]
+
+        for user_id, queues in self._connections.items():
+            if ticker not in self._subscriptions.get(user_id, ()):
+                continue
+            for queue in queues:
+                try:
+                    queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    logger.warning(f"Dropping stream event {event['id']} for slow client of user {user_id}")
+
+    async def _listen(self):
+        """Consume the pub/sub channel until no clients remain."""
+        while self._connections:
+            redis = await self._get_redis()
+            pubsub = redis.pubsub()
+            try:
+                await pubsub.subscribe(self.CHANNEL)
+                logger.info(f"Signal stream listener subscribed to {self.CHANNEL}")
+
+                while self._connections:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is None:
+                        continue
+                    try:
+                        self.dispatch(json.loads(message["data"]))
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.warning(f"Skipping malformed stream message: {e}")
+            except Exception as e:
+                # Clients resume from the replay buffer after reconnecting
+                logger.error(f"Signal stream listener failed: {e}", exc_info=True)
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+        logger.info("Signal stream listener stopped")
+
+
+# Global instance
+signal_stream = SignalStream()
@@ -0,0 +1,75 @@
+"""Option chain snapshot recording service (feeds ReplayProvider)."""
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import OptionChainSnapshot
+from app.providers.models import ChainSnapshot
+from app.providers.replay import ReplayFrame
+from datetime import datetime
+
+
+class SnapshotService:
+    """Service for storing and loading recorded option chains."""
+
+    @staticmethod
+    async def record_snapshot(db: AsyncSession, chain: ChainSnapshot) -> OptionChainSnapshot:
+        """
+        Store a chain in option_chain_snapshots in the Polygon snapshot format.
+
+        Args:
+            db: Database session
+            chain: Chain as returned by the provider
+
+        Returns:
+            Created snapshot row
+        """
+        frame = ReplayFrame.from_chain(chain)
+        snapshot = OptionChainSnapshot(
+            as_of_ts=chain.as_of,
+            ticker=chain.ticker,
+            provider=chain.provider,
+            underlying_price=chain.underlying_price,
+            raw_payload={"results": frame.results}
+        )
+        db.add(snapshot)
+        await db.commit()
+        return snapshot
+
+    @staticmethod
+    async def get_frames(
+        db: AsyncSession,
+        start: datetime,
+        end: datetime,
+        tickers: Optional[List[str]] = None
+    ) -> List[ReplayFrame]:
+        """
+        Load recorded chains as replay frames.
+
+        Args:
+            db: Database session
+            start: Earliest as_of_ts (inclusive)
+            end: Latest as_of_ts (exclusive)
+            tickers: Only these tickers (default: all)
+
+        Returns:
+            Frames ordered by as_of_ts
+        """
+        query = (
+            select(OptionChainSnapshot)
+            .where(OptionChainSnapshot.as_of_ts >= start, OptionChainSnapshot.as_of_ts < end)
+            .order_by(OptionChainSnapshot.as_of_ts)
+        )
+        if tickers:
+            query = query.where(OptionChainSnapshot.ticker.in_([t.upper() for t in tickers]))
+
+        result = await db.execute(query)
+        return [
+            ReplayFrame(
+                ticker=row.ticker,
+                as_of=row.as_of_ts,
+                underlying_price=row.underlying_price,
+                results=(row.raw_payload or {}).get("results", []),
+                provider=row.provider
+            )
+            for row in result.scalars().all()
+        ]
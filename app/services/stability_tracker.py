@@ -1,8 +1,26 @@
 """Stability tracker using Redis for signal debouncing."""
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 from datetime import datetime, timedelta, date, timezone
 from app.core.redis import get_redis
+from app.core.metrics import PROCESS_ROLE, STABILITY_CHECKS
 import asyncio
+import re
+
+# Numeric details (minutes, FF deltas, scan counts) stripped from metric labels
+_REASON_DETAIL = re.compile(r"_?-?[\d.]+(min)?")
+
+
+# State expires this long after a pair is first seen
+STATE_TTL = timedelta(hours=24)
+
+# Outcomes after which rescanning the same FF cannot alert: the pair has
+# alerted, and re-alerting needs the FF to rise by delta_ff_min
+SETTLED_REASONS = frozenset({"stable", "cooldown", "ff_delta_too_small"})
+
+
+def reason_label(reason: str) -> str:
+    """Reduce a stability reason to a metric label ("cooldown_12.5min" -> "cooldown")."""
+    return _REASON_DETAIL.sub("", reason)
 
 
 class StabilityTracker:
@@ -31,6 +49,11 @@ class StabilityTracker:
         """Create Redis lock key for atomic operations."""
         return f"stability_lock:{ticker}:{front_expiry}:{back_expiry}"
     
+    @staticmethod
+    def is_settled(state: dict) -> bool:
+        """Whether a check_stability() outcome stays alert-free while the FF is unchanged."""
+        return reason_label(state["reason"]) in SETTLED_REASONS
+    
     async def check_stability(
         self,
         ticker: str,
@@ -39,12 +62,15 @@ class StabilityTracker:
         ff_value: float,
         required_scans: int = 2,
         cooldown_minutes: int = 120,
-        delta_ff_min: float = 0.02
+        delta_ff_min: float = 0.02,
+        now: Optional[datetime] = None
     ) -> tuple[bool, dict]:
         """
         Check if signal meets stability requirements.
         
         Uses Redis SETNX-based locking for atomic read-modify-write operations.
+        Cooldowns and state expiry are measured on `now`, so replayed chains
+        can pass their recorded time and debounce as they did live.
         
         Args:
             ticker: Ticker symbol
@@ -54,10 +80,33 @@ class StabilityTracker:
             required_scans: Number of consecutive scans required
             cooldown_minutes: Cooldown period between alerts
             delta_ff_min: Minimum FF increase to re-alert
+            now: Time of the scanned chain (default: current time)
             
         Returns:
             (should_alert, state_dict) tuple
         """
+        should_alert, state = await self._check_stability(
+            ticker, front_expiry, back_expiry, ff_value,
+            required_scans, cooldown_minutes, delta_ff_min,
+            now or datetime.now(timezone.utc)
+        )
+        STABILITY_CHECKS.labels(role=PROCESS_ROLE, reason=reason_label(state["reason"])).inc()
+        return should_alert, state
+    
+    async def _check_stability(
+        self,
+        ticker: str,
+        front_expiry: date,
+        back_expiry: date,
+        ff_value: float,
+        required_scans: int,
+        cooldown_minutes: int,
+        delta_ff_min: float,
+        now: datetime
+    ) -> tuple[bool, dict]:
+        """Run the locked read-modify-write behind check_stability()."""
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
         redis = await self._get_redis()
         key = self._make_key(ticker, front_expiry, back_expiry)
         lock_key = self._lock_key(ticker, front_expiry, back_expiry)
@@ -77,7 +126,15 @@ class StabilityTracker:
         try:
             # Get current state atomically
             state = await redis.hgetall(key)
-            now = datetime.now(timezone.utc)
+            
+            # Redis expires state on wall-clock time; replays run faster than that
+            first_seen_str = state.get("first_seen", "")
+            if first_seen_str:
+                first_seen = datetime.fromisoformat(first_seen_str)
+                if first_seen.tzinfo is None:
+                    first_seen = first_seen.replace(tzinfo=timezone.utc)
+                if now - first_seen >= STATE_TTL:
+                    state = {}
             
             if not state:
                 # First time seeing this signal
@@ -87,7 +144,7 @@ class StabilityTracker:
                     "last_alert_ts": "",
                     "first_seen": now.isoformat()
                 })
-                await redis.expire(key, 86400)  # 24 hour TTL
+                await redis.expire(key, int(STATE_TTL.total_seconds()))
                 return False, {"consecutive_count": 1, "reason": "first_scan"}
             
             last_ff = float(state.get("last_ff", 0))
@@ -150,6 +207,33 @@ class StabilityTracker:
             # Always release the lock
             await redis.delete(lock_key)
     
+    async def refresh(self, ticker: str, pairs: Iterable[Tuple[date, date]]):
+        """
+        Count one more scan for pairs whose FF is known to be unchanged.
+        
+        Equivalent to check_stability() with the last FF for settled pairs
+        (see is_settled()), in a single pipelined round trip. Pairs whose
+        state has expired in the meantime are left expired.
+        
+        Args:
+            ticker: Ticker symbol
+            pairs: (front_expiry, back_expiry) pairs; dates or ISO strings
+        """
+        keys = [self._make_key(ticker, front, back) for front, back in pairs]
+        if not keys:
+            return
+        
+        redis = await self._get_redis()
+        pipe = redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.hincrby(key, "consecutive_count", 1)
+        counts = await pipe.execute()
+        
+        # A count of 1 means the hash had expired and was just recreated without a TTL
+        recreated = [key for key, count in zip(keys, counts) if count == 1]
+        if recreated:
+            await redis.delete(*recreated)
+    
     async def reset(self, ticker: str, front_expiry: date, back_expiry: date):
         """Reset stability tracking for a ticker/expiry pair."""
         redis = await self._get_redis()
@@ -3,6 +3,8 @@ from typing import List
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import Subscription, User
+from app.services.signal_feed import signal_feed_cache
+from app.services.response_cache import response_cache, SUBSCRIPTIONS
 
 
 class SubscriptionService:
@@ -41,6 +43,8 @@ class SubscriptionService:
                 existing.active = True
                 await db.commit()
                 await db.refresh(existing)
+                await signal_feed_cache.invalidate(user_id)
+                await response_cache.bump(SUBSCRIPTIONS, user_id)
             return existing
         
         # Create new subscription
@@ -53,6 +57,10 @@ class SubscriptionService:
         await db.commit()
         await db.refresh(subscription)
         
+        # The cached signal feed and responses no longer match the watchlist
+        await signal_feed_cache.invalidate(user_id)
+        await response_cache.bump(SUBSCRIPTIONS, user_id)
+        
         return subscription
     
     @staticmethod
@@ -82,6 +90,10 @@ class SubscriptionService:
         )
         await db.commit()
         
+        if result.rowcount > 0:
+            await signal_feed_cache.invalidate(user_id)
+            await response_cache.bump(SUBSCRIPTIONS, user_id)
+        
         return result.rowcount > 0
     
     @staticmethod
@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import User, UserSettings
 from app.core.config import settings as app_settings
+from app.services.response_cache import response_cache, SETTINGS
 
 
 class UserService:
@@ -137,6 +138,7 @@ class UserService:
         
         await db.commit()
         await db.refresh(settings)
+        await response_cache.bump(SETTINGS, user_id)
         
         return settings
     
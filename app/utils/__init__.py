@@ -1,6 +1,8 @@
 """Utilities package initialization."""
 from app.utils.time import calculate_dte, is_in_quiet_hours, get_user_time
 from app.utils.formatting import format_signal_message, format_watchlist, format_history
+from app.utils.signal_ref import encode_signal_ref, decode_signal_ref
+from app.utils.pagination import encode_cursor, decode_cursor
 
 __all__ = [
     "calculate_dte",
@@ -8,5 +10,9 @@ __all__ = [
     "get_user_time",
     "format_signal_message",
     "format_watchlist",
-    "format_history"
+    "format_history",
+    "encode_signal_ref",
+    "decode_signal_ref",
+    "encode_cursor",
+    "decode_cursor"
 ]
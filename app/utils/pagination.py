@@ -0,0 +1,52 @@
+"""Opaque keyset cursors for paginated list endpoints."""
+import base64
+import binascii
+from datetime import datetime
+from typing import Tuple
+
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+_SEPARATOR = "|"
+
+
+def encode_cursor(ts: datetime, row_id: str) -> str:
+    """
+    Encode a (timestamp, id) keyset position as an opaque cursor.
+
+    Args:
+        ts: Sort timestamp of the last row on the page
+        row_id: ID of the last row (tie-breaker for equal timestamps)
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{ts.isoformat()}{_SEPARATOR}{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: Cursor string from a previous response
+
+    Returns:
+        (timestamp, id) tuple
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: '{cursor}'") from e
+
+    ts_part, sep, row_id = raw.partition(_SEPARATOR)
+    if not sep or not row_id:
+        raise ValueError(f"Invalid cursor: '{cursor}'")
+
+    return datetime.fromisoformat(ts_part), row_id
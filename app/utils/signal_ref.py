@@ -0,0 +1,71 @@
+"""Compact signal references that carry the hypertable partition key."""
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+
+# Separator between the signal ID and its encoded timestamp
+REF_SEPARATOR = "@"
+
+_BASE36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_base36(value: int) -> str:
+    """Encode a non-negative integer in lowercase base 36."""
+    if value == 0:
+        return "0"
+    digits = []
+    while value:
+        value, rem = divmod(value, 36)
+        digits.append(_BASE36_DIGITS[rem])
+    return "".join(reversed(digits))
+
+
+def encode_signal_ref(signal_id: str, as_of_ts: datetime) -> str:
+    """
+    Encode a signal reference as "<id>@<epoch microseconds, base 36>".
+    
+    Signals live in a TimescaleDB hypertable keyed on (id, as_of_ts). Carrying
+    as_of_ts in every reference lets lookups filter on both columns so only a
+    single chunk is scanned. Microsecond precision round-trips exactly, and
+    base 36 keeps Telegram callback data under its 64-byte limit.
+    
+    Args:
+        signal_id: Signal ID
+        as_of_ts: Signal timestamp (naive values are treated as UTC)
+        
+    Returns:
+        Reference token, e.g. "3f2c...@1k9x0q8g2w"
+    """
+    if as_of_ts.tzinfo is None:
+        as_of_ts = as_of_ts.replace(tzinfo=timezone.utc)
+    
+    micros = (as_of_ts - _EPOCH) // timedelta(microseconds=1)
+    return f"{signal_id}{REF_SEPARATOR}{_to_base36(micros)}"
+
+
+def decode_signal_ref(ref: str) -> Tuple[str, Optional[datetime]]:
+    """
+    Decode a signal reference into (signal_id, as_of_ts).
+    
+    Bare signal IDs (references created before timestamps were embedded)
+    decode to (signal_id, None) so callers can fall back to an ID-only lookup.
+    
+    Args:
+        ref: Reference token or bare signal ID
+        
+    Returns:
+        (signal_id, as_of_ts) tuple; as_of_ts is timezone-aware UTC or None
+        
+    Raises:
+        ValueError: If the timestamp part is malformed
+    """
+    signal_id, sep, encoded_ts = ref.rpartition(REF_SEPARATOR)
+    if not sep:
+        return ref, None
+    
+    if not signal_id or not encoded_ts:
+        raise ValueError(f"Invalid signal reference: '{ref}'")
+    
+    micros = int(encoded_ts, 36)
+    return signal_id, _EPOCH + timedelta(microseconds=micros)
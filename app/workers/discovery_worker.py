@@ -3,6 +3,7 @@ import logging
 import asyncio
 from typing import List
 from app.core.redis import get_redis
+from app.core.metrics import start_metrics_server
 from app.providers.polygon import PolygonProvider
 from app.providers import ProviderError
 
@@ -115,6 +116,7 @@ class DiscoveryWorker:
 
 async def main():
     """Main entry point for discovery worker."""
+    start_metrics_server()
     worker = DiscoveryWorker()
     await worker.run()
 
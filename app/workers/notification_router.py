@@ -1,15 +1,21 @@
 """Notification router for sending signals to users."""
 import logging
 import asyncio
+import time
+from datetime import datetime, timezone
 from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup
 from app.core.config import settings
+from app.core.tracing import PipelineTrace, current_trace, extract_payload, span_exporter, trace_stage, use_trace
+from app.core.metrics import PROCESS_ROLE, NOTIFICATIONS, NOTIFICATION_LAG, start_metrics_server
 from app.core.database import AsyncSessionLocal
 from app.core.redis import get_redis
 from app.services import SignalService, UserService, SubscriptionService
 from app.utils.formatting import format_signal_message
+from app.utils.signal_ref import encode_signal_ref
 from app.utils.time import is_in_quiet_hours
 from sqlalchemy import select
 from app.models import Signal
+from app.models.telegram_chat import TelegramChat
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,7 +25,7 @@ class NotificationRouter:
     """Router for sending signal notifications to subscribed users."""
     
     def __init__(self):
-        self.bot = Bot(token=settings.telegram_bot_token)
+        self.bot = Bot(token=settings.telegram_bot_token, base_url=settings.telegram_api_base_url)
         self.redis = None
     
     async def _get_redis(self):
@@ -28,6 +34,13 @@ class NotificationRouter:
             self.redis = await get_redis()
         return self.redis
     
+    @staticmethod
+    def _lag_seconds(as_of_ts: datetime) -> float:
+        """Seconds between a signal's chain snapshot and now."""
+        if as_of_ts.tzinfo is None:
+            as_of_ts = as_of_ts.replace(tzinfo=timezone.utc)
+        return max((datetime.now(timezone.utc) - as_of_ts).total_seconds(), 0.0)
+    
     async def send_signal_to_user(self, signal: Signal, user_id: str, chat_id: str):
         """
         Send signal notification to a single user.
@@ -43,11 +56,13 @@ class NotificationRouter:
                 user_settings = await UserService.get_user_settings(db, user_id)
                 
                 if not user_settings:
+                    NOTIFICATIONS.labels(role=PROCESS_ROLE, result="no_settings").inc()
                     return
                 
                 # Check quiet hours
                 if is_in_quiet_hours(user_settings.quiet_hours, user_settings.timezone):
                     logger.info(f"User {chat_id} in quiet hours, skipping notification")
+                    NOTIFICATIONS.labels(role=PROCESS_ROLE, result="quiet_hours").inc()
                     return
             
             # Format message
@@ -67,67 +82,92 @@ class NotificationRouter:
             
             message = format_signal_message(signal_dict)
             
-            # Create inline keyboard
+            # Create inline keyboard (signal ref keeps callback lookups on one chunk)
+            signal_ref = encode_signal_ref(signal.id, signal.as_of_ts)
             keyboard = [
                 [
-                    InlineKeyboardButton("✅ Place Trade", callback_data=f"place:{signal.id}:{user_id}"),
-                    InlineKeyboardButton("❌ Ignore", callback_data=f"ignore:{signal.id}:{user_id}")
+                    InlineKeyboardButton("✅ Place Trade", callback_data=f"place:{signal_ref}"),
+                    InlineKeyboardButton("❌ Ignore", callback_data=f"ignore:{signal_ref}")
                 ]
             ]
             reply_markup = InlineKeyboardMarkup(keyboard)
             
             # Send message
-            await self.bot.send_message(
-                chat_id=chat_id,
-                text=message,
-                reply_markup=reply_markup
-            )
+            with trace_stage("send", chat_id=chat_id):
+                await self.bot.send_message(
+                    chat_id=chat_id,
+                    text=message,
+                    reply_markup=reply_markup
+                )
             
+            trace = current_trace()
+            if trace is not None:
+                trace.alert_sent()
+            NOTIFICATIONS.labels(role=PROCESS_ROLE, result="sent").inc()
+            NOTIFICATION_LAG.labels(role=PROCESS_ROLE).observe(self._lag_seconds(signal.as_of_ts))
             logger.info(f"Sent signal {signal.id} to user {chat_id}")
             
         except Exception as e:
+            NOTIFICATIONS.labels(role=PROCESS_ROLE, result="error").inc()
             logger.error(f"Error sending signal to {chat_id}: {e}", exc_info=True)
     
-    async def process_notification(self, signal_id: str):
+    async def process_notification(self, payload: str):
         """
         Process a notification from the queue.
         
+        Continues the scan's trace when the payload carries one, recording
+        the time spent queued as the dequeue stage.
+        
         Args:
-            signal_id: Signal ID to notify about
+            payload: Queue payload: a signal reference ("<id>@<ts>", or a bare
+                ID), or JSON with the reference and its trace context
         """
+        signal_ref, trace_context = extract_payload(payload)
+        if trace_context is None:
+            await self._process_notification(signal_ref)
+            return
+        
+        trace = PipelineTrace.from_context(trace_context, "notify", signal_ref=signal_ref)
+        trace.record("dequeue", trace_context["enqueued_at"], time.time())
+        with use_trace(trace):
+            await self._process_notification(signal_ref)
+        await span_exporter.export(trace.finish())
+    
+    async def _process_notification(self, signal_ref: str):
+        """Send a signal to its subscribers (see process_notification())."""
         try:
             async with AsyncSessionLocal() as db:
                 # Get signal
-                result = await db.execute(
-                    select(Signal).where(Signal.id == signal_id)
-                )
-                signal = result.scalar_one_or_none()
+                signal = await SignalService.get_signal_by_ref(db, signal_ref)
                 
                 if not signal:
-                    logger.warning(f"Signal {signal_id} not found")
+                    logger.warning(f"Signal {signal_ref} not found")
                     return
                 
                 # Get all subscribers for this ticker
                 subscriber_ids = await SubscriptionService.get_ticker_subscribers(db, signal.ticker)
                 
-                # Send to each subscriber
-                for user_id in subscriber_ids:
-                    # Get user's chat ID
-                    from app.models import User
-                    result = await db.execute(
-                        select(User).where(User.id == user_id)
-                    )
-                    user_obj = result.scalar_one_or_none()
-                    
-                    if user_obj and user_obj.telegram_chat_id:
-                        await self.send_signal_to_user(signal, str(user_id), user_obj.telegram_chat_id)
-                    elif user_obj:
-                        logger.warning(f"User {user_id} has no telegram_chat_id, skipping notification")
-                    else:
-                        logger.warning(f"User {user_id} not found, skipping notification")
+                if not subscriber_ids:
+                    return
+                
+                # Linked Telegram chats of every subscriber in one query
+                result = await db.execute(
+                    select(TelegramChat.user_id, TelegramChat.chat_id)
+                    .where(TelegramChat.user_id.in_(subscriber_ids))
+                )
+                chats = result.all()
+            
+            linked_users = {user_id for user_id, _ in chats}
+            for user_id in subscriber_ids:
+                if user_id not in linked_users:
+                    logger.warning(f"User {user_id} has no linked Telegram chats, skipping notification")
+            
+            # Send to each linked chat
+            for user_id, chat_id in chats:
+                await self.send_signal_to_user(signal, str(user_id), chat_id)
                         
         except Exception as e:
-            logger.error(f"Error processing notification {signal_id}: {e}", exc_info=True)
+            logger.error(f"Error processing notification {signal_ref}: {e}", exc_info=True)
     
     async def run(self):
         """Run notification router loop."""
@@ -140,8 +180,8 @@ class NotificationRouter:
                 result = await redis.brpop("notification_queue", timeout=5)
                 
                 if result:
-                    queue_name, signal_id = result
-                    await self.process_notification(signal_id)
+                    queue_name, payload = result
+                    await self.process_notification(payload)
                 else:
                     await asyncio.sleep(1)
                     
@@ -152,6 +192,7 @@ class NotificationRouter:
 
 async def main():
     """Main entry point for notification router."""
+    start_metrics_server()
     router = NotificationRouter()
     await router.run()
 
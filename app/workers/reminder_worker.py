@@ -5,6 +5,7 @@ import json
 from datetime import datetime, timezone
 from telegram import Bot
 from app.core.config import settings
+from app.core.metrics import PROCESS_ROLE, REMINDERS, REMINDER_LAG, start_metrics_server
 from app.core.database import AsyncSessionLocal
 from app.core.redis import get_redis
 from app.models import Signal, User
@@ -18,7 +19,7 @@ class ReminderWorker:
     """Worker for processing scheduled trade reminders."""
     
     def __init__(self):
-        self.bot = Bot(token=settings.telegram_bot_token)
+        self.bot = Bot(token=settings.telegram_bot_token, base_url=settings.telegram_api_base_url)
         self.redis = None
     
     async def _get_redis(self):
@@ -103,6 +104,7 @@ Original Signal Details:
                 
                 if not signal:
                     logger.warning(f"Signal {reminder['signal_id']} not found for reminder")
+                    REMINDERS.labels(role=PROCESS_ROLE, result="skipped").inc()
                     return
                 
                 # Get user
@@ -113,6 +115,7 @@ Original Signal Details:
                 
                 if not user:
                     logger.warning(f"User {reminder['user_id']} not found")
+                    REMINDERS.labels(role=PROCESS_ROLE, result="skipped").inc()
                     return
                 
                 # Get all linked Telegram chats for this user
@@ -123,6 +126,7 @@ Original Signal Details:
                 
                 if not telegram_chats:
                     logger.warning(f"User {reminder['user_id']} has no linked Telegram chats")
+                    REMINDERS.labels(role=PROCESS_ROLE, result="skipped").inc()
                     return
                 
                 # Format message
@@ -136,17 +140,20 @@ Original Signal Details:
                             text=message,
                             parse_mode='Markdown'
                         )
+                        REMINDERS.labels(role=PROCESS_ROLE, result="sent").inc()
                         logger.info(
                             f"Sent {reminder['type']} reminder to chat {chat.chat_id} "
                             f"for user {user.id} for signal {signal.id}"
                         )
                     except Exception as e:
+                        REMINDERS.labels(role=PROCESS_ROLE, result="error").inc()
                         logger.error(
                             f"Error sending reminder to chat {chat.chat_id}: {e}",
                             exc_info=True
                         )
                 
         except Exception as e:
+            REMINDERS.labels(role=PROCESS_ROLE, result="error").inc()
             logger.error(f"Error sending reminder: {e}", exc_info=True)
     
     async def process_due_reminders(self):
@@ -159,13 +166,15 @@ Original Signal Details:
             due_reminders = await redis.zrangebyscore(
                 "reminder_queue",
                 min=0,
-                max=now
+                max=now,
+                withscores=True
             )
             
             if due_reminders:
                 logger.info(f"Processing {len(due_reminders)} due reminders")
             
-            for reminder_json in due_reminders:
+            for reminder_json, due_ts in due_reminders:
+                REMINDER_LAG.labels(role=PROCESS_ROLE).observe(max(now - due_ts, 0.0))
                 try:
                     reminder = json.loads(reminder_json)
                     
@@ -201,6 +210,7 @@ Original Signal Details:
 
 async def main():
     """Main entry point for reminder worker."""
+    start_metrics_server()
     worker = ReminderWorker()
     await worker.run()
 
@@ -1,15 +1,28 @@
 """Scan worker for fetching chains and computing signals."""
 import logging
 import asyncio
-from typing import Dict, Any, List, Set
+import time
+from typing import Dict, Any, List, Optional, Set, Tuple
 from app.core.database import AsyncSessionLocal
 from app.core.redis import get_redis
+from app.providers import OptionChainProvider
 from app.providers.polygon import PolygonProvider
-from app.services import TickerService, SignalService, UserService, SubscriptionService, stability_tracker
-from app.services.signal_engine import compute_signals
-from datetime import datetime, timezone
+from app.services import TickerService, SignalService, UserService, SubscriptionService, SnapshotService, stability_tracker, signal_dedupe_cache, signal_stream, signal_feed_cache, response_cache, scan_fingerprint_cache
+from app.services.response_cache import SIGNALS
+from app.services.signal_engine import chain_fingerprint, compute_signals
+from app.utils.signal_ref import encode_signal_ref
+from datetime import date, datetime, timezone
 
 from app.core.config import settings
+from app.core.tracing import PipelineTrace, span_exporter, trace_stage, use_trace, inject_payload
+from app.core.metrics import (
+    PROCESS_ROLE,
+    SCANS,
+    SCAN_DURATION,
+    COMPUTE_SIGNALS_DURATION,
+    SIGNALS_CREATED,
+    start_metrics_server,
+)
 
 logging.basicConfig(
     level=getattr(logging, settings.log_level),
@@ -21,10 +34,13 @@ logger = logging.getLogger(__name__)
 class ScanWorker:
     """Worker for scanning tickers and computing signals."""
     
-    def __init__(self):
+    def __init__(self, provider: Optional[OptionChainProvider] = None):
+        """
+        Args:
+            provider: Chain source (default: live Polygon; ReplayProvider for offline runs)
+        """
         logger.info("Initializing ScanWorker...")
-        logger.debug("Creating Polygon provider instance")
-        self.provider = PolygonProvider()
+        self.provider = provider or PolygonProvider()
         self.redis = None
         logger.info("ScanWorker initialized")
     
@@ -36,15 +52,36 @@ class ScanWorker:
             logger.info("Redis connection established")
         return self.redis
     
+    async def _record_snapshot(self, chain):
+        """Store the chain for later replay (best effort)."""
+        try:
+            async with AsyncSessionLocal() as db:
+                await SnapshotService.record_snapshot(db, chain)
+        except Exception as e:
+            logger.warning(f"Failed to record chain snapshot for {chain.ticker}: {e}")
+    
     async def scan_ticker(self, ticker: str, is_discovery: bool = False):
         """
         Scan a single ticker for signals.
         
+        Starts the alert pipeline trace; its context travels with each new
+        signal through the notification queue.
+        
         Args:
             ticker: Ticker symbol to scan
             is_discovery: Whether this is a discovery scan (from discovery_queue)
         """
+        trace = PipelineTrace("scan_ticker", ticker=ticker, discovery=is_discovery)
+        with use_trace(trace):
+            await self._scan_ticker(ticker, is_discovery)
+        await span_exporter.export(trace.finish())
+    
+    async def _scan_ticker(self, ticker: str, is_discovery: bool):
+        """Run the scan stages for scan_ticker() inside its trace."""
         logger.info(f"Scanning {ticker} (discovery={is_discovery})...")
+        mode = "discovery" if is_discovery else "scan"
+        result = "error"
+        start = time.perf_counter()
         
         try:
             # Fetch chain snapshot
@@ -55,6 +92,26 @@ class ScanWorker:
             cache_key = f"chain:{ticker}:{datetime.now(timezone.utc).strftime('%Y%m%d%H%M')}"
             await redis.setex(cache_key, 300, "cached")  # 5 min TTL
             
+            if settings.record_chain_snapshots:
+                await self._record_snapshot(chain)
+            
+            # An identical chain after a settled scan cannot produce new alerts
+            fingerprint = None
+            if settings.unchanged_chain_skip_minutes > 0:
+                with trace_stage("fingerprint"):
+                    fingerprint = chain_fingerprint(chain)
+                    unchanged_pairs = await scan_fingerprint_cache.unchanged_pairs(ticker, mode, fingerprint)
+                
+                if unchanged_pairs is not None:
+                    with trace_stage("stability"):
+                        await stability_tracker.refresh(chain.ticker, unchanged_pairs)
+                    # The ticker was still scanned, so keep last_scan_at current
+                    async with AsyncSessionLocal() as db:
+                        await TickerService.update_last_scan(db, ticker)
+                    logger.info(f"Chain for {ticker} unchanged since last scan, skipping")
+                    result = "unchanged"
+                    return
+            
             # Get all subscribers for this ticker
             async with AsyncSessionLocal() as db:
                 logger.debug(f"Fetching subscribers for {ticker}")
@@ -70,10 +127,18 @@ class ScanWorker:
                 
                 if not all_user_ids:
                     logger.info(f"No subscribers or discovery users for {ticker}, skipping")
+                    result = "no_subscribers"
                     return
                 
                 logger.debug(f"Processing signals for {len(all_user_ids)} users")
                 
+                # Stable signals from every user are persisted together after the loop
+                stable_signals: List[Dict[str, Any]] = []
+                
+                # Pairs checked for stability, and whether a rescan could still alert
+                checked_pairs: Set[Tuple[date, date]] = set()
+                settled = True
+                
                 # For each user, compute signals with their settings
                 for user_id in all_user_ids:
                     user_settings_obj = await UserService.get_user_settings(db, user_id)
@@ -96,7 +161,10 @@ class ScanWorker:
                     }
                     
                     # Compute signals
-                    signals = compute_signals(chain, user_settings)
+                    compute_start = time.perf_counter()
+                    with trace_stage("compute"):
+                        signals = compute_signals(chain, user_settings)
+                    COMPUTE_SIGNALS_DURATION.labels(role=PROCESS_ROLE).observe(time.perf_counter() - compute_start)
                     
                     # Process each signal
                     for signal_data in signals:
@@ -104,43 +172,88 @@ class ScanWorker:
                         signal_data["is_discovery"] = is_discovery_signal
                         
                         # Check stability using expiry dates (not DTE)
-                        should_alert, state = await stability_tracker.check_stability(
-                            ticker=signal_data["ticker"],
-                            front_expiry=signal_data["front_expiry"],
-                            back_expiry=signal_data["back_expiry"],
-                            ff_value=signal_data["ff_value"],
-                            required_scans=user_settings_obj.stability_scans,
-                            cooldown_minutes=user_settings_obj.cooldown_minutes
-                        )
+                        with trace_stage("stability"):
+                            should_alert, state = await stability_tracker.check_stability(
+                                ticker=signal_data["ticker"],
+                                front_expiry=signal_data["front_expiry"],
+                                back_expiry=signal_data["back_expiry"],
+                                ff_value=signal_data["ff_value"],
+                                required_scans=user_settings_obj.stability_scans,
+                                cooldown_minutes=user_settings_obj.cooldown_minutes,
+                                now=chain.as_of
+                            )
+                        
+                        checked_pairs.add((signal_data["front_expiry"], signal_data["back_expiry"]))
+                        if not stability_tracker.is_settled(state):
+                            settled = False
                         
-                        if not should_alert:
-                            logger.info(f"Signal for {ticker} not stable yet: {state}")
-                            
                         if should_alert:
-                            # Persist signal to database (transaction auto-committed by context manager)
-                            signal = await SignalService.create_signal(db, signal_data)
-                            
-                            if signal:
-                                # Signal was created (not a duplicate), queue for notification
-                                logger.info(f"Created signal {signal.id} for {ticker} (discovery={is_discovery_signal})")
-                                await redis.lpush("notification_queue", signal.id)
-                            else:
-                                # Signal was a duplicate, skip notification
-                                logger.debug(f"Skipped duplicate signal for {ticker}")
+                            stable_signals.append(signal_data)
                         else:
-                            logger.debug(f"Signal did not meet stability: {state}")
+                            logger.info(f"Signal for {ticker} not stable yet: {state}")
+                
+                with trace_stage("persist"):
+                    # Drop signals already claimed today without touching the database
+                    fresh_signals = await signal_dedupe_cache.claim(stable_signals)
+                    created: List[Dict[str, Any]] = []
+                    
+                    if fresh_signals:
+                        # Persist all fresh signals in one INSERT ... RETURNING (duplicates are skipped)
+                        try:
+                            created = await SignalService.create_signals_bulk(db, fresh_signals)
+                        except Exception:
+                            await signal_dedupe_cache.release(fresh_signals)
+                            raise
+                
+                if created:
+                    # Queue every new signal (with the trace context) in a single round trip
+                    with trace_stage("enqueue", signals=len(created)):
+                        pipe = redis.pipeline(transaction=False)
+                        for row in created:
+                            pipe.lpush("notification_queue", inject_payload(encode_signal_ref(row["id"], row["as_of_ts"])))
+                        await pipe.execute()
+                    SIGNALS_CREATED.labels(role=PROCESS_ROLE).inc(len(created))
+                    logger.info(f"Created {len(created)} signals for {ticker}")
+                    
+                    # Push new signals to subscriber feeds and live streams (best effort)
+                    signals_by_key = {SignalService.generate_dedupe_key(s): s for s in fresh_signals}
+                    try:
+                        payloads = [
+                            signal_stream.build_payload(signals_by_key[row["dedupe_key"]], row["id"], row["as_of_ts"])
+                            for row in created
+                        ]
+                        await response_cache.bump(SIGNALS)
+                        await signal_feed_cache.push(subscriber_ids, payloads)
+                        await signal_stream.publish(payloads)
+                    except Exception as e:
+                        logger.warning(f"Failed to publish signals for {ticker}: {e}")
+                
+                skipped = len(stable_signals) - len(created)
+                if skipped:
+                    logger.debug(f"Skipped {skipped} duplicate signals for {ticker}")
                 
                 # Update last scan time
                 await TickerService.update_last_scan(db, ticker)
                 
             # Transaction is automatically committed when the async with block exits
+            if fingerprint is not None:
+                await scan_fingerprint_cache.store(
+                    ticker, mode, fingerprint, checked_pairs, settled,
+                    ttl_seconds=settings.unchanged_chain_skip_minutes * 60
+                )
+            
+            result = "ok"
             logger.info(f"Completed scan for {ticker}")
                 
         except Exception as e:
             logger.error(f"Error scanning {ticker}: {e}", exc_info=True)
+        finally:
+            SCANS.labels(role=PROCESS_ROLE, mode=mode, result=result).inc()
+            SCAN_DURATION.labels(role=PROCESS_ROLE, mode=mode).observe(time.perf_counter() - start)
     
     async def cleanup(self):
         """Cleanup resources."""
+        await span_exporter.close()
         await self.provider.close()
         if self.redis:
             await self.redis.close()
@@ -185,6 +298,7 @@ class ScanWorker:
 
 async def main():
     """Main entry point for scan worker."""
+    start_metrics_server()
     worker = ScanWorker()
     await worker.run()
 
@@ -30,7 +30,7 @@ export default function HistoryPage() {
     const handleSaveTradeDetails = async (tradeDetails: TradeDetails) => {
         if (!editingEntry?.decision) return;
 
-        await apiClient.post(`/api/signals/${editingEntry.signal.id}/decision`, {
+        await apiClient.post(`/api/signals/${editingEntry.signal.ref}/decision`, {
             decision: editingEntry.decision.decision,
             ...tradeDetails,
         });
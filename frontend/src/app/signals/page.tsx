@@ -2,6 +2,7 @@
 
 import { useState, useEffect } from 'react';
 import apiClient from '@/lib/api-client';
+import { subscribeToSignals } from '@/lib/signal-stream';
 import { Signal } from '@/types';
 import DashboardLayout from '../dashboard/layout';
 
@@ -12,6 +13,10 @@ export default function SignalsPage() {
 
     useEffect(() => {
         fetchSignals();
+        // Prepend signals pushed by the server as they are created
+        return subscribeToSignals((signal) => {
+            setSignals((prev) => (prev.some((s) => s.id === signal.id) ? prev : [signal, ...prev]));
+        });
     }, []);
 
     const fetchSignals = async () => {
@@ -25,9 +30,9 @@ export default function SignalsPage() {
         }
     };
 
-    const recordDecision = async (signalId: string, decision: 'placed' | 'ignored') => {
+    const recordDecision = async (signalRef: string, decision: 'placed' | 'ignored') => {
         try {
-            await apiClient.post(`/api/signals/${signalId}/decision`, { decision });
+            await apiClient.post(`/api/signals/${signalRef}/decision`, { decision });
             alert(`Decision recorded: ${decision}`);
         } catch (err: any) {
             alert('Failed to record decision');
@@ -108,13 +113,13 @@ export default function SignalsPage() {
 
                                 <div className="flex flex-col sm:flex-row gap-2 sm:gap-4">
                                     <button
-                                        onClick={() => recordDecision(signal.id, 'placed')}
+                                        onClick={() => recordDecision(signal.ref, 'placed')}
                                         className="flex-1 bg-green-700 text-white px-4 py-2.5 sm:py-2 rounded-md hover:bg-green-800 font-medium min-h-[44px] transition-colors"
                                     >
                                         Place Trade
                                     </button>
                                     <button
-                                        onClick={() => recordDecision(signal.id, 'ignored')}
+                                        onClick={() => recordDecision(signal.ref, 'ignored')}
                                         className="flex-1 bg-gray-700 text-white px-4 py-2.5 sm:py-2 rounded-md hover:bg-gray-800 font-medium min-h-[44px] transition-colors"
                                     >
                                         Ignore
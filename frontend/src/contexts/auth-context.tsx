@@ -74,6 +74,14 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
     };
 
     const logout = () => {
+        // Best effort: drop the server-side user cache; the token is passed
+        // explicitly because it is cleared before the request interceptor runs
+        const token = localStorage.getItem('access_token');
+        if (token) {
+            apiClient
+                .post('/api/auth/logout', null, { headers: { Authorization: `Bearer ${token}` } })
+                .catch(() => {});
+        }
         localStorage.removeItem('access_token');
         localStorage.removeItem('user');
         setUser(null);
@@ -0,0 +1,73 @@
+/**
+ * Live signal feed over Server-Sent Events
+ *
+ * Uses fetch streaming rather than EventSource so the JWT can be sent in the
+ * Authorization header. Reconnects with Last-Event-ID to replay missed signals.
+ */
+import { Signal } from '@/types';
+
+const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
+const RECONNECT_DELAY_MS = 5000;
+
+export function subscribeToSignals(onSignal: (signal: Signal) => void): () => void {
+    const controller = new AbortController();
+    let lastEventId: string | null = null;
+
+    const connect = async () => {
+        while (!controller.signal.aborted) {
+            try {
+                const headers: Record<string, string> = { Accept: 'text/event-stream' };
+                const token = localStorage.getItem('access_token');
+                if (token) {
+                    headers.Authorization = `Bearer ${token}`;
+                }
+                if (lastEventId) {
+                    headers['Last-Event-ID'] = lastEventId;
+                }
+
+                const response = await fetch(`${API_URL}/api/signals/stream`, {
+                    headers,
+                    signal: controller.signal,
+                });
+                if (response.status === 401) {
+                    return;
+                }
+                if (!response.ok || !response.body) {
+                    throw new Error(`Signal stream failed: ${response.status}`);
+                }
+
+                const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+                let buffer = '';
+                while (true) {
+                    const { value, done } = await reader.read();
+                    if (done) break;
+                    buffer += value;
+
+                    let boundary = buffer.indexOf('\n\n');
+                    while (boundary !== -1) {
+                        const block = buffer.slice(0, boundary);
+                        buffer = buffer.slice(boundary + 2);
+                        boundary = buffer.indexOf('\n\n');
+
+                        let id: string | null = null;
+                        let data = '';
+                        for (const line of block.split('\n')) {
+                            if (line.startsWith('id: ')) id = line.slice(4);
+                            else if (line.startsWith('data: ')) data += line.slice(6);
+                        }
+                        // Keepalive comments carry no data
+                        if (!data) continue;
+                        if (id) lastEventId = id;
+                        onSignal(JSON.parse(data));
+                    }
+                }
+            } catch (err) {
+                if (controller.signal.aborted) return;
+            }
+            await new Promise((resolve) => setTimeout(resolve, RECONNECT_DELAY_MS));
+        }
+    };
+
+    connect();
+    return () => controller.abort();
+}
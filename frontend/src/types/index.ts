@@ -51,6 +51,7 @@ export interface Settings {
 
 export interface Signal {
     id: string;
+    ref: string;
     ticker: string;
     ff_value: number;
     front_iv: number;
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Chain Replay Script
+
+Replays recorded option chains through the scan pipeline (ScanWorker,
+StabilityTracker, compute_signals) with no Polygon calls, so a trading day
+can be re-run in minutes for profiling and regression checks.
+
+Chains are recorded into option_chain_snapshots while RECORD_CHAIN_SNAPSHOTS
+is enabled, and can be exported to JSON Lines files to replay elsewhere.
+Replays still use the configured database and Redis for subscribers, signals
+and stability state; point them at a scratch environment.
+
+Usage:
+    # Export a day of recorded chains to a file
+    python scripts/replay_chains.py export --start 2026-03-02 --end 2026-03-03 --out day.jsonl.gz
+
+    # Replay every snapshot in order (deterministic)
+    python scripts/replay_chains.py run day.jsonl.gz --step
+
+    # Replay straight from the database at 120x wall-clock speed
+    python scripts/replay_chains.py run --start 2026-03-02 --end 2026-03-03 --speed 120
+"""
+import asyncio
+import sys
+import argparse
+import time
+from pathlib import Path
+from typing import List, Optional
+from datetime import datetime, timezone
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import AsyncSessionLocal
+from app.providers.replay import ReplayFrame, ReplayProvider, read_frames, write_frames
+from app.services import SnapshotService
+from app.workers.scan_worker import ScanWorker
+
+
+def parse_ts(value: str) -> datetime:
+    """Parse an ISO date/timestamp, defaulting to UTC."""
+    ts = datetime.fromisoformat(value)
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+async def load_frames(
+    source: Optional[str],
+    start: Optional[datetime],
+    end: Optional[datetime],
+    tickers: Optional[List[str]]
+) -> List[ReplayFrame]:
+    """Load frames from a file/directory, or from the database."""
+    if source:
+        return read_frames(source, tickers)
+    async with AsyncSessionLocal() as db:
+        return await SnapshotService.get_frames(db, start, end, tickers)
+
+
+async def export(args) -> None:
+    """Write recorded chains from the database to a replay file."""
+    frames = await load_frames(None, args.start, args.end, args.tickers)
+    count = write_frames(args.out, frames)
+    print(f"✅ Exported {count} snapshots to {args.out}")
+
+
+async def replay(args) -> None:
+    """Run recorded chains through ScanWorker.scan_ticker."""
+    frames = await load_frames(args.source, args.start, args.end, args.tickers)
+    if not frames:
+        print("❌ No recorded snapshots found")
+        sys.exit(1)
+
+    provider = ReplayProvider(frames, speed=None if args.step else args.speed)
+    worker = ScanWorker(provider=provider)
+    print(f"🚀 Replaying {len(frames)} snapshots for {len(provider.tickers)} tickers "
+          f"({provider.start.isoformat()} → {provider.end.isoformat()})")
+
+    scans = 0
+    started = time.perf_counter()
+    try:
+        if args.step:
+            # Every snapshot exactly once, one per ticker per pass
+            for index in range(max(len(f) for f in provider.frames.values())):
+                for ticker in provider.tickers:
+                    if index < len(provider.frames[ticker]):
+                        await worker.scan_ticker(ticker)
+                        scans += 1
+        else:
+            while not provider.exhausted:
+                for ticker in provider.tickers:
+                    await worker.scan_ticker(ticker)
+                    scans += 1
+                await asyncio.sleep(args.interval)
+    finally:
+        await provider.close()
+
+    elapsed = time.perf_counter() - started
+    print("\n" + "="*60)
+    print(f"Summary:")
+    print(f"  📊 Scans: {scans}")
+    print(f"  ⏱️  Elapsed: {elapsed:.1f}s ({scans / elapsed if elapsed else 0:.1f} scans/s)")
+    print("="*60)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Export and replay recorded option chains",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Export recorded chains to a JSON Lines file")
+    export_parser.add_argument("--start", type=parse_ts, required=True, help="Earliest snapshot (inclusive)")
+    export_parser.add_argument("--end", type=parse_ts, required=True, help="Latest snapshot (exclusive)")
+    export_parser.add_argument("--out", required=True, help="Output file (*.jsonl or *.jsonl.gz)")
+
+    run_parser = subparsers.add_parser("run", help="Replay chains through the scan pipeline")
+    run_parser.add_argument("source", nargs="?", help="Replay file or directory (default: database)")
+    run_parser.add_argument("--start", type=parse_ts, help="Earliest snapshot when reading the database")
+    run_parser.add_argument("--end", type=parse_ts, help="Latest snapshot when reading the database")
+    run_parser.add_argument("--speed", type=float, default=60.0, help="Replay clock speed-up (default: 60)")
+    run_parser.add_argument("--step", action="store_true", help="Serve every snapshot once, ignoring time")
+    run_parser.add_argument("--interval", type=float, default=1.0, help="Wall-clock seconds between scan passes")
+
+    for sub in (export_parser, run_parser):
+        sub.add_argument("--tickers", type=lambda s: [t.strip().upper() for t in s.split(",") if t.strip()],
+                         default=None, help="Comma-separated tickers (default: all)")
+
+    args = parser.parse_args()
+    if args.command == "run" and not args.source and not (args.start and args.end):
+        parser.error("run needs a source file/directory or --start and --end")
+
+    asyncio.run(export(args) if args.command == "export" else replay(args))
+
+
+if __name__ == "__main__":
+    main()
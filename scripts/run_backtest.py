@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Forward Factor Backtest Script
+
+Sweeps a grid of user settings over recorded option chains (replay files or
+option_chain_snapshots, see scripts/replay_chains.py) and reports, for each
+combination, how many scans signalled, how many alerts survived the
+stability debounce/cooldown, and forward P&L proxies for those alerts.
+
+Usage:
+    # Default settings against a recorded day
+    python scripts/run_backtest.py day.jsonl.gz
+
+    # Sweep thresholds, pairs and stability settings from the database
+    python scripts/run_backtest.py --start 2026-03-02 --end 2026-04-01 \\
+        --ff-thresholds 0.1,0.15,0.2,0.3 --dte-pairs 30:60,30:90,60:90:10:10 \\
+        --required-scans 1,2,3 --cooldown-minutes 60,120,240 --csv sweep.csv
+"""
+import asyncio
+import csv
+import json
+import sys
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, List
+from datetime import datetime, timezone
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.backtest import ChainHistory, ParameterGrid, run_backtest
+from app.core.database import AsyncSessionLocal
+from app.providers.replay import read_frames
+from app.services import SnapshotService
+
+
+def parse_ts(value: str) -> datetime:
+    """Parse an ISO date/timestamp, defaulting to UTC."""
+    ts = datetime.fromisoformat(value)
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def parse_list(cast):
+    """Comma-separated values parsed with cast."""
+    return lambda value: [cast(v.strip()) for v in value.split(",") if v.strip()]
+
+
+def parse_dte_pairs(value: str) -> List[Dict[str, int]]:
+    """Pairs as front:back[:front_tol:back_tol], comma-separated."""
+    pairs = []
+    for item in value.split(","):
+        parts = [int(p) for p in item.split(":")]
+        if len(parts) not in (2, 4):
+            raise argparse.ArgumentTypeError(f"Invalid DTE pair: {item}")
+        front_tol, back_tol = parts[2:] if len(parts) == 4 else (5, 10)
+        pairs.append({"front": parts[0], "back": parts[1], "front_tol": front_tol, "back_tol": back_tol})
+    return pairs
+
+
+async def load_histories(args) -> List[ChainHistory]:
+    """Load recorded frames and build one columnar history per ticker."""
+    if args.source:
+        frames = read_frames(args.source, args.tickers)
+    else:
+        async with AsyncSessionLocal() as db:
+            frames = await SnapshotService.get_frames(db, args.start, args.end, args.tickers)
+    return ChainHistory.from_frames(frames, vol_points=args.vol_points)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Backtest Forward Factor settings over recorded chains",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("source", nargs="?", help="Replay file or directory (default: database)")
+    parser.add_argument("--start", type=parse_ts, help="Earliest snapshot when reading the database")
+    parser.add_argument("--end", type=parse_ts, help="Latest snapshot when reading the database")
+    parser.add_argument("--tickers", type=parse_list(str.upper), default=None, help="Comma-separated tickers")
+
+    defaults = ParameterGrid()
+    parser.add_argument("--vol-points", type=parse_list(str), default=defaults.vol_points)
+    parser.add_argument("--dte-pairs", type=parse_dte_pairs, default=defaults.dte_pairs)
+    parser.add_argument("--sigma-fwd-floors", type=parse_list(float), default=defaults.sigma_fwd_floors)
+    parser.add_argument("--ff-thresholds", type=parse_list(float), default=defaults.ff_thresholds)
+    parser.add_argument("--required-scans", type=parse_list(int), default=defaults.required_scans)
+    parser.add_argument("--cooldown-minutes", type=parse_list(float), default=defaults.cooldown_minutes)
+    parser.add_argument("--delta-ff-mins", type=parse_list(float), default=defaults.delta_ff_mins)
+
+    parser.add_argument("--horizon-minutes", type=float, default=1440.0, help="Holding period for P&L proxies")
+    parser.add_argument("--top", type=int, default=10, help="Combinations to print")
+    parser.add_argument("--sort-by", default="mean_return", choices=["mean_return", "hit_rate", "mean_ff_reversion"])
+    parser.add_argument("--min-alerts", type=int, default=5, help="Ignore combinations with fewer scored alerts")
+    parser.add_argument("--csv", help="Write every combination to this CSV file")
+    args = parser.parse_args()
+
+    if not args.source and not (args.start and args.end):
+        parser.error("need a source file/directory or --start and --end")
+
+    grid = ParameterGrid(
+        vol_points=args.vol_points,
+        dte_pairs=args.dte_pairs,
+        sigma_fwd_floors=args.sigma_fwd_floors,
+        ff_thresholds=args.ff_thresholds,
+        required_scans=args.required_scans,
+        cooldown_minutes=args.cooldown_minutes,
+        delta_ff_mins=args.delta_ff_mins
+    )
+
+    started = time.perf_counter()
+    histories = asyncio.run(load_histories(args))
+    if not histories:
+        print("❌ No recorded snapshots found")
+        sys.exit(1)
+    loaded = time.perf_counter()
+    result = run_backtest(histories, grid, args.horizon_minutes)
+    finished = time.perf_counter()
+
+    print(f"📊 {grid.size} combinations × {sum(h.n_snapshots for h in histories)} snapshots "
+          f"({len(histories)} tickers): loaded in {loaded - started:.1f}s, swept in {finished - loaded:.2f}s")
+    print("="*60)
+    for row in result.top(args.top, by=args.sort_by, min_alerts=args.min_alerts):
+        print(json.dumps(row))
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            rows = [result.row(i) for i in range(grid.size)]
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({**row, "dte_pair": json.dumps(row["dte_pair"])})
+        print(f"✅ Wrote {grid.size} rows to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
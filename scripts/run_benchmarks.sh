@@ -0,0 +1,34 @@
+#!/bin/bash
+set -e
+
+# Signal engine / provider parsing benchmarks (tests/benchmarks).
+#
+# Results are stored under .benchmarks/ (commit the baseline you want to protect).
+#   ./scripts/run_benchmarks.sh          Compare against the latest saved run; fail
+#                                        if any median regressed by more than
+#                                        BENCH_MAX_REGRESSION (default 15%)
+#   ./scripts/run_benchmarks.sh --save   Run and save the results as the new baseline
+
+BENCH_MAX_REGRESSION="${BENCH_MAX_REGRESSION:-15%}"
+PYTEST_ARGS=(tests/benchmarks --no-cov -p no:cacheprovider --benchmark-only --benchmark-sort=name)
+
+echo "==================================================================="
+echo "📈 Forward Factor - Benchmarks"
+echo "==================================================================="
+echo ""
+
+if [ "$1" == "--save" ]; then
+    echo "💾 Saving results as the new baseline..."
+    docker compose run --rm worker pytest "${PYTEST_ARGS[@]}" --benchmark-autosave
+elif ls .benchmarks/*/*.json >/dev/null 2>&1; then
+    echo "🔍 Comparing against the latest baseline (max regression: ${BENCH_MAX_REGRESSION})..."
+    docker compose run --rm worker pytest "${PYTEST_ARGS[@]}" \
+        --benchmark-compare \
+        --benchmark-compare-fail="median:${BENCH_MAX_REGRESSION}"
+else
+    echo "⚠️  No baseline in .benchmarks/ yet; run with --save to record one."
+    docker compose run --rm worker pytest "${PYTEST_ARGS[@]}"
+fi
+
+echo ""
+echo "✅ Benchmarks finished"
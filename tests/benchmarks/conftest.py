@@ -0,0 +1,19 @@
+"""Fixtures for the benchmark suite (synthetic chains of realistic size)."""
+from typing import List
+
+import pytest
+
+from app.providers.models import ChainSnapshot
+from tests.synthetic import make_chain, make_polygon_results
+
+
+@pytest.fixture(scope="session")
+def polygon_results() -> List[dict]:
+    """Raw Polygon results for the default 100 x 200 chain."""
+    return make_polygon_results()
+
+
+@pytest.fixture(scope="session")
+def chain() -> ChainSnapshot:
+    """Parsed default 100 x 200 chain."""
+    return make_chain()
@@ -0,0 +1,33 @@
+"""Benchmarks for Polygon snapshot parsing.
+
+Run with ./scripts/run_benchmarks.sh to compare against the saved baseline.
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from app.providers.polygon import PolygonProvider
+
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture(scope="module")
+def provider():
+    """Provider used only for its (pure) parsing methods."""
+    return PolygonProvider(api_key="bench")
+
+
+def test_parse_contracts(benchmark, provider, polygon_results):
+    """Parse 40,000 raw contracts into Contract objects."""
+    contracts = benchmark(provider._parse_contracts, polygon_results)
+
+    assert len(contracts) == len(polygon_results)
+
+
+def test_group_by_expiry(benchmark, provider, polygon_results):
+    """Group 40,000 contracts into sorted expiries."""
+    contracts = provider._parse_contracts(polygon_results)
+
+    expiries = benchmark(provider._group_by_expiry, contracts)
+
+    assert len(expiries) == 100
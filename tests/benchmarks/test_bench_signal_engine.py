@@ -0,0 +1,52 @@
+"""Benchmarks for the signal engine on a 100 expiry x 200 strike chain.
+
+Run with ./scripts/run_benchmarks.sh to compare against the saved baseline.
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from app.services.signal_engine import compute_signals, pair_expiries, select_vol_point
+from tests.synthetic import DTE_PAIR_SETS, make_user_settings
+
+pytestmark = pytest.mark.slow
+
+
+def test_pair_expiries(benchmark, chain):
+    """Pair three DTE windows against 100 expiries."""
+    pairs = benchmark(pair_expiries, chain, DTE_PAIR_SETS[2])
+
+    assert len(pairs) == 3
+
+
+@pytest.mark.parametrize("method", ["ATM", "35d_put", "35d_call"])
+def test_select_vol_point(benchmark, chain, method):
+    """Select a vol point from one 400-contract expiry."""
+    expiry = chain.expiries[40]
+
+    iv = benchmark(select_vol_point, expiry, chain.underlying_price, method)
+
+    assert iv is not None
+
+
+def test_compute_signals(benchmark, chain):
+    """Compute signals for one user with three DTE pairs."""
+    settings = make_user_settings(1)[0]
+    settings.update(dte_pairs=DTE_PAIR_SETS[2], vol_point="ATM", ff_threshold=0.0)
+
+    signals = benchmark(compute_signals, chain, settings)
+
+    assert signals
+
+
+@pytest.mark.parametrize("n_users", [1, 10, 100, 1000])
+def test_settings_fan_out(benchmark, chain, n_users):
+    """Compute signals for every subscriber of a ticker, as scan_ticker does."""
+    users = make_user_settings(n_users)
+
+    def fan_out():
+        return [compute_signals(chain, settings) for settings in users]
+
+    results = benchmark.pedantic(fan_out, rounds=3 if n_users >= 1000 else 10, iterations=1)
+
+    assert len(results) == n_users
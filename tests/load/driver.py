@@ -0,0 +1,406 @@
+"""End-to-end load test driver.
+
+Seeds N users, M tickers and subscriptions, starts the fake Polygon and fake
+Telegram servers, runs the scheduler, scan workers and notification routers
+together in this process, and reports throughput and latency percentiles.
+
+Needs Postgres and Redis (DATABASE_URL / REDIS_URL). Use disposable instances:
+load data is tagged (loadtest+N@example.com users, LT* tickers) and removed
+afterwards, but scans and alerts share the real queues while the run lasts.
+
+Usage:
+    python -m tests.load.driver --users 1000 --tickers 100 --scan-workers 4 --duration 120
+    python -m tests.load.driver --polygon-latency-ms 150 --polygon-rate-limit 50 --json report.json
+    python -m tests.load.driver --unchanged-chain-skip-minutes 15  # Measure with the unchanged-chain skip on
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import string
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import uvicorn
+from sqlalchemy import delete, insert, select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.metrics import PROCESS_ROLE, SCANS, SCAN_DURATION, POLYGON_REQUEST_DURATION, PIPELINE_STAGE_DURATION
+from app.core.redis import get_redis
+from app.core.tracing import PIPELINE_STAGES
+from app.models import User, UserSettings, Subscription, Signal
+from app.models.telegram_chat import TelegramChat
+from app.models.ticker import MasterTicker
+from app.scheduler.main import ScanScheduler
+from app.workers.notification_router import NotificationRouter
+from app.workers.scan_worker import ScanWorker
+from tests.load.fake_polygon import FakePolygonConfig, create_fake_polygon_app
+from tests.load.fake_telegram import create_fake_telegram_app
+from tests.synthetic import make_user_settings
+
+logger = logging.getLogger("loadtest")
+
+EMAIL_PATTERN = "loadtest+{}@example.com"
+TICKER_PREFIX = "LT"
+CHAT_ID_BASE = 900_000_000
+
+
+# ============================================================================
+# Seeding
+# ============================================================================
+
+def load_tickers(count: int) -> List[str]:
+    """Deterministic 5-letter tickers: LTAAA, LTAAB, ..."""
+    tickers = []
+    for i in range(count):
+        a, rest = divmod(i, 26 * 26)
+        b, c = divmod(rest, 26)
+        tickers.append(TICKER_PREFIX + string.ascii_uppercase[a % 26] + string.ascii_uppercase[b] + string.ascii_uppercase[c])
+    return tickers
+
+
+async def cleanup(tickers: List[str]) -> None:
+    """Remove every row and Redis key a previous run may have left behind."""
+    redis = await get_redis()
+
+    async with AsyncSessionLocal() as db:
+        # Release today's dedupe claims so the next run alerts again
+        result = await db.execute(
+            select(Signal.dedupe_key, Signal.as_of_ts).where(Signal.ticker.in_(tickers))
+        )
+        pipe = redis.pipeline(transaction=False)
+        for dedupe_key, as_of_ts in result.all():
+            pipe.srem(f"signal_dedupe:{as_of_ts.strftime('%Y-%m-%d')}", dedupe_key)
+        for ticker in tickers:
+            pipe.lrem("scan_queue", 0, ticker)
+        await pipe.execute()
+
+        await db.execute(delete(Signal).where(Signal.ticker.in_(tickers)))
+        await db.execute(delete(Subscription).where(Subscription.ticker.in_(tickers)))
+        await db.execute(delete(MasterTicker).where(MasterTicker.ticker.in_(tickers)))
+        await db.execute(delete(User).where(User.email.like(EMAIL_PATTERN.format("%"))))
+        await db.commit()
+
+    async for key in redis.scan_iter(match=f"stability:{TICKER_PREFIX}*"):
+        await redis.delete(key)
+    async for key in redis.scan_iter(match=f"scan_fingerprint:*:{TICKER_PREFIX}*"):
+        await redis.delete(key)
+
+
+async def seed(
+    n_users: int,
+    tickers: List[str],
+    subscriptions_per_user: int,
+    stability_scans: int,
+    seed_value: int
+) -> int:
+    """
+    Insert users (with settings and a linked chat), subscriptions and tickers.
+
+    Returns:
+        Number of subscriptions created
+    """
+    rng = random.Random(seed_value)
+    now = datetime.now(timezone.utc)
+    users, user_settings, chats, subscriptions = [], [], [], []
+    subscriber_counts: Dict[str, int] = {ticker: 0 for ticker in tickers}
+
+    for i, engine_settings in enumerate(make_user_settings(n_users, seed=seed_value)):
+        user_id = str(uuid.uuid4())
+        users.append({"id": user_id, "email": EMAIL_PATTERN.format(i), "status": "active", "created_at": now})
+        user_settings.append({
+            "user_id": user_id,
+            **engine_settings,
+            "stability_scans": stability_scans,
+            "cooldown_minutes": settings.default_cooldown_minutes,
+            "timezone": "UTC",
+            "quiet_hours": {"enabled": False, "start": "22:00", "end": "08:00"},
+            "scan_priority": "standard",
+            "discovery_mode": False
+        })
+        chats.append({
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "chat_id": str(CHAT_ID_BASE + i),
+            "first_name": f"Load{i}",
+            "linked_at": now
+        })
+        for ticker in rng.sample(tickers, min(subscriptions_per_user, len(tickers))):
+            subscriptions.append({"user_id": user_id, "ticker": ticker, "active": True, "added_at": now})
+            subscriber_counts[ticker] += 1
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(User), users)
+        await db.execute(insert(UserSettings), user_settings)
+        await db.execute(insert(TelegramChat), chats)
+        await db.execute(insert(MasterTicker), [
+            {"ticker": ticker, "active_subscriber_count": count, "scan_tier": "high"}
+            for ticker, count in subscriber_counts.items()
+        ])
+        if subscriptions:
+            await db.execute(insert(Subscription), subscriptions)
+        await db.commit()
+
+    return len(subscriptions)
+
+
+# ============================================================================
+# Fake servers
+# ============================================================================
+
+async def serve(app, port: int) -> Tuple[uvicorn.Server, asyncio.Task, int]:
+    """Start an ASGI app on localhost; returns (server, task, bound port)."""
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="off"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+    bound_port = server.servers[0].sockets[0].getsockname()[1]
+    return server, task, bound_port
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+def histogram_buckets(histogram, **labels) -> List[Tuple[float, float]]:
+    """Cumulative (upper bound, count) pairs summed over matching series."""
+    counts: Dict[float, float] = {}
+    for metric in histogram.collect():
+        for sample in metric.samples:
+            if not sample.name.endswith("_bucket"):
+                continue
+            if any(sample.labels.get(name) != value for name, value in labels.items()):
+                continue
+            bound = float(sample.labels["le"])
+            counts[bound] = counts.get(bound, 0.0) + sample.value
+    return sorted(counts.items())
+
+
+def bucket_delta(after: List[Tuple[float, float]], before: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """Buckets observed between two snapshots."""
+    earlier = dict(before)
+    return [(bound, count - earlier.get(bound, 0.0)) for bound, count in after]
+
+
+def bucket_quantile(q: float, buckets: List[Tuple[float, float]]) -> Optional[float]:
+    """Estimate a quantile from cumulative buckets, like PromQL histogram_quantile."""
+    if not buckets or buckets[-1][1] <= 0:
+        return None
+    rank = q * buckets[-1][1]
+    lower_bound, lower_count = 0.0, 0.0
+    for bound, count in buckets:
+        if count >= rank:
+            if bound == float("inf"):
+                return lower_bound
+            if count == lower_count:
+                return bound
+            return lower_bound + (bound - lower_bound) * (rank - lower_count) / (count - lower_count)
+        lower_bound, lower_count = bound, count
+    return lower_bound
+
+
+def exact_quantile(q: float, values: List[float]) -> Optional[float]:
+    """Nearest-rank quantile of raw samples."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))]
+
+
+def scan_counts() -> Dict[str, float]:
+    """ffbot_scans_total by result for this process."""
+    counts: Dict[str, float] = {}
+    for metric in SCANS.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_total") and sample.labels.get("role") == PROCESS_ROLE:
+                result = sample.labels["result"]
+                counts[result] = counts.get(result, 0.0) + sample.value
+    return counts
+
+
+def histogram_snapshots() -> Dict[str, List[Tuple[float, float]]]:
+    """Bucket snapshots of every latency reported."""
+    snapshots = {
+        "scan": histogram_buckets(SCAN_DURATION, role=PROCESS_ROLE),
+        "polygon_request": histogram_buckets(POLYGON_REQUEST_DURATION, role=PROCESS_ROLE),
+    }
+    for stage in PIPELINE_STAGES:
+        snapshots[f"stage_{stage}"] = histogram_buckets(PIPELINE_STAGE_DURATION, role=PROCESS_ROLE, stage=stage)
+    return snapshots
+
+
+# ============================================================================
+# Run
+# ============================================================================
+
+async def enqueue_loop(scheduler: ScanScheduler, interval: float) -> None:
+    """Run the scheduler's high-tier job at the load test cadence."""
+    while True:
+        await scheduler.enqueue_tier_scans("high")
+        await asyncio.sleep(interval)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """Seed, run the pipeline for the configured duration and build the report."""
+    tickers = load_tickers(args.tickers)
+
+    polygon_app = create_fake_polygon_app(FakePolygonConfig(
+        latency_ms=args.polygon_latency_ms,
+        jitter_ms=args.polygon_jitter_ms,
+        rate_limit=args.polygon_rate_limit,
+        error_429_rate=args.polygon_429_rate,
+        n_expiries=args.expiries,
+        n_strikes=args.strikes,
+        chains_dir=args.chains_dir,
+        tickers=tickers,
+        seed=args.seed
+    ))
+    telegram_app = create_fake_telegram_app(args.telegram_latency_ms)
+    polygon_server, polygon_task, polygon_port = await serve(polygon_app, args.polygon_port)
+    telegram_server, telegram_task, telegram_port = await serve(telegram_app, args.telegram_port)
+
+    # Workers read these when constructed
+    settings.polygon_base_url = f"http://127.0.0.1:{polygon_port}"
+    settings.telegram_api_base_url = f"http://127.0.0.1:{telegram_port}/bot"
+    # Off by default so every scan computes, persists and notifies
+    settings.unchanged_chain_skip_minutes = args.unchanged_chain_skip_minutes
+
+    await cleanup(tickers)
+    n_subscriptions = await seed(args.users, tickers, args.subscriptions_per_user, args.stability_scans, args.seed)
+    logger.warning(f"Seeded {args.users} users, {len(tickers)} tickers, {n_subscriptions} subscriptions")
+
+    scans_before = scan_counts()
+    histograms_before = histogram_snapshots()
+
+    scheduler = ScanScheduler()
+    workers = [ScanWorker() for _ in range(args.scan_workers)]
+    routers = [NotificationRouter() for _ in range(args.routers)]
+    tasks = [asyncio.create_task(worker.run()) for worker in workers]
+    tasks += [asyncio.create_task(router.run()) for router in routers]
+    tasks.append(asyncio.create_task(enqueue_loop(scheduler, args.scan_interval)))
+
+    started = time.monotonic()
+    try:
+        await asyncio.sleep(args.duration)
+    finally:
+        elapsed = time.monotonic() - started
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        redis = await get_redis()
+        scan_backlog = await redis.llen("scan_queue")
+        notification_backlog = await redis.llen("notification_queue")
+
+        if not args.keep_data:
+            await cleanup(tickers)
+        polygon_server.should_exit = True
+        telegram_server.should_exit = True
+        await asyncio.gather(polygon_task, telegram_task)
+
+    scans_after = scan_counts()
+    scans = {result: scans_after.get(result, 0.0) - scans_before.get(result, 0.0) for result in scans_after}
+    total_scans = sum(scans.values())
+    messages = telegram_app.state.telegram.messages
+    alert_latencies = [m.alert_latency for m in messages if m.alert_latency is not None]
+
+    latencies = {}
+    histograms_after = histogram_snapshots()
+    for name, after in histograms_after.items():
+        buckets = bucket_delta(after, histograms_before.get(name, []))
+        if buckets and buckets[-1][1] > 0:
+            latencies[name] = {
+                "count": int(buckets[-1][1]),
+                "p50": bucket_quantile(0.50, buckets),
+                "p99": bucket_quantile(0.99, buckets)
+            }
+    if alert_latencies:
+        latencies["alert_end_to_end"] = {
+            "count": len(alert_latencies),
+            "p50": exact_quantile(0.50, alert_latencies),
+            "p99": exact_quantile(0.99, alert_latencies)
+        }
+
+    polygon_stats = polygon_app.state.stats
+    return {
+        "config": {key: value for key, value in vars(args).items() if key != "json"},
+        "duration_seconds": round(elapsed, 3),
+        "scans": {result: int(count) for result, count in scans.items()},
+        "scans_per_second": total_scans / elapsed if elapsed else 0.0,
+        "alerts": len(messages),
+        "alerts_per_second": len(messages) / elapsed if elapsed else 0.0,
+        "polygon": {
+            "requests": polygon_stats.requests,
+            "rate_limited": polygon_stats.rate_limited,
+            "by_endpoint": polygon_stats.by_endpoint
+        },
+        "backlog": {"scan_queue": scan_backlog, "notification_queue": notification_backlog},
+        "latency_seconds": latencies
+    }
+
+
+def print_report(report: dict) -> None:
+    """Print the report as a readable table."""
+    print("=" * 60)
+    print(f"Load test: {report['duration_seconds']:.1f}s")
+    print("=" * 60)
+    print(f"Scans:   {sum(report['scans'].values())} ({report['scans_per_second']:.2f}/s)  {report['scans']}")
+    print(f"Alerts:  {report['alerts']} ({report['alerts_per_second']:.2f}/s)")
+    print(f"Polygon: {report['polygon']['requests']} requests, {report['polygon']['rate_limited']} rate limited")
+    print(f"Backlog: {report['backlog']}")
+    print("-" * 60)
+    print(f"{'latency (s)':<24}{'count':>8}{'p50':>12}{'p99':>12}")
+    for name, stats in report["latency_seconds"].items():
+        p50 = f"{stats['p50']:.4f}" if stats["p50"] is not None else "-"
+        p99 = f"{stats['p99']:.4f}" if stats["p99"] is not None else "-"
+        print(f"{name:<24}{stats['count']:>8}{p50:>12}{p99:>12}")
+    print("=" * 60)
+
+
+def main():
+    """Parse arguments, run the load test and print the report."""
+    parser = argparse.ArgumentParser(description="End-to-end load test with fake Polygon and Telegram")
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--tickers", type=int, default=50)
+    parser.add_argument("--subscriptions-per-user", type=int, default=5)
+    parser.add_argument("--stability-scans", type=int, default=1, help="Scans before a signal alerts")
+    parser.add_argument("--scan-workers", type=int, default=4)
+    parser.add_argument("--routers", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to run")
+    parser.add_argument("--scan-interval", type=float, default=10.0, help="Seconds between scheduler enqueues")
+    parser.add_argument(
+        "--unchanged-chain-skip-minutes", type=int, default=0,
+        help="Let scans of an unchanged chain skip for this long (0 always runs the full scan)"
+    )
+    parser.add_argument("--polygon-port", type=int, default=0, help="0 picks a free port")
+    parser.add_argument("--polygon-latency-ms", type=float, default=50.0)
+    parser.add_argument("--polygon-jitter-ms", type=float, default=20.0)
+    parser.add_argument("--polygon-rate-limit", type=float, default=None, help="Requests/second before 429s")
+    parser.add_argument("--polygon-429-rate", type=float, default=0.0)
+    parser.add_argument("--expiries", type=int, default=30)
+    parser.add_argument("--strikes", type=int, default=60)
+    parser.add_argument("--chains-dir", default=None, help="Serve recorded <TICKER>.json snapshots")
+    parser.add_argument("--telegram-port", type=int, default=0, help="0 picks a free port")
+    parser.add_argument("--telegram-latency-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--keep-data", action="store_true", help="Leave seeded rows in place")
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--json", default=None, help="Also write the report to this file")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(args.log_level)
+    report = asyncio.run(run(args))
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Local stand-in for the Polygon API used by the load harness.
+
+Serves the three endpoints PolygonProvider calls, with synthetic chains (see
+tests/synthetic.py) or recorded snapshot responses, configurable latency and
+429 rate limiting. Point POLYGON_BASE_URL at it, or let the driver start it.
+
+Usage:
+    python -m tests.load.fake_polygon --port 9001 --latency-ms 80 --rate-limit 50
+"""
+import argparse
+import asyncio
+import random
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import orjson
+import uvicorn
+from fastapi import FastAPI, Response
+
+from tests.synthetic import make_polygon_results
+
+
+@dataclass
+class FakePolygonConfig:
+    """Behaviour of the fake Polygon server."""
+    latency_ms: float = 50.0  # Mean response latency
+    jitter_ms: float = 20.0  # Uniform +/- jitter around the mean
+    rate_limit: Optional[float] = None  # Requests/second before 429s (token bucket)
+    error_429_rate: float = 0.0  # Fraction of requests answered with a random 429
+    n_expiries: int = 30  # Synthetic chain shape
+    n_strikes: int = 60
+    chains_dir: Optional[str] = None  # Recorded "<TICKER>.json" snapshot responses
+    tickers: List[str] = field(default_factory=list)  # Universe for grouped aggregates
+    seed: int = 42
+
+
+@dataclass
+class FakePolygonStats:
+    """Request counters, read by the driver for its report."""
+    requests: int = 0
+    rate_limited: int = 0
+    by_endpoint: Dict[str, int] = field(default_factory=dict)
+
+
+def underlying_price(ticker: str) -> float:
+    """Deterministic spot price per ticker (20-500)."""
+    return 20.0 + zlib.crc32(ticker.encode()) % 48000 / 100.0
+
+
+def create_fake_polygon_app(config: FakePolygonConfig) -> FastAPI:
+    """
+    Build the fake Polygon ASGI app.
+
+    Args:
+        config: Latency, rate limiting and chain settings
+
+    Returns:
+        FastAPI app; request counters are on app.state.stats
+    """
+    app = FastAPI(title="Fake Polygon")
+    stats = FakePolygonStats()
+    rng = random.Random(config.seed)
+    chains: Dict[str, bytes] = {}
+    bucket = {"tokens": config.rate_limit or 0.0, "updated": time.monotonic()}
+    app.state.stats = stats
+
+    def rate_limited() -> bool:
+        """Token bucket refilled at rate_limit/s, plus random 429s."""
+        if config.error_429_rate and rng.random() < config.error_429_rate:
+            return True
+        if not config.rate_limit:
+            return False
+        now = time.monotonic()
+        bucket["tokens"] = min(
+            config.rate_limit,
+            bucket["tokens"] + (now - bucket["updated"]) * config.rate_limit
+        )
+        bucket["updated"] = now
+        if bucket["tokens"] < 1:
+            return True
+        bucket["tokens"] -= 1
+        return False
+
+    async def respond(endpoint: str, body: bytes) -> Response:
+        """Apply latency and rate limiting to a prepared JSON body."""
+        stats.requests += 1
+        stats.by_endpoint[endpoint] = stats.by_endpoint.get(endpoint, 0) + 1
+
+        if rate_limited():
+            stats.rate_limited += 1
+            return Response(
+                orjson.dumps({"status": "ERROR", "error": "You've exceeded the maximum requests per minute"}),
+                status_code=429,
+                media_type="application/json"
+            )
+
+        delay = config.latency_ms + rng.uniform(-config.jitter_ms, config.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000.0)
+        return Response(body, media_type="application/json")
+
+    def chain_body(ticker: str) -> bytes:
+        """Snapshot response for a ticker, built once and cached as bytes."""
+        if ticker not in chains:
+            recorded = Path(config.chains_dir) / f"{ticker}.json" if config.chains_dir else None
+            if recorded is not None and recorded.exists():
+                chains[ticker] = recorded.read_bytes()
+            else:
+                results = make_polygon_results(
+                    n_expiries=config.n_expiries,
+                    n_strikes=config.n_strikes,
+                    seed=config.seed + zlib.crc32(ticker.encode()),
+                    ticker=ticker,
+                    underlying_price=underlying_price(ticker)
+                )
+                chains[ticker] = orjson.dumps({"status": "OK", "results": results})
+        return chains[ticker]
+
+    @app.get("/v2/aggs/ticker/{ticker}/prev")
+    async def previous_close(ticker: str):
+        body = orjson.dumps({
+            "status": "OK",
+            "results": [{"T": ticker, "c": underlying_price(ticker)}]
+        })
+        return await respond("prev", body)
+
+    @app.get("/v3/snapshot/options/{ticker}")
+    async def options_snapshot(ticker: str):
+        return await respond("snapshot", chain_body(ticker))
+
+    @app.get("/v2/aggs/grouped/locale/us/market/stocks/{day}")
+    async def grouped_daily(day: str):
+        body = orjson.dumps({
+            "status": "OK",
+            "results": [
+                {"T": ticker, "c": underlying_price(ticker), "v": 1_000_000 + zlib.crc32(ticker.encode()) % 9_000_000}
+                for ticker in config.tickers
+            ]
+        })
+        return await respond("grouped", body)
+
+    return app
+
+
+def main():
+    """Run the fake Polygon server standalone."""
+    parser = argparse.ArgumentParser(description="Fake Polygon API for load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9001)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--rate-limit", type=float, default=None, help="Requests/second before 429s")
+    parser.add_argument("--error-429-rate", type=float, default=0.0)
+    parser.add_argument("--expiries", type=int, default=30)
+    parser.add_argument("--strikes", type=int, default=60)
+    parser.add_argument("--chains-dir", default=None, help="Directory of recorded <TICKER>.json responses")
+    parser.add_argument("--tickers", default="", help="Comma-separated universe for grouped aggregates")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    config = FakePolygonConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit=args.rate_limit,
+        error_429_rate=args.error_429_rate,
+        n_expiries=args.expiries,
+        n_strikes=args.strikes,
+        chains_dir=args.chains_dir,
+        tickers=[t for t in args.tickers.split(",") if t],
+        seed=args.seed
+    )
+    uvicorn.run(create_fake_polygon_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Local stand-in for the Telegram Bot API used by the load harness.
+
+Accepts every Bot API call, answers sendMessage like Telegram does and
+records each alert with its arrival time. Point TELEGRAM_API_BASE_URL at
+http://<host>:<port>/bot, or let the driver start it.
+
+Usage:
+    python -m tests.load.fake_telegram --port 9002
+"""
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+
+from app.utils.signal_ref import decode_signal_ref
+
+
+@dataclass
+class SentMessage:
+    """A message the bot sent, as seen by the fake server."""
+    received_at: float  # Wall clock (seconds since the epoch)
+    chat_id: str
+    signal_ref: Optional[str]  # From the "place:<ref>" button, if any
+
+    @property
+    def alert_latency(self) -> Optional[float]:
+        """Seconds from the signal's chain snapshot to this message."""
+        if self.signal_ref is None:
+            return None
+        _, as_of_ts = decode_signal_ref(self.signal_ref)
+        if as_of_ts is None:
+            return None
+        return self.received_at - as_of_ts.timestamp()
+
+
+@dataclass
+class FakeTelegramState:
+    """Everything the fake server received."""
+    messages: List[SentMessage] = field(default_factory=list)
+    calls: int = 0
+
+
+def _signal_ref(reply_markup: Optional[str]) -> Optional[str]:
+    """Pull the signal ref out of a "place:<ref>" inline button."""
+    if not reply_markup:
+        return None
+    for row in json.loads(reply_markup).get("inline_keyboard", []):
+        for button in row:
+            action, _, ref = button.get("callback_data", "").partition(":")
+            if action == "place" and ref:
+                return ref
+    return None
+
+
+def create_fake_telegram_app(latency_ms: float = 0.0) -> FastAPI:
+    """
+    Build the fake Telegram Bot API ASGI app.
+
+    Args:
+        latency_ms: Delay added to every call
+
+    Returns:
+        FastAPI app; received messages are on app.state.telegram
+    """
+    app = FastAPI(title="Fake Telegram")
+    state = FakeTelegramState()
+    app.state.telegram = state
+
+    @app.post("/bot{token}/{method}")
+    async def bot_api(token: str, method: str, request: Request):
+        received_at = time.time()
+        state.calls += 1
+        params = dict(await request.form())
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000.0)
+
+        if method == "getMe":
+            return {"ok": True, "result": {"id": 1, "is_bot": True, "first_name": "Fake", "username": "fake_bot"}}
+        if method == "getUpdates":
+            return {"ok": True, "result": []}
+        if method != "sendMessage":
+            return {"ok": True, "result": True}
+
+        chat_id = str(params.get("chat_id", ""))
+        state.messages.append(SentMessage(
+            received_at=received_at,
+            chat_id=chat_id,
+            signal_ref=_signal_ref(params.get("reply_markup"))
+        ))
+        return {
+            "ok": True,
+            "result": {
+                "message_id": len(state.messages),
+                "date": int(received_at),
+                "chat": {"id": int(chat_id) if chat_id.lstrip("-").isdigit() else 0, "type": "private"},
+                "text": params.get("text", "")
+            }
+        }
+
+    return app
+
+
+def main():
+    """Run the fake Telegram server standalone."""
+    parser = argparse.ArgumentParser(description="Fake Telegram Bot API for load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9002)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    uvicorn.run(create_fake_telegram_app(args.latency_ms), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Deterministic synthetic option chains (Polygon payloads and ChainSnapshots).
+
+Shared by the benchmark suite and the load test harness.
+"""
+import math
+import random
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from app.providers.models import ChainSnapshot, Contract, Expiry
+
+# Default chain shape: 100 expiries x 200 strikes, calls and puts (40,000 contracts)
+N_EXPIRIES = 100
+N_STRIKES = 200
+UNDERLYING_PRICE = 450.0
+
+# Settings variants users pick in practice (see docs/strategy.md)
+DTE_PAIR_SETS = [
+    [{"front": 30, "back": 60, "front_tol": 5, "back_tol": 10}],
+    [{"front": 30, "back": 60, "front_tol": 5, "back_tol": 10},
+     {"front": 60, "back": 90, "front_tol": 5, "back_tol": 10}],
+    [{"front": 7, "back": 30, "front_tol": 2, "back_tol": 5},
+     {"front": 30, "back": 90, "front_tol": 5, "back_tol": 10},
+     {"front": 90, "back": 180, "front_tol": 10, "back_tol": 20}],
+]
+VOL_POINTS = ["ATM", "35d_put", "35d_call"]
+
+
+def _norm_cdf(x: float) -> float:
+    """Standard normal CDF."""
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+
+def _expiry_days(n_expiries: int) -> List[int]:
+    """Weeklies first, then monthlies and LEAPS-like tails (strictly increasing)."""
+    days = []
+    dte = 1
+    for i in range(n_expiries):
+        days.append(dte)
+        dte += 1 if i < 20 else 7 if i < 60 else 14
+    return days
+
+
+def _contract_fields(
+    rng: random.Random,
+    underlying_price: float,
+    strike: float,
+    dte: int,
+    option_type: str
+) -> Dict[str, Any]:
+    """IV (term structure plus smile), delta and quotes for one contract."""
+    t = dte / 365.0
+    moneyness = math.log(strike / underlying_price)
+    # Backwardated front end so some pairs produce signals
+    iv = 0.20 + 0.12 * math.exp(-dte / 30.0) + 0.4 * moneyness ** 2 + rng.uniform(-0.005, 0.005)
+    d1 = (-moneyness + 0.5 * iv * iv * t) / (iv * math.sqrt(t))
+    delta = _norm_cdf(d1) if option_type == "call" else _norm_cdf(d1) - 1.0
+    mid = max(underlying_price * iv * math.sqrt(t) * 0.4 * math.exp(-abs(moneyness) * 5), 0.05)
+    return {
+        "iv": iv,
+        "delta": delta,
+        "bid": round(mid * 0.98, 2),
+        "ask": round(mid * 1.02, 2),
+        "volume": rng.randint(0, 5000),
+        "open_interest": rng.randint(0, 20000),
+    }
+
+
+def make_polygon_results(
+    n_expiries: int = N_EXPIRIES,
+    n_strikes: int = N_STRIKES,
+    seed: int = 42,
+    ticker: str = "SPY",
+    underlying_price: float = UNDERLYING_PRICE
+) -> List[dict]:
+    """
+    Build raw Polygon /v3/snapshot/options results for a synthetic chain.
+
+    Args:
+        n_expiries: Number of expiries
+        n_strikes: Strikes per expiry (each with a call and a put)
+        seed: RNG seed, so every run produces identical data
+        ticker: Underlying symbol used in contract tickers
+        underlying_price: Spot price the strikes are centred on
+
+    Returns:
+        List of result dicts in Polygon's snapshot format
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    strikes = [underlying_price * (0.5 + i / n_strikes) for i in range(n_strikes)]
+    results = []
+
+    for dte in _expiry_days(n_expiries):
+        expiry = today + timedelta(days=dte)
+        for strike in strikes:
+            for option_type in ("call", "put"):
+                fields = _contract_fields(rng, underlying_price, strike, dte, option_type)
+                results.append({
+                    "details": {
+                        "ticker": f"O:{ticker}{expiry:%y%m%d}{option_type[0].upper()}{int(strike * 1000):08d}",
+                        "strike_price": strike,
+                        "expiration_date": expiry.isoformat(),
+                        "contract_type": option_type,
+                    },
+                    "greeks": {
+                        "implied_volatility": fields["iv"],
+                        "delta": fields["delta"],
+                        "gamma": 0.01,
+                        "theta": -0.05,
+                        "vega": 0.15,
+                    },
+                    "last_quote": {"bid": fields["bid"], "ask": fields["ask"]},
+                    "last_trade": {"price": (fields["bid"] + fields["ask"]) / 2},
+                    "day": {"volume": fields["volume"]},
+                    "open_interest": fields["open_interest"],
+                })
+
+    return results
+
+
+def make_chain(
+    n_expiries: int = N_EXPIRIES,
+    n_strikes: int = N_STRIKES,
+    seed: int = 42,
+    ticker: str = "SPY",
+    underlying_price: float = UNDERLYING_PRICE
+) -> ChainSnapshot:
+    """Build a ChainSnapshot with the same data as make_polygon_results()."""
+    rng = random.Random(seed)
+    today = date.today()
+    strikes = [underlying_price * (0.5 + i / n_strikes) for i in range(n_strikes)]
+    expiries = []
+
+    for dte in _expiry_days(n_expiries):
+        expiry_date = today + timedelta(days=dte)
+        contracts = []
+        for strike in strikes:
+            for option_type in ("call", "put"):
+                fields = _contract_fields(rng, underlying_price, strike, dte, option_type)
+                contracts.append(Contract(
+                    symbol=f"{ticker}{expiry_date:%y%m%d}{option_type[0].upper()}{int(strike * 1000):08d}",
+                    strike=strike,
+                    expiry=expiry_date,
+                    option_type=option_type,
+                    bid=fields["bid"],
+                    ask=fields["ask"],
+                    last=(fields["bid"] + fields["ask"]) / 2,
+                    volume=fields["volume"],
+                    open_interest=fields["open_interest"],
+                    implied_volatility=fields["iv"],
+                    delta=fields["delta"],
+                    gamma=0.01,
+                    theta=-0.05,
+                    vega=0.15
+                ))
+        expiries.append(Expiry(expiry_date=expiry_date, dte=dte, contracts=contracts))
+
+    return ChainSnapshot(
+        ticker=ticker,
+        as_of=datetime.now(timezone.utc),
+        underlying_price=underlying_price,
+        expiries=expiries,
+        provider="synthetic"
+    )
+
+
+def make_user_settings(n_users: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """Settings for n_users users, mixing DTE pairs, vol points and filters."""
+    rng = random.Random(seed)
+    return [
+        {
+            "ff_threshold": rng.choice([0.10, 0.15, 0.20, 0.30]),
+            "dte_pairs": rng.choice(DTE_PAIR_SETS),
+            "vol_point": rng.choice(VOL_POINTS),
+            "min_open_interest": rng.choice([0, 100, 500]),
+            "min_volume": rng.choice([0, 10, 100]),
+            "max_bid_ask_pct": rng.choice([0.05, 0.08, 0.15]),
+            "sigma_fwd_floor": 0.05,
+        }
+        for _ in range(n_users)
+    ]
@@ -230,3 +230,25 @@ class TestGetMe:
         assert response["id"] == mock_user.id
         assert response["link_code"] == "code-123"
         assert response["telegram_chats"] == []
+
+
+# ============================================================================
+# Tests for POST /logout
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLogout:
+    """Test logout endpoint."""
+    
+    async def test_logout_invalidates_user_cache(self, mock_user):
+        """✅ Logout drops the user from the authenticated-user cache."""
+        with patch("app.api.routes.auth.auth_user_cache") as cache:
+            cache.invalidate = AsyncMock()
+            
+            from app.api.routes.auth import logout
+            
+            response = await logout(mock_user)
+        
+        cache.invalidate.assert_awaited_once_with("user-123")
+        assert response["message"] == "Logged out"
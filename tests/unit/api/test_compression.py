@@ -0,0 +1,161 @@
+"""Unit tests for the response compression middleware.
+
+This module tests CompressionMiddleware on a minimal app: encoding
+negotiation, the size threshold and streamed responses.
+"""
+import asyncio
+import gzip
+import pytest
+from unittest.mock import patch
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+from app.api.compression import CompressionMiddleware
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+LARGE_BODY = "x" * 4096
+
+
+@pytest.fixture
+def app():
+    """Minimal app with large, small, tagged and streamed responses."""
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large():
+        return PlainTextResponse(LARGE_BODY, headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    async def small():
+        return PlainTextResponse("tiny")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            yield LARGE_BODY
+            yield LARGE_BODY
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    return app
+
+
+@pytest.fixture
+async def client(app):
+    """Async HTTP client bound to the app (no automatic decompression)."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+async def get_raw(client, path, accept_encoding):
+    """GET a path and return the response with its undecoded body."""
+    request = client.build_request("GET", path, headers={"Accept-Encoding": accept_encoding})
+    response = await client.send(request, stream=True)
+    raw = b"".join([chunk async for chunk in response.aiter_raw()])
+    await response.aclose()
+    return response, raw
+
+
+# ============================================================================
+# Encoding negotiation
+# ============================================================================
+
+@pytest.mark.unit
+class TestChooseEncoding:
+    """Test Accept-Encoding negotiation."""
+
+    def test_gzip(self):
+        """✅ gzip accepted → gzip."""
+        assert CompressionMiddleware.choose_encoding("gzip, deflate") == "gzip"
+
+    def test_prefers_brotli_when_available(self):
+        """✅ br preferred when the brotli package is installed."""
+        with patch("app.api.compression.brotli", object()):
+            assert CompressionMiddleware.choose_encoding("gzip, br") == "br"
+
+    def test_brotli_unavailable_falls_back(self):
+        """✅ br without the brotli package → gzip."""
+        with patch("app.api.compression.brotli", None):
+            assert CompressionMiddleware.choose_encoding("br, gzip") == "gzip"
+
+    def test_refused_encoding(self):
+        """❌ q=0 or no supported coding → None."""
+        assert CompressionMiddleware.choose_encoding("gzip;q=0") is None
+        assert CompressionMiddleware.choose_encoding("identity") is None
+        assert CompressionMiddleware.choose_encoding("") is None
+
+
+# ============================================================================
+# Middleware
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCompressionMiddleware:
+    """Test compression of complete and streamed bodies."""
+
+    async def test_large_body_gzipped(self, client):
+        """✅ Body above the threshold is gzipped with a weakened ETag."""
+        with patch("app.api.compression.brotli", None):
+            response, raw = await get_raw(client, "/large", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"abc"'
+        assert int(response.headers["content-length"]) == len(raw)
+        assert gzip.decompress(raw).decode() == LARGE_BODY
+
+    async def test_small_body_uncompressed(self, client):
+        """✅ Body below the threshold is sent as is."""
+        response, raw = await get_raw(client, "/small", "gzip")
+
+        assert "content-encoding" not in response.headers
+        assert raw == b"tiny"
+
+    async def test_no_accept_encoding(self, client):
+        """✅ Client without gzip/br support gets the identity body."""
+        response, raw = await get_raw(client, "/large", "identity")
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"] == '"abc"'
+        assert raw.decode() == LARGE_BODY
+
+    async def test_stream_not_compressed(self, client):
+        """✅ Streamed responses pass through chunk by chunk."""
+        response, raw = await get_raw(client, "/stream", "gzip")
+
+        assert "content-encoding" not in response.headers
+        assert raw.decode() == LARGE_BODY * 2
+
+    async def test_event_stream_headers_not_held(self):
+        """✅ Event-stream headers are sent before the first event is produced."""
+        sent = []
+        first_event = asyncio.Event()
+
+        async def app(scope, receive, send):
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"text/event-stream")]
+            })
+            await first_event.wait()
+            await send({"type": "http.response.body", "body": b"data: 1\n\n", "more_body": False})
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", b"gzip")]}
+        task = asyncio.create_task(CompressionMiddleware(app)(scope, None, send))
+        await asyncio.sleep(0)
+
+        assert [m["type"] for m in sent] == ["http.response.start"]
+
+        first_event.set()
+        await task
+        assert [m["type"] for m in sent] == ["http.response.start", "http.response.body"]
@@ -0,0 +1,209 @@
+"""Unit tests for the ETag caching middleware.
+
+This module tests ETagCacheMiddleware on a minimal app, with the response
+cache backed by FakeRedis.
+"""
+import uuid
+import pytest
+from unittest.mock import AsyncMock, patch
+import fakeredis.aioredis
+import httpx
+from fastapi import Depends, FastAPI, Response
+
+from app.api.etag_cache import ETagCacheMiddleware
+from app.core.auth import create_access_token, get_current_user
+from app.core.database import get_db
+from app.core.user_cache import AuthUserCache
+from app.models.user import User
+from app.services.response_cache import ResponseCache, SIGNALS
+
+
+USER_ID = str(uuid.UUID(int=1))
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+async def fake_redis():
+    """Create a FakeRedis instance for testing."""
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield redis
+    await redis.flushall()
+    await redis.aclose()
+
+
+@pytest.fixture
+def cache(fake_redis):
+    """Patch the middleware's response cache with a FakeRedis-backed one."""
+    cache = ResponseCache()
+    cache._get_redis = AsyncMock(return_value=fake_redis)
+    with patch("app.api.etag_cache.response_cache", cache):
+        yield cache
+
+
+@pytest.fixture
+def users(fake_redis):
+    """Patch the authenticated-user cache with a FakeRedis-backed one holding an active user."""
+    users = AuthUserCache()
+    users._get_redis = AsyncMock(return_value=fake_redis)
+    users.put(USER_ID, User(id=uuid.UUID(USER_ID), status="active"), "0")
+    with patch("app.core.auth.auth_user_cache", users):
+        yield users
+
+
+@pytest.fixture
+def app():
+    """Minimal app exposing cached routes and counting their calls."""
+    app = FastAPI()
+    app.state.calls = 0
+
+    @app.get("/api/signals")
+    async def signals(response: Response):
+        app.state.calls += 1
+        response.headers["X-Next-Cursor"] = "next"
+        return [{"n": app.state.calls}]
+
+    @app.get("/api/settings")
+    async def user_settings(current_user: User = Depends(get_current_user)):
+        app.state.calls += 1
+        return {"n": app.state.calls}
+
+    # Users are always served from the user cache in these tests
+    app.dependency_overrides[get_db] = lambda: None
+
+    @app.get("/api/uncached")
+    async def uncached():
+        return {"ok": True}
+
+    app.add_middleware(ETagCacheMiddleware)
+    return app
+
+
+@pytest.fixture
+async def client(app):
+    """Async HTTP client bound to the app."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def auth_headers(users):
+    """Bearer token headers for the active test user."""
+    return {"Authorization": f"Bearer {create_access_token({'sub': USER_ID})}"}
+
+
+# ============================================================================
+# Middleware
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestETagCacheMiddleware:
+    """Test conditional GETs and cached bodies."""
+
+    async def test_first_request_tagged(self, client, cache, auth_headers, app):
+        """✅ First request runs the route and returns an ETag."""
+        response = await client.get("/api/signals", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["cache-control"] == "private, no-cache"
+        assert app.state.calls == 1
+
+    async def test_if_none_match_returns_304(self, client, cache, auth_headers, app):
+        """✅ Matching If-None-Match returns 304 without running the route."""
+        first = await client.get("/api/signals", headers=auth_headers)
+
+        response = await client.get(
+            "/api/signals",
+            headers={**auth_headers, "If-None-Match": first.headers["etag"]}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert app.state.calls == 1
+
+    async def test_repeat_served_from_cache(self, client, cache, auth_headers, app):
+        """✅ Repeat request is answered from the stored body and headers."""
+        first = await client.get("/api/signals", headers=auth_headers)
+        second = await client.get("/api/signals", headers=auth_headers)
+
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert second.headers["x-next-cursor"] == "next"
+        assert second.headers["etag"] == first.headers["etag"]
+        assert app.state.calls == 1
+
+    async def test_bump_invalidates(self, client, cache, auth_headers, app):
+        """✅ A data version bump yields a new ETag and fresh body."""
+        first = await client.get("/api/signals", headers=auth_headers)
+        await cache.bump(SIGNALS)
+
+        response = await client.get(
+            "/api/signals",
+            headers={**auth_headers, "If-None-Match": first.headers["etag"]}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [{"n": 2}]
+        assert response.headers["etag"] != first.headers["etag"]
+
+    async def test_no_token_passes_through(self, client, cache, app):
+        """❌ Unauthenticated request is not cached."""
+        response = await client.get("/api/signals")
+
+        assert "etag" not in response.headers
+        await client.get("/api/signals")
+        assert app.state.calls == 2
+
+    async def test_uncached_route_passes_through(self, client, cache, auth_headers):
+        """✅ Routes outside CACHED_ROUTES are untouched."""
+        response = await client.get("/api/uncached", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+
+    async def test_redis_error_passes_through(self, client, cache, auth_headers, app):
+        """❌ Cache failures fall back to running the route."""
+        cache._get_redis = AsyncMock(side_effect=ConnectionError("down"))
+
+        response = await client.get("/api/signals", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+        assert app.state.calls == 1
+
+    async def test_inactive_user_not_served_from_cache(self, client, cache, users, auth_headers, app):
+        """❌ Deactivated user with a valid token → route's 403, never a cached body or 304."""
+        first = await client.get("/api/settings", headers=auth_headers)
+        assert first.status_code == 200
+
+        users.put(USER_ID, User(id=uuid.UUID(USER_ID), status="suspended"), "0")
+        repeat = await client.get("/api/settings", headers=auth_headers)
+        conditional = await client.get(
+            "/api/settings",
+            headers={**auth_headers, "If-None-Match": first.headers["etag"]}
+        )
+
+        assert repeat.status_code == 403
+        assert conditional.status_code == 403
+        assert "etag" not in repeat.headers
+        assert app.state.calls == 1
+
+    async def test_user_invalidation_retires_etag(self, client, cache, users, auth_headers, app):
+        """✅ Invalidating the user (logout, status change) changes their ETags."""
+        first = await client.get("/api/signals", headers=auth_headers)
+        await users.invalidate(USER_ID)
+        users.put(USER_ID, User(id=uuid.UUID(USER_ID), status="active"), "1")
+
+        response = await client.get(
+            "/api/signals",
+            headers={**auth_headers, "If-None-Match": first.headers["etag"]}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != first.headers["etag"]
+        assert app.state.calls == 2
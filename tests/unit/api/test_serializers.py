@@ -0,0 +1,86 @@
+"""Unit tests for the fast JSON serializers.
+
+This module checks that rows serialized without response_model validation
+still match the documented response schemas.
+"""
+import json
+import pytest
+from unittest.mock import MagicMock
+from fastapi import Response
+from datetime import datetime, date
+
+from app.api.serializers import serialize_signal, serialize_decision, json_response
+from app.api.routes.signals import SignalResponse, HistoryResponse
+from app.models.signal import Signal
+from app.models.decision import SignalUserDecision
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def mock_signal():
+    """Create a mock signal."""
+    signal = MagicMock(spec=Signal)
+    signal.id = "sig-123"
+    signal.ticker = "SPY"
+    signal.ff_value = 0.35
+    signal.front_iv = 0.25
+    signal.back_iv = 0.20
+    signal.sigma_fwd = 0.15
+    signal.front_expiry = date(2025, 1, 17)
+    signal.back_expiry = date(2025, 2, 14)
+    signal.front_dte = 16
+    signal.back_dte = 44
+    signal.as_of_ts = datetime(2025, 1, 1, 10, 0, 0)
+    signal.quality_score = 1.0
+    signal.vol_point = "ATM"
+    return signal
+
+
+@pytest.fixture
+def mock_decision():
+    """Create a mock decision."""
+    decision = MagicMock(spec=SignalUserDecision)
+    decision.id = "dec-123"
+    decision.signal_id = "sig-123"
+    decision.decision = "placed"
+    decision.decision_ts = datetime(2025, 1, 1, 12, 0, 0)
+    decision.pnl = None
+    decision.exit_price = 455.0
+    return decision
+
+
+# ============================================================================
+# Serializers
+# ============================================================================
+
+@pytest.mark.unit
+class TestSerializers:
+    """Test row serializers against the response models."""
+
+    def test_signal_matches_schema(self, mock_signal):
+        """✅ Serialized signal equals its validated SignalResponse."""
+        payload = serialize_signal(mock_signal)
+
+        assert SignalResponse(**payload).model_dump() == payload
+        assert payload["ref"].startswith("sig-123@")
+
+    def test_history_matches_schema(self, mock_signal, mock_decision):
+        """✅ Serialized history entry equals its validated HistoryResponse."""
+        entry = {"signal": serialize_signal(mock_signal), "decision": serialize_decision(mock_decision)}
+
+        assert HistoryResponse(**entry).model_dump() == entry
+
+    def test_json_response_carries_headers(self):
+        """✅ Sub-response headers are kept, placeholder body headers are not."""
+        sub_response = Response()
+        sub_response.headers["X-Next-Cursor"] = "abc"
+
+        response = json_response([{"a": 1}], sub_response)
+
+        assert json.loads(response.body) == [{"a": 1}]
+        assert response.headers["x-next-cursor"] == "abc"
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["content-length"] == str(len(response.body))
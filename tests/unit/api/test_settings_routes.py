@@ -36,6 +36,14 @@ def mock_user_service():
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def mock_response_cache():
+    """Mock the response cache whose settings version is bumped on update."""
+    with patch("app.api.routes.settings.response_cache") as cache:
+        cache.bump = AsyncMock()
+        yield cache
+
+
 @pytest.fixture
 def mock_settings():
     """Create mock user settings."""
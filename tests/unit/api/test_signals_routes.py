@@ -3,9 +3,12 @@
 This module tests the signals API endpoints including signal retrieval,
 history, and decision recording.
 """
+import asyncio
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi import status, HTTPException
+from fastapi import status, HTTPException, Response
+from sqlalchemy.dialects import postgresql
 from datetime import datetime, date
 
 # Mock imports
@@ -73,60 +76,149 @@ def mock_decision():
 # Tests for GET /api/signals
 # ============================================================================
 
+@pytest.fixture
+def mock_feed_cache():
+    """Mock the per-user Redis signal feed (cold by default)."""
+    with patch("app.api.routes.signals.signal_feed_cache") as cache:
+        cache.FEED_SIZE = 100
+        cache.get_latest = AsyncMock(return_value=None)
+        cache.fill = AsyncMock()
+        yield cache
+
+
+def body(response):
+    """Decode the JSON body of a rendered route response."""
+    return json.loads(response.body)
+
+
+def signals_result(*signals):
+    """Mock execute() result for a signals query."""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = list(signals)
+    return result
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 class TestGetSignals:
     """Test get signals endpoint."""
     
-    async def test_get_signals_success(self, mock_db, mock_user, mock_signal):
-        """✅ Returns signals for user's watchlist."""
-        # Mock subscribed tickers
-        mock_sub_result = MagicMock()
-        mock_sub_result.all.return_value = [("SPY",)]
+    async def test_get_signals_success(self, mock_db, mock_user, mock_signal, mock_feed_cache):
+        """✅ Returns signals for user's watchlist in one query."""
+        mock_db.execute.return_value = signals_result(mock_signal)
         
-        # Mock signals query
-        mock_sig_result = MagicMock()
-        mock_sig_result.scalars.return_value.all.return_value = [mock_signal]
+        from app.api.routes.signals import get_signals
+        
+        response = await get_signals(response=Response(), current_user=mock_user, db=mock_db)
+        
+        assert response.media_type == "application/json"
+        assert len(body(response)) == 1
+        assert body(response)[0]["ticker"] == "SPY"
+        assert body(response)[0]["ff_value"] == 0.35
+        assert mock_db.execute.call_count == 1
+        
+        sql = str(mock_db.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "signals.ticker IN (SELECT subscriptions.ticker" in sql
+    
+    async def test_cold_feed_is_filled(self, mock_db, mock_user, mock_signal, mock_feed_cache):
+        """✅ Cold Redis feed → rebuilt from the query result."""
+        mock_db.execute.return_value = signals_result(mock_signal)
+        
+        from app.api.routes.signals import get_signals
         
-        # Configure execute side effects
-        mock_db.execute.side_effect = [mock_sub_result, mock_sig_result]
+        await get_signals(response=Response(), current_user=mock_user, db=mock_db)
+        
+        mock_feed_cache.fill.assert_awaited_once()
+        user_id, payloads = mock_feed_cache.fill.call_args[0]
+        assert user_id == "user-123"
+        assert payloads[0]["ref"].startswith("sig-123@")
+    
+    async def test_warm_feed_skips_database(self, mock_db, mock_user, mock_feed_cache):
+        """✅ Warm Redis feed → served without touching Postgres."""
+        cached = [
+            {"id": "sig-2", "ticker": "SPY", "as_of_ts": "2025-01-02T10:00:00+00:00"},
+            {"id": "sig-1", "ticker": "SPY", "as_of_ts": "2025-01-01T10:00:00+00:00"}
+        ]
+        mock_feed_cache.get_latest.return_value = cached
         
         from app.api.routes.signals import get_signals
+        from app.utils.pagination import decode_cursor
         
-        response = await get_signals(current_user=mock_user, db=mock_db)
+        response = Response()
+        result = await get_signals(limit=1, current_user=mock_user, db=mock_db, response=response)
         
-        assert len(response) == 1
-        assert response[0]["ticker"] == "SPY"
-        assert response[0]["ff_value"] == 0.35
+        assert body(result) == cached[:1]
+        mock_feed_cache.get_latest.assert_awaited_once_with("user-123", 2)
+        mock_db.execute.assert_not_called()
+        assert decode_cursor(result.headers["X-Next-Cursor"])[1] == "sig-2"
     
-    async def test_empty_watchlist(self, mock_db, mock_user):
+    async def test_empty_watchlist(self, mock_db, mock_user, mock_feed_cache):
         """✅ Empty watchlist → empty array."""
-        mock_sub_result = MagicMock()
-        mock_sub_result.all.return_value = []
-        mock_db.execute.return_value = mock_sub_result
+        mock_db.execute.return_value = signals_result()
         
         from app.api.routes.signals import get_signals
         
-        response = await get_signals(current_user=mock_user, db=mock_db)
+        response = await get_signals(response=Response(), current_user=mock_user, db=mock_db)
         
-        assert response == []
+        assert body(response) == []
         # Should verify only one execute call happened
         assert mock_db.execute.call_count == 1
     
-    async def test_filter_by_ticker(self, mock_db, mock_user, mock_signal):
-        """✅ Filter by ticker parameter."""
-        mock_sub_result = MagicMock()
-        mock_sub_result.all.return_value = [("SPY",)]
-        mock_sig_result = MagicMock()
-        mock_sig_result.scalars.return_value.all.return_value = [mock_signal]
-        mock_db.execute.side_effect = [mock_sub_result, mock_sig_result]
+    async def test_filter_by_ticker(self, mock_db, mock_user, mock_signal, mock_feed_cache):
+        """✅ Filter by ticker parameter bypasses the feed."""
+        mock_db.execute.return_value = signals_result(mock_signal)
         
         from app.api.routes.signals import get_signals
         
-        await get_signals(ticker="SPY", current_user=mock_user, db=mock_db)
+        await get_signals(response=Response(), ticker="SPY", current_user=mock_user, db=mock_db)
         
-        # Verify execute called twice
-        assert mock_db.execute.call_count == 2
+        assert mock_db.execute.call_count == 1
+        mock_feed_cache.get_latest.assert_not_called()
+        mock_feed_cache.fill.assert_not_called()
+    
+    async def test_next_cursor_when_more_rows(self, mock_db, mock_user, mock_signal, mock_feed_cache):
+        """✅ More rows than limit → page trimmed and X-Next-Cursor set."""
+        mock_db.execute.return_value = signals_result(mock_signal, mock_signal)
+        
+        from app.api.routes.signals import get_signals
+        from app.utils.pagination import decode_cursor
+        
+        response = Response()
+        result = await get_signals(limit=1, current_user=mock_user, db=mock_db, response=response)
+        
+        assert len(body(result)) == 1
+        assert decode_cursor(result.headers["X-Next-Cursor"]) == (mock_signal.as_of_ts, "sig-123")
+        assert int(result.headers["content-length"]) == len(result.body)
+    
+    async def test_cursor_and_since_filter_query(self, mock_db, mock_user, mock_signal, mock_feed_cache):
+        """✅ Cursor and since → keyset predicate on (as_of_ts, id), no next cursor on last page."""
+        mock_db.execute.return_value = signals_result(mock_signal)
+        
+        from app.api.routes.signals import get_signals
+        from app.utils.pagination import encode_cursor
+        
+        response = Response()
+        result = await get_signals(
+            cursor=encode_cursor(datetime(2025, 1, 2), "sig-999"),
+            since=datetime(2024, 12, 31),
+            current_user=mock_user,
+            db=mock_db,
+            response=response
+        )
+        
+        sql = str(mock_db.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "(signals.as_of_ts, signals.id) < (" in sql
+        assert "signals.as_of_ts >" in sql
+        assert "X-Next-Cursor" not in result.headers
+    
+    async def test_invalid_cursor(self, mock_db, mock_user, mock_feed_cache):
+        """❌ Malformed cursor → 400."""
+        from app.api.routes.signals import get_signals
+        
+        with pytest.raises(HTTPException) as exc:
+            await get_signals(response=Response(), cursor="not-a-cursor", current_user=mock_user, db=mock_db)
+        
+        assert exc.value.status_code == status.HTTP_400_BAD_REQUEST
 
 
 # ============================================================================
@@ -146,12 +238,113 @@ class TestGetHistory:
         
         from app.api.routes.signals import get_history
         
-        response = await get_history(current_user=mock_user, db=mock_db)
+        response = await get_history(response=Response(), current_user=mock_user, db=mock_db)
+        
+        assert len(body(response)) == 1
+        assert body(response)[0]["signal"]["ticker"] == "SPY"
+        assert body(response)[0]["decision"]["decision"] == "placed"
+        assert body(response)[0]["decision"]["pnl"] == 100.0
+    
+    async def test_history_next_cursor(self, mock_db, mock_user, mock_signal, mock_decision):
+        """✅ More rows than limit → cursor keyed on (decision_ts, id)."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = [(mock_decision, mock_signal)] * 3
+        mock_db.execute.return_value = mock_result
         
-        assert len(response) == 1
-        assert response[0]["signal"]["ticker"] == "SPY"
-        assert response[0]["decision"]["decision"] == "placed"
-        assert response[0]["decision"]["pnl"] == 100.0
+        from app.api.routes.signals import get_history
+        from app.utils.pagination import decode_cursor
+        
+        response = Response()
+        result = await get_history(limit=2, current_user=mock_user, db=mock_db, response=response)
+        
+        assert len(body(result)) == 2
+        assert decode_cursor(result.headers["X-Next-Cursor"]) == (mock_decision.decision_ts, "dec-123")
+
+
+# ============================================================================
+# Tests for GET /api/signals/stream
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStreamSignals:
+    """Test signal SSE endpoint."""
+    
+    async def test_replays_missed_events(self, mock_db, mock_user):
+        """✅ Last-Event-ID → buffered events replayed, connection released on close."""
+        sub = MagicMock()
+        sub.ticker = "SPY"
+        request = MagicMock()
+        request.is_disconnected = AsyncMock(return_value=True)
+        event = {"id": "5-0", "data": {"ticker": "SPY", "id": "sig-5"}}
+        
+        with patch("app.api.routes.signals.SubscriptionService") as sub_svc, \
+             patch("app.api.routes.signals.signal_stream") as stream:
+            sub_svc.get_user_subscriptions = AsyncMock(return_value=[sub])
+            stream.connect = AsyncMock(return_value=MagicMock())
+            stream.replay = AsyncMock(return_value=[event])
+            
+            from app.api.routes.signals import stream_signals
+            
+            response = await stream_signals(
+                request=request, last_event_id="4-0", current_user=mock_user, db=mock_db
+            )
+            chunks = [chunk async for chunk in response.body_iterator]
+        
+        assert response.media_type == "text/event-stream"
+        stream.connect.assert_awaited_once_with("user-123", {"SPY"})
+        stream.replay.assert_awaited_once_with("4-0", {"SPY"})
+        assert chunks == ['id: 5-0\nevent: signal\ndata: {"ticker": "SPY", "id": "sig-5"}\n\n']
+        stream.disconnect.assert_called_once()
+    
+    async def test_not_registered_until_streaming(self, mock_db, mock_user):
+        """✅ Client gone before the body starts → never registered, nothing to leak."""
+        with patch("app.api.routes.signals.SubscriptionService") as sub_svc, \
+             patch("app.api.routes.signals.signal_stream") as stream:
+            sub_svc.get_user_subscriptions = AsyncMock(return_value=[])
+            stream.connect = AsyncMock(return_value=MagicMock())
+            
+            from app.api.routes.signals import stream_signals
+            
+            response = await stream_signals(
+                request=MagicMock(), last_event_id=None, current_user=mock_user, db=mock_db
+            )
+            await response.body_iterator.aclose()
+        
+        stream.connect.assert_not_called()
+        stream.disconnect.assert_not_called()
+    
+    async def test_busy_stream_refreshes_subscriptions(self, mock_db, mock_user):
+        """✅ Events arriving faster than the keepalive → watchlist still refreshed."""
+        spy, qqq = MagicMock(ticker="SPY"), MagicMock(ticker="QQQ")
+        queue = asyncio.Queue()
+        for n in (1, 2):
+            queue.put_nowait({"id": f"{n}-0", "data": {"ticker": "SPY", "id": f"sig-{n}"}})
+        request = MagicMock()
+        request.is_disconnected = AsyncMock(side_effect=[False, False, True])
+        session = AsyncMock()
+        session.__aenter__.return_value = session
+        
+        with patch("app.api.routes.signals.SubscriptionService") as sub_svc, \
+             patch("app.api.routes.signals.signal_stream") as stream, \
+             patch("app.api.routes.signals.AsyncSessionLocal", return_value=session), \
+             patch("app.api.routes.signals.STREAM_SUBSCRIPTION_REFRESH_SECONDS", 0):
+            sub_svc.get_user_subscriptions = AsyncMock(side_effect=[[spy], [spy, qqq], [qqq]])
+            stream.connect = AsyncMock(return_value=queue)
+            stream.is_after = MagicMock(return_value=True)
+            
+            from app.api.routes.signals import stream_signals
+            
+            response = await stream_signals(
+                request=request, last_event_id=None, current_user=mock_user, db=mock_db
+            )
+            chunks = [chunk async for chunk in response.body_iterator]
+        
+        assert len(chunks) == 2  # No keepalive timeout in between
+        assert [c.args for c in stream.set_subscriptions.call_args_list] == [
+            ("user-123", {"SPY", "QQQ"}),
+            ("user-123", {"QQQ"})
+        ]
 
 
 # ============================================================================
@@ -0,0 +1,162 @@
+"""Unit tests for the vectorized backtester.
+
+This module checks the vectorized FF and pairing against compute_signals,
+the stability simulation against StabilityTracker's rules, and the P&L
+proxies and result aggregation.
+"""
+import pytest
+import numpy as np
+from datetime import datetime, timedelta, timezone
+
+from app.backtest import ChainHistory, ParameterGrid, run_backtest
+from app.backtest.engine import evaluate
+from app.services.signal_engine import compute_signals
+from tests.synthetic import DTE_PAIR_SETS, VOL_POINTS, make_chain
+
+
+T0 = datetime(2026, 3, 2, 14, 30, tzinfo=timezone.utc)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+def make_history(
+    front_ivs,
+    back_iv: float = 0.30,
+    minutes: int = 3,
+    front_mids=None,
+    back_mids=None,
+    ordinals=(1000, 1030)
+) -> ChainHistory:
+    """Two-expiry (30/60 DTE) history with one scan every `minutes`."""
+    n = len(front_ivs)
+    front_mids = front_mids if front_mids is not None else [2.0] * n
+    back_mids = back_mids if back_mids is not None else [3.0] * n
+    return ChainHistory(
+        ticker="SPY",
+        vol_points=["ATM"],
+        times=np.array([T0.timestamp() + i * minutes * 60 for i in range(n)]),
+        underlying=np.full(n, 450.0),
+        dte=np.tile([30.0, 60.0], (n, 1)),
+        expiry_ord=np.tile(np.array(ordinals, dtype=np.int64), (n, 1)),
+        iv=np.stack([np.array(front_ivs), np.full(n, back_iv)], axis=1)[None],
+        atm_mid=np.stack([np.array(front_mids, dtype=float), np.array(back_mids, dtype=float)], axis=1),
+        has_atm=np.ones((n, 2), dtype=bool)
+    )
+
+
+@pytest.fixture
+def chains():
+    """Synthetic chains for a few scans, each with its own noise."""
+    result = []
+    for i in range(4):
+        chain = make_chain(n_expiries=70, n_strikes=20, seed=i)
+        chain.as_of = T0 + timedelta(minutes=3 * i)
+        result.append(chain)
+    return result
+
+
+# ============================================================================
+# Tests for evaluate
+# ============================================================================
+
+@pytest.mark.unit
+class TestEvaluate:
+    """Test vectorized pairing and Forward Factor."""
+
+    def test_matches_compute_signals(self, chains):
+        """✅ Signals and FF values match compute_signals for every combination."""
+        pairs = [pair for pair_set in DTE_PAIR_SETS for pair in pair_set]
+        grid = ParameterGrid(vol_points=VOL_POINTS, dte_pairs=pairs, ff_thresholds=[0.1, 0.3])
+        history = ChainHistory.from_chains(chains, vol_points=VOL_POINTS)
+
+        data = evaluate(history, grid, horizon_minutes=60)
+
+        for v, vol_point in enumerate(VOL_POINTS):
+            for p, pair in enumerate(pairs):
+                for t, chain in enumerate(chains):
+                    settings = {"dte_pairs": [pair], "vol_point": vol_point, "ff_threshold": -1e9}
+                    expected = compute_signals(chain, settings)
+                    assert data["valid"][v, p, t] == bool(expected)
+                    if expected:
+                        assert data["ff"][v, p, t] == pytest.approx(expected[0]["ff_value"])
+                        assert data["sigma_fwd"][v, p, t] == pytest.approx(expected[0]["sigma_fwd"])
+
+    def test_invalid_pair(self):
+        """❌ No expiry within tolerance → no signal."""
+        grid = ParameterGrid(dte_pairs=[{"front": 7, "back": 60, "front_tol": 2, "back_tol": 10}])
+
+        data = evaluate(make_history([0.36, 0.36]), grid, horizon_minutes=60)
+
+        assert not data["valid"].any()
+
+    def test_calendar_return_at_horizon(self):
+        """✅ Calendar proxy marks the same expiries at the first scan past the horizon."""
+        history = make_history([0.36] * 3, minutes=30, front_mids=[2.0, 1.5, 1.0], back_mids=[3.0, 3.0, 3.0])
+
+        data = evaluate(history, ParameterGrid(), horizon_minutes=45)
+
+        # Entry debit 1.0 at t0; at t2 (60 min) the calendar is worth 2.0
+        assert data["calendar_return"][0, 0] == pytest.approx(1.0)
+        assert np.isnan(data["calendar_return"][0, 1])  # No scan 45 minutes after t1
+        assert data["ff_reversion"][0, 0, 0] == pytest.approx(0.0)
+
+
+# ============================================================================
+# Tests for run_backtest
+# ============================================================================
+
+@pytest.mark.unit
+class TestRunBacktest:
+    """Test the stability simulation and aggregation."""
+
+    def test_debounce_and_cooldown(self):
+        """✅ Alerts on the second sighting, then waits out the cooldown and FF delta."""
+        # FF rises every scan; scans every 3 minutes
+        history = make_history([0.36 + 0.005 * i for i in range(8)])
+        grid = ParameterGrid(required_scans=[2, 3], cooldown_minutes=[10])
+
+        result = run_backtest([history], grid, horizon_minutes=60)
+
+        # required=2: alert at scan 1 (3 min), cooling until 13 min, alert again at scan 5 (15 min)
+        assert list(result.signals) == [8, 8]
+        assert list(result.alerts) == [2, 2]
+
+    def test_small_ff_delta_blocks_realert(self):
+        """❌ Flat FF after the cooldown → no second alert."""
+        history = make_history([0.36] * 10)
+
+        result = run_backtest([history], ParameterGrid(cooldown_minutes=[5, 600]), horizon_minutes=60)
+
+        assert list(result.alerts) == [1, 1]
+
+    def test_new_expiry_pair_resets_state(self):
+        """✅ A new expiry pair starts its own debounce, like a new Redis key."""
+        rolled = make_history([0.36] * 2, ordinals=(1007, 1037))
+        history = make_history([0.36] * 4)
+        history.expiry_ord[2:] = rolled.expiry_ord[:2]
+
+        result = run_backtest([history], ParameterGrid(), horizon_minutes=60)
+
+        assert list(result.alerts) == [2]
+
+    def test_threshold_axis_and_rows(self):
+        """✅ Grid axes broadcast; rows carry settings and metrics."""
+        history = make_history([0.36] * 6, minutes=30, front_mids=[2.0, 1.8, 1.6, 1.4, 1.2, 1.0])
+        grid = ParameterGrid(ff_thresholds=[0.2, 5.0], cooldown_minutes=[0])
+
+        result = run_backtest([history, history], grid, horizon_minutes=30)
+
+        assert grid.size == 2
+        low, high = result.row(0), result.row(1)
+        assert low["ff_threshold"] == 0.2 and high["ff_threshold"] == 5.0
+        assert high["signals"] == 0 and high["alerts"] == 0
+        assert low["signals"] == 12
+        assert low["hit_rate"] == 1.0
+        assert result.top(1)[0]["ff_threshold"] == 0.2
+
+    def test_missing_vol_point(self):
+        """❌ Grid vol point not extracted into the history → ValueError."""
+        with pytest.raises(ValueError, match="35d_put"):
+            run_backtest([make_history([0.36])], ParameterGrid(vol_points=["35d_put"]))
@@ -49,7 +49,9 @@ def mock_db_session():
     session.__aenter__.return_value = session
     session.__aexit__.return_value = None
     
-    with patch("app.core.database.AsyncSessionLocal", return_value=session):
+    with patch("app.core.database.AsyncSessionLocal", return_value=session), \
+         patch("app.bot.handlers.callbacks.AsyncSessionLocal", return_value=session), \
+         patch("app.bot.handlers.history.AsyncReadSessionLocal", return_value=session):
         yield session
 
 
@@ -89,6 +91,7 @@ def mock_services():
         # Signal Service
         hist_sig_svc.get_user_decisions = AsyncMock()
         cb_sig_svc.record_decision = AsyncMock()
+        cb_sig_svc.get_signal_by_ref = AsyncMock()
         
         yield {
             "user": start_user_svc, # They should all be similar mocks, but we return one for setting return_values
@@ -239,14 +242,16 @@ class TestCallbacksHandler:
     
     async def test_decision_callback(self, mock_update, mock_context, mock_db_session, mock_services):
         """✅ Signal decision callbacks."""
-        # Use format: action:signal_id
-        mock_update.callback_query.data = "place:sig-123"
+        # Use format: action:signal_ref
+        mock_update.callback_query.data = "ignore:sig-123@1k9x0q8g2w"
         for svc in mock_services["all_user"]:
             svc.get_user_by_chat_id.return_value = MagicMock(id="user-1")
         
         await button_callback(mock_update, mock_context)
         
         # Verify call on the specific mock used by button_callback (cb_sig_svc is mock_services['signal'])
+        mock_services["signal"].get_signal_by_ref.assert_called_once()
+        assert mock_services["signal"].get_signal_by_ref.call_args[0][1] == "sig-123@1k9x0q8g2w"
         mock_services["signal"].record_decision.assert_called_once()
         mock_update.callback_query.answer.assert_called_once()
         # It calls edit_message_text, not edit_message_reply_markup
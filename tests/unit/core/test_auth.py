@@ -0,0 +1,76 @@
+"""Unit tests for password hashing utilities.
+
+This module tests the async bcrypt helpers and cost-based rehashing.
+"""
+import pytest
+from unittest.mock import patch
+from passlib.context import CryptContext
+
+from app.core import auth
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+def make_context(rounds: int) -> CryptContext:
+    """bcrypt context with a (cheap) test cost factor."""
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+@pytest.fixture
+def fast_context():
+    """Use the minimum bcrypt cost to keep tests fast."""
+    with patch.object(auth, "pwd_context", make_context(4)):
+        yield
+
+
+# ============================================================================
+# Tests for async hashing
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAsyncPasswordHashing:
+    """Test bcrypt helpers run in the password thread pool."""
+
+    async def test_hash_and_verify(self, fast_context):
+        """✅ Async hash verifies with the async and sync checks."""
+        hashed = await auth.hash_password_async("password123")
+
+        assert await auth.verify_password_async("password123", hashed)
+        assert auth.verify_password("password123", hashed)
+        assert not await auth.verify_password_async("wrong", hashed)
+
+    async def test_long_password_prehashed(self, fast_context):
+        """✅ Passwords over 72 bytes differ beyond the bcrypt limit."""
+        base = "a" * 80
+        hashed = await auth.hash_password_async(base + "1")
+
+        assert await auth.verify_password_async(base + "1", hashed)
+        assert not await auth.verify_password_async(base + "2", hashed)
+
+    async def test_current_cost_not_rehashed(self, fast_context):
+        """✅ Hash with the configured cost → no new hash."""
+        hashed = await auth.hash_password_async("password123")
+
+        assert await auth.verify_and_update_password_async("password123", hashed) == (True, None)
+
+    async def test_changed_cost_rehashed(self):
+        """✅ Hash with an outdated cost → new hash at the configured cost."""
+        with patch.object(auth, "pwd_context", make_context(4)):
+            old_hash = auth.hash_password("password123")
+
+        with patch.object(auth, "pwd_context", make_context(5)):
+            valid, new_hash = await auth.verify_and_update_password_async("password123", old_hash)
+
+        assert valid
+        assert new_hash.startswith("$2b$05$")
+
+    async def test_wrong_password_not_rehashed(self):
+        """❌ Wrong password → (False, None) even with an outdated cost."""
+        with patch.object(auth, "pwd_context", make_context(4)):
+            old_hash = auth.hash_password("password123")
+
+        with patch.object(auth, "pwd_context", make_context(5)):
+            assert await auth.verify_and_update_password_async("wrong", old_hash) == (False, None)
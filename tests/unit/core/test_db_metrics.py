@@ -0,0 +1,98 @@
+"""Unit tests for SQLAlchemy statement and pool instrumentation.
+
+This module tests statement name normalization and the event hooks
+attached by instrument_engine.
+"""
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.db_metrics import statement_name, instrument_engine
+from app.core.metrics import PROCESS_ROLE
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+async def engine(tmp_path):
+    """SQLite engine instrumented under the "hooktest" label."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/hooks.db")
+    instrument_engine(engine.sync_engine, "hooktest")
+    yield engine
+    await engine.dispose()
+
+
+def sample(name: str, **labels):
+    """Read a sample for the test engine (0 if absent)."""
+    value = REGISTRY.get_sample_value(name, {"role": PROCESS_ROLE, "engine": "hooktest", **labels})
+    return value or 0
+
+
+# ============================================================================
+# Tests for statement names
+# ============================================================================
+
+@pytest.mark.unit
+class TestStatementName:
+    """Test SQL normalization into low-cardinality labels."""
+
+    def test_select(self):
+        """✅ SELECT → verb and first table."""
+        sql = "SELECT signals.id, signals.ticker \nFROM signals \nWHERE signals.ticker IN (SELECT subscriptions.ticker FROM subscriptions)"
+        assert statement_name(sql) == "SELECT signals"
+
+    def test_insert_update_delete(self):
+        """✅ Write statements use their target table."""
+        assert statement_name("INSERT INTO signals (id) VALUES ($1)") == "INSERT signals"
+        assert statement_name("UPDATE user_settings SET ff_threshold=$1") == "UPDATE user_settings"
+        assert statement_name('DELETE FROM "telegram_chats" WHERE id=$1') == "DELETE telegram_chats"
+
+    def test_schema_qualified_and_tableless(self):
+        """✅ Schema-qualified tables kept, no table → "-"."""
+        assert statement_name("SELECT * FROM timescaledb_information.chunks") == "SELECT timescaledb_information.chunks"
+        assert statement_name("SELECT 1") == "SELECT -"
+
+    def test_unknown_verb(self):
+        """❌ Unrecognized verbs collapse to OTHER."""
+        assert statement_name("VACUUM ANALYZE signals") == "OTHER -"
+        assert statement_name("") == "OTHER -"
+
+
+# ============================================================================
+# Tests for event hooks
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestInstrumentEngine:
+    """Test latency and pool-usage hooks."""
+
+    async def test_statement_latency_recorded(self, engine):
+        """✅ Each executed statement is observed under its name."""
+        async with engine.connect() as conn:
+            await conn.execute(text("CREATE TABLE items (id INTEGER)"))
+            await conn.execute(text("SELECT id FROM items"))
+            await conn.execute(text("SELECT id FROM items"))
+
+        assert sample("ffbot_db_statement_duration_seconds_count", statement="SELECT items") == 2
+
+    async def test_connections_in_use(self, engine):
+        """✅ In-use gauge follows checkout and checkin."""
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            assert sample("ffbot_db_pool_connections_in_use") == 1
+
+        assert sample("ffbot_db_pool_connections_in_use") == 0
+
+    async def test_error_counted(self, engine):
+        """❌ Failing statements increment the error counter."""
+        async with engine.connect() as conn:
+            with pytest.raises(Exception):
+                await conn.execute(text("SELECT id FROM missing_table"))
+            await conn.execute(text("SELECT 1"))
+
+        assert sample("ffbot_db_statement_errors_total", statement="SELECT missing_table") == 1
+        assert sample("ffbot_db_statement_duration_seconds_count", statement="SELECT -") >= 1
@@ -0,0 +1,222 @@
+"""Unit tests for alert pipeline tracing."""
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.metrics import PROCESS_ROLE
+from app.core.tracing import (
+    PipelineTrace,
+    SpanExporter,
+    current_trace,
+    extract_payload,
+    inject_payload,
+    trace_stage,
+    use_trace,
+)
+
+
+def sample(name: str, **labels):
+    """Read a tracing metric sample for this process (0 if absent)."""
+    return REGISTRY.get_sample_value(name, {"role": PROCESS_ROLE, **labels}) or 0
+
+
+# ============================================================================
+# Tests for PipelineTrace
+# ============================================================================
+
+@pytest.mark.unit
+class TestPipelineTrace:
+    """Test stage spans and context propagation."""
+
+    def test_stage_records_child_span_and_metric(self):
+        """✅ A stage becomes a child span and a stage histogram sample."""
+        before = sample("ffbot_pipeline_stage_duration_seconds_count", stage="compute")
+        trace = PipelineTrace("scan_ticker", ticker="SPY")
+
+        with trace.stage("compute"):
+            pass
+
+        spans = trace.finish()
+        root, compute = spans
+        assert root.name == "scan_ticker"
+        assert compute.name == "compute"
+        assert compute.trace_id == root.trace_id
+        assert compute.parent_id == root.span_id
+        assert compute.start_ns <= compute.end_ns <= root.end_ns
+        assert sample("ffbot_pipeline_stage_duration_seconds_count", stage="compute") == before + 1
+
+    def test_stage_recorded_when_block_raises(self):
+        """✅ Failed stages still produce a span."""
+        trace = PipelineTrace("scan_ticker")
+
+        with pytest.raises(ValueError):
+            with trace.stage("fetch"):
+                raise ValueError("boom")
+
+        assert [span.name for span in trace.spans] == ["fetch"]
+
+    def test_fetch_end_carried_in_context(self):
+        """✅ The end of the fetch stage travels with the context."""
+        trace = PipelineTrace("scan_ticker")
+        trace.record("fetch", 100.0, 101.5)
+
+        context = trace.context()
+
+        assert context["fetched_at"] == 101.5
+        assert context["trace_id"] == trace.root.trace_id
+        assert context["span_id"] == trace.root.span_id
+        assert context["enqueued_at"] >= 101.5
+
+    def test_from_context_continues_trace(self):
+        """✅ The notify side shares the trace ID and parents to the scan span."""
+        scan = PipelineTrace("scan_ticker")
+        notify = PipelineTrace.from_context(scan.context(), "notify")
+
+        assert notify.root.trace_id == scan.root.trace_id
+        assert notify.root.parent_id == scan.root.span_id
+        assert notify.root.span_id != scan.root.span_id
+
+    def test_alert_sent_observes_latency(self):
+        """✅ alert_sent() records the chain-to-Telegram latency."""
+        before = sample("ffbot_alert_latency_seconds_count")
+        trace = PipelineTrace("notify", fetched_at=time.time() - 2)
+
+        trace.alert_sent()
+
+        assert sample("ffbot_alert_latency_seconds_count") == before + 1
+
+    def test_alert_sent_without_fetch_is_ignored(self):
+        """✅ No fetch timestamp → no latency sample."""
+        before = sample("ffbot_alert_latency_seconds_count")
+
+        PipelineTrace("notify").alert_sent()
+
+        assert sample("ffbot_alert_latency_seconds_count") == before
+
+
+# ============================================================================
+# Tests for the current trace and queue payloads
+# ============================================================================
+
+@pytest.mark.unit
+class TestCurrentTrace:
+    """Test the task-local trace and payload propagation."""
+
+    def test_trace_stage_without_trace_is_noop(self):
+        """✅ trace_stage() outside a traced task does nothing."""
+        assert current_trace() is None
+        with trace_stage("parse"):
+            pass
+
+    def test_use_trace_sets_and_resets(self):
+        """✅ use_trace() scopes the current trace."""
+        trace = PipelineTrace("scan_ticker")
+
+        with use_trace(trace):
+            assert current_trace() is trace
+            with trace_stage("parse"):
+                pass
+
+        assert current_trace() is None
+        assert [span.name for span in trace.spans] == ["parse"]
+
+    def test_payload_round_trip(self):
+        """✅ inject_payload()/extract_payload() carry ref and context."""
+        trace = PipelineTrace("scan_ticker")
+
+        with use_trace(trace):
+            payload = inject_payload("abc@123")
+
+        signal_ref, context = extract_payload(payload)
+        assert signal_ref == "abc@123"
+        assert context["trace_id"] == trace.root.trace_id
+
+    def test_untraced_payload_is_bare_ref(self):
+        """✅ Without a trace the payload stays a plain signal ref."""
+        assert inject_payload("abc@123") == "abc@123"
+        assert extract_payload("abc@123") == ("abc@123", None)
+
+
+# ============================================================================
+# Tests for SpanExporter
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSpanExporter:
+    """Test OTLP/JSON export."""
+
+    async def test_file_export_writes_otlp_json(self, tmp_path):
+        """✅ One OTLP/JSON line per export."""
+        path = tmp_path / "traces.jsonl"
+        exporter = SpanExporter(path=str(path))
+        trace = PipelineTrace("scan_ticker", ticker="SPY")
+        with trace.stage("compute"):
+            pass
+
+        await exporter.export(trace.finish())
+        await exporter.close()
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 1
+        scope = json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]
+        root, compute = scope["spans"]
+        assert root["name"] == "scan_ticker"
+        assert "parentSpanId" not in root
+        assert root["attributes"] == [{"key": "ticker", "value": {"stringValue": "SPY"}}]
+        assert compute["parentSpanId"] == root["spanId"]
+        assert int(compute["endTimeUnixNano"]) >= int(compute["startTimeUnixNano"])
+
+    async def test_disabled_exporter_is_noop(self, tmp_path):
+        """✅ No path or endpoint → nothing exported."""
+        exporter = SpanExporter()
+
+        assert exporter.enabled is False
+        await exporter.export(PipelineTrace("scan_ticker").finish())
+
+    async def test_export_failure_is_swallowed(self, tmp_path):
+        """❌ Unwritable path → logged, not raised."""
+        exporter = SpanExporter(path=str(tmp_path / "missing" / "traces.jsonl"))
+
+        await exporter.export(PipelineTrace("scan_ticker").finish())
+        await exporter.close()
+
+    async def test_export_does_not_wait_for_collector(self):
+        """✅ export() returns while the collector is still answering; queued traces go in one batch."""
+        released = asyncio.Event()
+        posted = []
+
+        async def slow_post(url, json):
+            await released.wait()
+            posted.append(json)
+            return MagicMock()
+
+        exporter = SpanExporter(endpoint="http://collector/v1/traces")
+        exporter.client = MagicMock(post=slow_post, aclose=AsyncMock())
+
+        await exporter.export(PipelineTrace("scan_ticker").finish())
+        await asyncio.sleep(0)  # First batch is now waiting on the collector
+        await exporter.export(PipelineTrace("scan_ticker").finish())
+        await exporter.export(PipelineTrace("notify").finish())
+        assert posted == []
+
+        released.set()
+        await exporter.close()
+
+        assert [len(p["resourceSpans"][0]["scopeSpans"][0]["spans"]) for p in posted] == [1, 2]
+
+    async def test_full_queue_drops_spans(self):
+        """❌ More traces queued than QUEUE_SIZE → extra ones dropped, not awaited."""
+        exporter = SpanExporter(endpoint="http://collector/v1/traces")
+        exporter.QUEUE_SIZE = 1
+        exporter._send = AsyncMock()
+
+        for _ in range(3):
+            await exporter.export(PipelineTrace("scan_ticker").finish())
+        await exporter.close()
+
+        exporter._send.assert_awaited_once()
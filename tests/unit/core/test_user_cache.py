@@ -0,0 +1,168 @@
+"""Unit tests for the authenticated-user cache.
+
+This module tests AuthUserCache (per-process LRU with TTL, validated against
+Redis versions) and its use in get_current_user.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime, timezone
+import fakeredis.aioredis
+from fastapi import HTTPException, status
+from sqlalchemy import inspect
+
+from app.core.auth import get_current_user, create_access_token
+from app.core.user_cache import AuthUserCache
+from app.models.user import User
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+async def fake_redis():
+    """Create a FakeRedis instance for testing."""
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield redis
+    await redis.flushall()
+    await redis.aclose()
+
+
+@pytest.fixture
+async def cache(fake_redis):
+    """Create AuthUserCache instance with mocked Redis."""
+    cache = AuthUserCache(max_size=2, ttl_seconds=60)
+    cache._get_redis = AsyncMock(return_value=fake_redis)
+    cache.redis = fake_redis
+    return cache
+
+
+def make_user(user_id: str = "user-1", status: str = "active") -> User:
+    """Create a User row as loaded from the database."""
+    return User(
+        id=user_id,
+        email=f"{user_id}@example.com",
+        password_hash="hash",
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        status=status,
+        link_code="code"
+    )
+
+
+# ============================================================================
+# Cache
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAuthUserCache:
+    """Test cache hits, expiry and invalidation."""
+
+    async def test_hit_returns_detached_copy(self, cache):
+        """✅ Hit returns a fresh detached User with the cached columns."""
+        version = await cache.get_version("user-1")
+        cache.put("user-1", make_user(), version)
+
+        first = cache.get("user-1", version)
+        second = cache.get("user-1", version)
+
+        assert first.email == "user-1@example.com"
+        assert first.status == "active"
+        assert first is not second
+        assert inspect(first).detached
+
+    async def test_miss(self, cache):
+        """❌ Unknown user → None."""
+        assert cache.get("user-1", "0") is None
+
+    async def test_invalidate_changes_version(self, cache):
+        """✅ Invalidation bumps the Redis version seen by every process."""
+        other_process = AuthUserCache()
+        other_process._get_redis = cache._get_redis
+
+        version = await cache.get_version("user-1")
+        other_process.put("user-1", make_user(), version)
+
+        await cache.invalidate("user-1")
+
+        new_version = await other_process.get_version("user-1")
+        assert new_version != version
+        assert other_process.get("user-1", new_version) is None
+
+    async def test_ttl_expiry(self, cache):
+        """✅ Entries older than the TTL are dropped."""
+        cache.put("user-1", make_user(), "0")
+
+        with patch("app.core.user_cache.time.monotonic", return_value=10**9):
+            assert cache.get("user-1", "0") is None
+
+    async def test_lru_eviction(self, cache):
+        """✅ Least recently used entry is evicted past max_size."""
+        cache.put("user-1", make_user("user-1"), "0")
+        cache.put("user-2", make_user("user-2"), "0")
+        cache.get("user-1", "0")
+        cache.put("user-3", make_user("user-3"), "0")
+
+        assert cache.get("user-2", "0") is None
+        assert cache.get("user-1", "0") is not None
+        assert cache.get("user-3", "0") is not None
+
+
+# ============================================================================
+# get_current_user
+# ============================================================================
+
+def user_result(user):
+    """Mock execute() result for a user query."""
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = user
+    return result
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGetCurrentUserCaching:
+    """Test get_current_user with the cache."""
+
+    async def test_second_request_skips_database(self, cache):
+        """✅ Repeated requests are served from the cache."""
+        db = AsyncMock()
+        db.execute.return_value = user_result(make_user())
+        token = create_access_token({"sub": "user-1"})
+
+        with patch("app.core.auth.auth_user_cache", cache):
+            first = await get_current_user(token, db)
+            second = await get_current_user(token, db)
+
+        assert first.id == second.id == "user-1"
+        assert db.execute.call_count == 1
+
+    async def test_invalidation_reloads(self, cache):
+        """✅ After invalidation the user is reloaded and re-checked."""
+        db = AsyncMock()
+        db.execute.return_value = user_result(make_user())
+        token = create_access_token({"sub": "user-1"})
+
+        with patch("app.core.auth.auth_user_cache", cache):
+            await get_current_user(token, db)
+            await cache.invalidate("user-1")
+            db.execute.return_value = user_result(make_user(status="disabled"))
+
+            with pytest.raises(HTTPException) as exc:
+                await get_current_user(token, db)
+
+        assert exc.value.status_code == status.HTTP_403_FORBIDDEN
+        assert db.execute.call_count == 2
+
+    async def test_redis_down_uses_database(self, cache):
+        """❌ Redis failure → every request loads the user from the database."""
+        cache._get_redis = AsyncMock(side_effect=ConnectionError("down"))
+        db = AsyncMock()
+        db.execute.return_value = user_result(make_user())
+        token = create_access_token({"sub": "user-1"})
+
+        with patch("app.core.auth.auth_user_cache", cache):
+            await get_current_user(token, db)
+            await get_current_user(token, db)
+
+        assert db.execute.call_count == 2
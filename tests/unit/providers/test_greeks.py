@@ -0,0 +1,202 @@
+"""Unit tests for the vectorized Black-Scholes greeks solver.
+
+This module tests the normal CDF approximation, implied volatility round
+trips and no-solution cases, rate curve interpolation, and filling missing
+IV/delta on parsed chains.
+"""
+import math
+import pytest
+import numpy as np
+from datetime import date, timedelta
+
+from app.providers.greeks import (
+    bs_delta,
+    bs_price,
+    fill_missing_greeks,
+    implied_vol,
+    norm_cdf,
+    rate_for_dte
+)
+from app.services.signal_engine import select_vol_point
+from tests.conftest import create_contract, create_expiry
+
+
+# ============================================================================
+# Tests for pricing
+# ============================================================================
+
+@pytest.mark.unit
+class TestPricing:
+    """Test the normal CDF and Black-Scholes price/delta."""
+
+    def test_norm_cdf_accuracy(self):
+        """✅ CDF matches math.erf to within the approximation error."""
+        x = np.linspace(-8, 8, 1601)
+        exact = np.array([0.5 * (1.0 + math.erf(v / math.sqrt(2.0))) for v in x])
+
+        assert np.abs(norm_cdf(x) - exact).max() < 1e-7
+
+    def test_put_call_parity(self):
+        """✅ C - P = S - K·e^(-rT)."""
+        strike = np.array([400.0, 450.0, 500.0])
+        call = bs_price(450.0, strike, 0.25, 0.05, 0.3, True)
+        put = bs_price(450.0, strike, 0.25, 0.05, 0.3, False)
+
+        np.testing.assert_allclose(call - put, 450.0 - strike * math.exp(-0.05 * 0.25), atol=1e-5)
+
+    def test_delta_sign(self):
+        """✅ Calls have delta in (0, 1), puts in (-1, 0)."""
+        call = bs_delta(450.0, 450.0, 0.25, 0.045, 0.25, True)
+        put = bs_delta(450.0, 450.0, 0.25, 0.045, 0.25, False)
+
+        assert 0.5 < call < 1.0
+        assert -0.5 < put < 0.0
+        assert call - put == pytest.approx(1.0)
+
+
+# ============================================================================
+# Tests for implied_vol
+# ============================================================================
+
+@pytest.mark.unit
+class TestImpliedVol:
+    """Test vectorized implied volatility."""
+
+    def test_round_trip(self):
+        """✅ Recovers the volatility a price was generated from, calls and puts."""
+        rng = np.random.default_rng(0)
+        n = 2000
+        strike = 450.0 * rng.uniform(0.9, 1.1, n)
+        t = rng.uniform(14, 365, n) / 365.0
+        sigma = rng.uniform(0.1, 1.0, n)
+        is_call = rng.random(n) < 0.5
+        price = bs_price(450.0, strike, t, 0.045, sigma, is_call)
+
+        solved = implied_vol(price, 450.0, strike, t, 0.045, is_call)
+
+        assert not np.isnan(solved).any()
+        np.testing.assert_allclose(bs_price(450.0, strike, t, 0.045, solved, is_call), price, atol=1e-5)
+        np.testing.assert_allclose(solved, sigma, atol=1e-3)
+
+    def test_deep_otm(self):
+        """✅ Solves cheap far-from-the-money options where vega is tiny."""
+        price = bs_price(450.0, 600.0, 30 / 365, 0.045, 0.8, True)
+
+        assert implied_vol(price, 450.0, 600.0, 30 / 365, 0.045, True) == pytest.approx(0.8, abs=1e-3)
+
+    def test_outside_no_arbitrage_bounds(self):
+        """❌ Prices below intrinsic or above spot → NaN."""
+        solved = implied_vol([40.0, 460.0, 20.0], 450.0, [400.0, 450.0, 450.0], 0.25, 0.045, True)
+
+        assert np.isnan(solved[0])  # Below the forward intrinsic (~54.5)
+        assert np.isnan(solved[1])  # Above spot
+        assert not np.isnan(solved[2])
+
+    def test_expired(self):
+        """❌ No time to expiry → NaN."""
+        assert np.isnan(implied_vol(5.0, 450.0, 450.0, 0.0, 0.045, True))
+
+
+# ============================================================================
+# Tests for rate_for_dte
+# ============================================================================
+
+@pytest.mark.unit
+class TestRateForDte:
+    """Test risk-free rate interpolation."""
+
+    def test_interpolates_and_flat_extrapolation(self):
+        """✅ Linear between points, flat outside them."""
+        curve = [(90, 0.04), (30, 0.05)]
+
+        np.testing.assert_allclose(rate_for_dte(curve, [0, 30, 60, 90, 400]), [0.05, 0.05, 0.045, 0.04, 0.04])
+
+    def test_single_point(self):
+        """✅ One point is a flat curve."""
+        assert rate_for_dte([(0, 0.045)], 120) == pytest.approx(0.045)
+
+
+# ============================================================================
+# Tests for fill_missing_greeks
+# ============================================================================
+
+TODAY = date(2026, 3, 2)
+
+
+def expiry_for(dte: int, contracts):
+    """Expiry `dte` days out holding the given contracts."""
+    return create_expiry(TODAY + timedelta(days=dte), dte, contracts)
+
+
+def unsolved_contract(strike: float, option_type: str, dte: int, bid: float, ask: float):
+    """Contract the provider returned without IV or delta."""
+    contract = create_contract(strike, option_type, TODAY + timedelta(days=dte), bid=bid, ask=ask)
+    contract.implied_volatility = None
+    contract.delta = None
+    return contract
+
+
+def quoted_contract(strike: float, option_type: str, dte: int, sigma: float = 0.25, spread: float = 0.1):
+    """Contract without greeks, quoted around its Black-Scholes price."""
+    price = float(bs_price(450.0, strike, dte / 365.0, 0.045, sigma, option_type == "call"))
+    return unsolved_contract(strike, option_type, dte, price - spread / 2, price + spread / 2)
+
+
+@pytest.mark.unit
+class TestFillMissingGreeks:
+    """Test solving IV/delta on parsed chains."""
+
+    def test_fills_missing(self):
+        """✅ Contracts without greeks get the IV and delta of their mid."""
+        call = quoted_contract(450.0, "call", 30, sigma=0.3)
+        put = quoted_contract(430.0, "put", 30, sigma=0.3)
+        expiry = expiry_for(30, [call, put])
+
+        filled = fill_missing_greeks([expiry], 450.0, [(0, 0.045)])
+
+        assert filled == 2
+        assert call.implied_volatility == pytest.approx(0.3, abs=1e-3)
+        assert put.implied_volatility == pytest.approx(0.3, abs=1e-3)
+        assert 0.5 < call.delta < 0.6
+        assert -0.5 < put.delta < 0.0
+
+    def test_keeps_provider_values(self):
+        """✅ Provider IV/delta are never overwritten; delta is derived from the provider's IV."""
+        complete = create_contract(450.0, "call", TODAY + timedelta(days=30), implied_volatility=0.22, delta=0.52)
+        iv_only = quoted_contract(450.0, "put", 30, sigma=0.3)
+        iv_only.implied_volatility = 0.4
+        expiry = expiry_for(30, [complete, iv_only])
+
+        filled = fill_missing_greeks([expiry], 450.0, [(0, 0.045)])
+
+        assert filled == 1
+        assert complete.implied_volatility == 0.22 and complete.delta == 0.52
+        assert iv_only.implied_volatility == 0.4
+        assert iv_only.delta == pytest.approx(float(bs_delta(450.0, 450.0, 30 / 365, 0.045, 0.4, False)))
+
+    def test_unquoted_or_unsolvable_left_alone(self):
+        """❌ No two-sided quote, crossed quote or below-intrinsic mid → unchanged."""
+        no_bid = quoted_contract(450.0, "call", 30)
+        no_bid.bid = None
+        crossed = quoted_contract(450.0, "put", 30)
+        crossed.bid, crossed.ask = crossed.ask, crossed.bid
+        below_intrinsic = unsolved_contract(400.0, "call", 30, bid=10.0, ask=10.2)
+        expiry = expiry_for(30, [no_bid, crossed, below_intrinsic])
+
+        filled = fill_missing_greeks([expiry], 450.0, [(0, 0.045)])
+
+        assert filled == 0
+        for contract in (no_bid, crossed, below_intrinsic):
+            assert contract.implied_volatility is None and contract.delta is None
+
+    def test_enables_delta_vol_points(self):
+        """✅ Delta-based vol points find contracts once greeks are solved."""
+        dte = 45
+        puts = [quoted_contract(k, "put", dte, sigma=0.25) for k in range(400, 455, 5)]
+        expiry = expiry_for(dte, puts)
+        assert select_vol_point(expiry, 450.0, "35d_put") is None
+
+        fill_missing_greeks([expiry], 450.0, [(0, 0.045)])
+
+        iv = select_vol_point(expiry, 450.0, "35d_put")
+        assert iv == pytest.approx(0.25, abs=1e-3)
@@ -7,8 +7,10 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import date
 import httpx
+from prometheus_client import REGISTRY
 
 # Mock imports
+from app.core.metrics import PROCESS_ROLE
 from app.providers.polygon import PolygonProvider
 from app.providers import ProviderError
 
@@ -26,6 +28,11 @@ def mock_client():
         yield client_instance
 
 
+def sample(name: str, **labels):
+    """Read a provider metric sample for this process (0 if absent)."""
+    return REGISTRY.get_sample_value(name, {"role": PROCESS_ROLE, **labels}) or 0
+
+
 @pytest.fixture
 def provider(mock_client):
     """Create PolygonProvider instance."""
@@ -79,6 +86,41 @@ class TestGetChainSnapshot:
         assert snapshot.expiries[0].expiry_date == date(2025, 1, 17)
         assert len(snapshot.expiries[0].contracts) == 1
     
+    async def test_custom_base_url(self, mock_client):
+        """✅ base_url (e.g. a fake Polygon for load tests) prefixes every request."""
+        provider = PolygonProvider(api_key="test-key", base_url="http://localhost:9001/")
+        price_resp = MagicMock()
+        price_resp.json.return_value = {"results": [{"c": 450.0}]}
+        snapshot_resp = MagicMock()
+        snapshot_resp.json.return_value = {"status": "OK", "results": []}
+        mock_client.get.side_effect = [price_resp, snapshot_resp]
+        
+        await provider.get_chain_snapshot("SPY")
+        
+        urls = [call.args[0] for call in mock_client.get.call_args_list]
+        assert urls == [
+            "http://localhost:9001/v2/aggs/ticker/SPY/prev",
+            "http://localhost:9001/v3/snapshot/options/SPY",
+        ]
+    
+    async def test_records_request_and_chain_metrics(self, provider, mock_client):
+        """✅ Request latency per endpoint and chain size are recorded."""
+        price_resp = MagicMock()
+        price_resp.json.return_value = {"results": [{"c": 450.0}]}
+        snapshot_resp = MagicMock()
+        snapshot_resp.json.return_value = {"status": "OK", "results": []}
+        mock_client.get.side_effect = [price_resp, snapshot_resp]
+        
+        prev_before = sample("ffbot_polygon_request_duration_seconds_count", endpoint="prev", status="ok")
+        snapshot_before = sample("ffbot_polygon_request_duration_seconds_count", endpoint="snapshot", status="ok")
+        chains_before = sample("ffbot_chain_contracts_count")
+        
+        await provider.get_chain_snapshot("SPY")
+        
+        assert sample("ffbot_polygon_request_duration_seconds_count", endpoint="prev", status="ok") == prev_before + 1
+        assert sample("ffbot_polygon_request_duration_seconds_count", endpoint="snapshot", status="ok") == snapshot_before + 1
+        assert sample("ffbot_chain_contracts_count") == chains_before + 1
+    
     async def test_api_error_status(self, provider, mock_client):
         """✅ API error (non-OK status) → ProviderError."""
         price_resp = MagicMock()
@@ -108,11 +150,13 @@ class TestGetChainSnapshot:
         error_resp = MagicMock()
         error_resp.status_code = 403
         mock_client.get.side_effect = httpx.HTTPStatusError("403 Forbidden", request=None, response=error_resp)
+        before = sample("ffbot_polygon_request_duration_seconds_count", endpoint="prev", status="403")
         
         with pytest.raises(ProviderError) as exc:
             await provider.get_chain_snapshot("SPY")
         
         assert "Access Denied" in str(exc.value)
+        assert sample("ffbot_polygon_request_duration_seconds_count", endpoint="prev", status="403") == before + 1
 
 
 # ============================================================================
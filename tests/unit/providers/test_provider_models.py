@@ -3,6 +3,7 @@
 Tests helper methods used by the Signal Engine to access option chain data.
 """
 import pytest
+import random
 from datetime import date
 
 from app.providers.models import Contract, Expiry, ChainSnapshot
@@ -63,6 +64,40 @@ class TestChainSnapshot:
         
         expiry = chain.get_expiry_by_dte(target_dte=30, tolerance=5)
         assert expiry is None
+    
+    def test_get_expiry_by_dte_tie_picks_first_listed(self):
+        """✅ Equidistant expiries → the one listed first, even if unsorted."""
+        chain = create_chain_snapshot(
+            expiries=[
+                create_expiry(date(2025, 1, 18), 33),
+                create_expiry(date(2025, 2, 14), 60),
+                create_expiry(date(2025, 1, 12), 27),
+            ]
+        )
+        
+        assert chain.get_expiry_by_dte(target_dte=30, tolerance=5) is chain.expiries[0]
+    
+    def test_get_expiry_by_dte_matches_linear_scan(self):
+        """✅ Bisect lookup returns the same expiry as a scan over all expiries."""
+        rng = random.Random(3)
+        for _ in range(200):
+            expiries = [create_expiry(date(2025, 1, 1), rng.randint(0, 60), contracts=[]) for _ in range(rng.randint(0, 15))]
+            chain = create_chain_snapshot(expiries=expiries)
+            for _ in range(5):
+                target, tolerance = rng.randint(-5, 65), rng.randint(0, 10)
+                candidates = [e for e in expiries if abs(e.dte - target) <= tolerance]
+                expected = min(candidates, key=lambda e: abs(e.dte - target)) if candidates else None
+                assert chain.get_expiry_by_dte(target, tolerance) is expected
+    
+    def test_get_expiry_by_dte_memoized(self):
+        """✅ Each (target, tolerance) is looked up once per chain."""
+        chain = create_chain_snapshot()
+        
+        first = chain.get_expiry_by_dte(target_dte=30, tolerance=5)
+        chain.derived["dte_index"] = ([], [])  # A second bisect would find nothing
+        
+        assert chain.get_expiry_by_dte(target_dte=30, tolerance=5) is first
+        assert chain.get_expiry_by_dte(target_dte=60, tolerance=5) is None
 
 
 # ============================================================================
@@ -0,0 +1,167 @@
+"""Unit tests for ReplayProvider.
+
+This module tests recording chains as replay frames, reading and writing
+replay files, serving snapshots in step and clock modes, and debouncing
+replayed chains on their recorded time.
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+from datetime import datetime, timedelta, timezone
+import fakeredis.aioredis
+
+from app.providers import ProviderError
+from app.providers.replay import ReplayFrame, ReplayProvider, read_frames, write_frames
+from app.services.stability_tracker import StabilityTracker
+from tests.synthetic import make_polygon_results
+
+
+T0 = datetime(2026, 3, 2, 14, 30, tzinfo=timezone.utc)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+def make_frame(ticker: str = "SPY", minutes: int = 0, price: float = 450.0) -> ReplayFrame:
+    """Small recorded frame taken `minutes` after T0."""
+    return ReplayFrame(
+        ticker=ticker,
+        as_of=T0 + timedelta(minutes=minutes),
+        underlying_price=price,
+        results=make_polygon_results(n_expiries=4, n_strikes=5, seed=minutes, ticker=ticker, underlying_price=price)
+    )
+
+
+@pytest.fixture
+def frames():
+    """Three SPY frames five minutes apart and one QQQ frame."""
+    return [make_frame("SPY", 10, 452.0), make_frame("SPY", 0, 450.0), make_frame("SPY", 5, 451.0), make_frame("QQQ", 0, 380.0)]
+
+
+# ============================================================================
+# Tests for ReplayFrame
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReplayFrame:
+    """Test frame serialization."""
+
+    async def test_from_chain_round_trip(self, frames):
+        """✅ A served chain recorded again parses to the same chain."""
+        provider = ReplayProvider(frames, speed=None)
+        chain = await provider.get_chain_snapshot("SPY")
+
+        replayed = await ReplayProvider([ReplayFrame.from_chain(chain)], speed=None).get_chain_snapshot("SPY")
+
+        assert replayed == chain
+
+    async def test_file_round_trip(self, frames, tmp_path):
+        """✅ Frames written to a gzipped file read back unchanged."""
+        path = tmp_path / "day.jsonl.gz"
+        assert write_frames(str(path), frames) == 4
+
+        assert read_frames(str(path)) == frames
+
+    async def test_read_directory_filters_tickers(self, frames, tmp_path):
+        """✅ Reading a directory loads every file, keeping only requested tickers."""
+        write_frames(str(tmp_path / "a.jsonl"), frames[:2])
+        write_frames(str(tmp_path / "b.jsonl.gz"), frames[2:])
+
+        loaded = read_frames(str(tmp_path), tickers=["spy"])
+
+        assert [f.ticker for f in loaded] == ["SPY", "SPY", "SPY"]
+
+
+# ============================================================================
+# Tests for get_chain_snapshot
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGetChainSnapshot:
+    """Test serving recorded snapshots."""
+
+    async def test_step_mode_serves_frames_in_order(self, frames):
+        """✅ Step mode → each call returns the next snapshot by time."""
+        provider = ReplayProvider(frames, speed=None)
+
+        served = [await provider.get_chain_snapshot("spy") for _ in range(3)]
+
+        assert [c.as_of for c in served] == [T0, T0 + timedelta(minutes=5), T0 + timedelta(minutes=10)]
+        assert [c.underlying_price for c in served] == [450.0, 451.0, 452.0]
+        assert not provider.exhausted  # QQQ not served yet
+        await provider.get_chain_snapshot("QQQ")
+        assert provider.exhausted
+
+    async def test_step_mode_exhausted(self, frames):
+        """❌ Past the last snapshot → ProviderError."""
+        provider = ReplayProvider(frames, speed=None)
+        await provider.get_chain_snapshot("QQQ")
+
+        with pytest.raises(ProviderError, match="exhausted"):
+            await provider.get_chain_snapshot("QQQ")
+
+    async def test_unknown_ticker(self, frames):
+        """❌ No recorded snapshots → ProviderError."""
+        provider = ReplayProvider(frames)
+
+        with pytest.raises(ProviderError, match="No recorded snapshots"):
+            await provider.get_chain_snapshot("IWM")
+
+    async def test_dte_counted_from_snapshot_date(self, frames):
+        """✅ DTEs are relative to the recording day, not today."""
+        chain = await ReplayProvider(frames, speed=None).get_chain_snapshot("SPY")
+
+        for expiry in chain.expiries:
+            assert expiry.dte == (expiry.expiry_date - T0.date()).days
+
+    async def test_clock_mode_follows_replay_clock(self, frames):
+        """✅ Clock mode → latest snapshot at or before start + elapsed * speed."""
+        provider = ReplayProvider(frames, speed=60.0)
+
+        with patch("app.providers.replay.time.monotonic", return_value=1000.0):
+            first = await provider.get_chain_snapshot("SPY")
+        # 6 wall seconds at 60x = 6 replay minutes
+        with patch("app.providers.replay.time.monotonic", return_value=1006.0):
+            second = await provider.get_chain_snapshot("SPY")
+            again = await provider.get_chain_snapshot("SPY")
+            assert not provider.exhausted
+        with patch("app.providers.replay.time.monotonic", return_value=1011.0):
+            assert provider.exhausted
+
+        assert first.as_of == T0
+        assert second.as_of == T0 + timedelta(minutes=5)
+        assert again is second  # Parsed once per frame
+
+
+# ============================================================================
+# Tests for stability on the replay clock
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReplayStability:
+    """Test that replayed chains debounce on their recorded time."""
+
+    async def test_cooldown_follows_recorded_time(self):
+        """✅ A day replayed in step mode alerts and cools down as it did live."""
+        redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        tracker = StabilityTracker()
+        tracker._get_redis = AsyncMock(return_value=redis)
+        # Five frames half an hour apart; FF rises steadily
+        provider = ReplayProvider([make_frame("SPY", minutes) for minutes in range(0, 150, 30)], speed=None)
+        front, back = T0.date() + timedelta(days=30), T0.date() + timedelta(days=60)
+
+        reasons = []
+        for scan in range(5):
+            chain = await provider.get_chain_snapshot("SPY")
+            should_alert, state = await tracker.check_stability(
+                "SPY", front, back, 0.30 + 0.05 * scan,
+                required_scans=2, cooldown_minutes=60, now=chain.as_of
+            )
+            reasons.append(state["reason"])
+
+        # Alerts on the second frame, cools down for an hour of recorded time, then re-alerts
+        assert reasons == ["first_scan", "stable", "cooldown_30.0min", "stable", "cooldown_30.0min"]
+        await redis.aclose()
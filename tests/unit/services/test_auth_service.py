@@ -37,13 +37,21 @@ def mock_user():
 @pytest.fixture
 def mock_auth_utils():
     """Mock auth utility functions."""
-    with patch("app.services.auth_service.hash_password") as mock_hash, \
-         patch("app.services.auth_service.verify_password") as mock_verify:
+    with patch("app.services.auth_service.hash_password_async", new_callable=AsyncMock) as mock_hash, \
+         patch("app.services.auth_service.verify_and_update_password_async", new_callable=AsyncMock) as mock_verify:
         mock_hash.return_value = "hashed_password"
-        mock_verify.return_value = True
+        mock_verify.return_value = (True, None)
         yield mock_hash, mock_verify
 
 
+@pytest.fixture(autouse=True)
+def mock_user_cache():
+    """Mock the authenticated-user cache invalidated on user changes."""
+    with patch("app.services.auth_service.auth_user_cache") as cache:
+        cache.invalidate = AsyncMock()
+        yield cache
+
+
 # ============================================================================
 # Tests for register_user
 # ============================================================================
@@ -115,7 +123,7 @@ class TestAuthenticateUser:
     async def test_invalid_password(self, mock_db, mock_user, mock_auth_utils):
         """✅ Invalid password → return None."""
         mock_hash, mock_verify = mock_auth_utils
-        mock_verify.return_value = False
+        mock_verify.return_value = (False, None)
         
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = mock_user
@@ -124,6 +132,22 @@ class TestAuthenticateUser:
         user = await AuthService.authenticate_user("test@example.com", "wrongpass", mock_db)
         
         assert user is None
+    
+    async def test_outdated_cost_rehashed(self, mock_db, mock_user, mock_auth_utils, mock_user_cache):
+        """✅ Valid password with outdated bcrypt cost → hash upgraded."""
+        mock_hash, mock_verify = mock_auth_utils
+        mock_verify.return_value = (True, "new_hash")
+        
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_user
+        mock_db.execute.return_value = mock_result
+        
+        user = await AuthService.authenticate_user("test@example.com", "password123", mock_db)
+        
+        assert user == mock_user
+        assert mock_user.password_hash == "new_hash"
+        mock_db.commit.assert_called_once()
+        mock_user_cache.invalidate.assert_awaited_once_with("user-123")
 
 
 # ============================================================================
@@ -152,7 +176,7 @@ class TestLinkCode:
         assert code == "existing-code"
         mock_db.add.assert_not_called()
     
-    async def test_ensure_link_code_new(self, mock_db, mock_user):
+    async def test_ensure_link_code_new(self, mock_db, mock_user, mock_user_cache):
         """✅ No code → generate and save."""
         mock_user.link_code = None
         
@@ -162,6 +186,7 @@ class TestLinkCode:
         assert mock_user.link_code == code
         mock_db.add.assert_called_once_with(mock_user)
         mock_db.commit.assert_called_once()
+        mock_user_cache.invalidate.assert_awaited_once_with("user-123")
 
     async def test_verify_link_code_success(self, mock_db, mock_user):
         """✅ Valid code → link account by creating TelegramChat."""
@@ -0,0 +1,116 @@
+"""Unit tests for the ETag response cache.
+
+This module tests ResponseCache, which derives ETags from per-scope data
+versions and stores serialized GET responses in Redis.
+"""
+import pytest
+from unittest.mock import AsyncMock
+import fakeredis.aioredis
+
+from app.services.response_cache import ResponseCache, SIGNALS, SUBSCRIPTIONS, SETTINGS
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+async def fake_redis():
+    """Create a FakeRedis instance for testing."""
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield redis
+    await redis.flushall()
+    await redis.aclose()
+
+
+@pytest.fixture
+async def cache(fake_redis):
+    """Create ResponseCache instance with mocked Redis."""
+    cache = ResponseCache()
+    cache._get_redis = AsyncMock(return_value=fake_redis)
+    cache.redis = fake_redis
+    return cache
+
+
+# ============================================================================
+# ETags
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestMakeEtag:
+    """Test ETag derivation from data versions."""
+
+    async def test_stable_without_changes(self, cache):
+        """✅ Same request and versions give the same quoted ETag."""
+        first = await cache.make_etag("user-1", "/api/signals", "limit=50", [SIGNALS])
+        second = await cache.make_etag("user-1", "/api/signals", "limit=50", [SIGNALS])
+
+        assert first == second
+        assert first.startswith('"') and first.endswith('"')
+
+    async def test_differs_by_user_route_and_params(self, cache):
+        """✅ User, route and params are all part of the key."""
+        base = await cache.make_etag("user-1", "/api/signals", "limit=50", [SIGNALS])
+
+        assert await cache.make_etag("user-2", "/api/signals", "limit=50", [SIGNALS]) != base
+        assert await cache.make_etag("user-1", "/signals", "limit=50", [SIGNALS]) != base
+        assert await cache.make_etag("user-1", "/api/signals", "limit=10", [SIGNALS]) != base
+
+    async def test_global_bump_changes_every_user(self, cache):
+        """✅ Bumping SIGNALS invalidates all users' ETags."""
+        before_1 = await cache.make_etag("user-1", "/api/signals", "", [SIGNALS])
+        before_2 = await cache.make_etag("user-2", "/api/signals", "", [SIGNALS])
+
+        await cache.bump(SIGNALS)
+
+        assert await cache.make_etag("user-1", "/api/signals", "", [SIGNALS]) != before_1
+        assert await cache.make_etag("user-2", "/api/signals", "", [SIGNALS]) != before_2
+
+    async def test_user_bump_is_scoped(self, cache):
+        """✅ Per-user scopes only invalidate the owner's ETags."""
+        before_1 = await cache.make_etag("user-1", "/api/watchlist", "", [SUBSCRIPTIONS])
+        before_2 = await cache.make_etag("user-2", "/api/watchlist", "", [SUBSCRIPTIONS])
+
+        await cache.bump(SUBSCRIPTIONS, "user-1")
+
+        assert await cache.make_etag("user-1", "/api/watchlist", "", [SUBSCRIPTIONS]) != before_1
+        assert await cache.make_etag("user-2", "/api/watchlist", "", [SUBSCRIPTIONS]) == before_2
+
+    async def test_unrelated_scope_ignored(self, cache):
+        """✅ Bumping a scope the response does not depend on keeps the ETag."""
+        before = await cache.make_etag("user-1", "/api/settings", "", [SETTINGS])
+
+        await cache.bump(SUBSCRIPTIONS, "user-1")
+
+        assert await cache.make_etag("user-1", "/api/settings", "", [SETTINGS]) == before
+
+    async def test_auth_version_is_part_of_key(self, cache):
+        """✅ A new auth version (user invalidated) gives a new ETag."""
+        before = await cache.make_etag("user-1", "/api/settings", "", [SETTINGS], auth_version="0")
+
+        assert await cache.make_etag("user-1", "/api/settings", "", [SETTINGS], auth_version="0") == before
+        assert await cache.make_etag("user-1", "/api/settings", "", [SETTINGS], auth_version="1") != before
+
+
+# ============================================================================
+# Bodies
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBodies:
+    """Test cached response storage."""
+
+    async def test_round_trip(self, cache, fake_redis):
+        """✅ Stored body is returned with a TTL."""
+        cached = {"headers": [["content-type", "application/json"]], "body": "[]"}
+
+        await cache.set_body('"abc"', cached)
+
+        assert await cache.get_body('"abc"') == cached
+        assert 0 < await fake_redis.ttl('response_cache:"abc"') <= ResponseCache.BODY_TTL_SECONDS
+
+    async def test_missing(self, cache):
+        """❌ Unknown ETag returns None."""
+        assert await cache.get_body('"missing"') is None
@@ -0,0 +1,88 @@
+"""Unit tests for the scan fingerprint cache.
+
+This module tests ScanFingerprintCache, which lets the scan worker skip
+rescans of a chain identical to the last settled full scan.
+"""
+import json
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock
+import fakeredis.aioredis
+
+from app.services.scan_fingerprint import ScanFingerprintCache
+
+
+PAIRS = {(date(2025, 1, 17), date(2025, 2, 14)), (date(2025, 1, 17), date(2025, 3, 21))}
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+async def fake_redis():
+    """Create a FakeRedis instance for testing."""
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield redis
+    await redis.flushall()
+    await redis.aclose()
+
+
+@pytest.fixture
+async def fingerprint_cache(fake_redis):
+    """Create ScanFingerprintCache instance with mocked Redis."""
+    cache = ScanFingerprintCache()
+    cache._get_redis = AsyncMock(return_value=fake_redis)
+    cache.redis = fake_redis
+    return cache
+
+
+# ============================================================================
+# Tests for store() / unchanged_pairs()
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestScanFingerprintCache:
+    """Test recording and matching full scans."""
+    
+    async def test_settled_match(self, fingerprint_cache):
+        """✅ Same fingerprint after a settled scan → pairs to refresh."""
+        await fingerprint_cache.store("SPY", "scan", "abc", PAIRS, settled=True, ttl_seconds=900)
+        
+        pairs = await fingerprint_cache.unchanged_pairs("SPY", "scan", "abc")
+        
+        assert pairs == [("2025-01-17", "2025-02-14"), ("2025-01-17", "2025-03-21")]
+    
+    async def test_no_signals_match(self, fingerprint_cache):
+        """✅ Settled scan without signals → nothing to refresh, still unchanged."""
+        await fingerprint_cache.store("SPY", "scan", "abc", set(), settled=True, ttl_seconds=900)
+        
+        assert await fingerprint_cache.unchanged_pairs("SPY", "scan", "abc") == []
+    
+    async def test_different_fingerprint(self, fingerprint_cache):
+        """❌ Chain changed → full scan."""
+        await fingerprint_cache.store("SPY", "scan", "abc", PAIRS, settled=True, ttl_seconds=900)
+        
+        assert await fingerprint_cache.unchanged_pairs("SPY", "scan", "def") is None
+    
+    async def test_unsettled(self, fingerprint_cache):
+        """❌ Last scan left a pair debouncing → full scan."""
+        await fingerprint_cache.store("SPY", "scan", "abc", PAIRS, settled=False, ttl_seconds=900)
+        
+        assert await fingerprint_cache.unchanged_pairs("SPY", "scan", "abc") is None
+    
+    async def test_keyed_by_ticker_and_mode(self, fingerprint_cache):
+        """❌ Discovery scans and other tickers keep their own records."""
+        await fingerprint_cache.store("SPY", "scan", "abc", PAIRS, settled=True, ttl_seconds=900)
+        
+        assert await fingerprint_cache.unchanged_pairs("SPY", "discovery", "abc") is None
+        assert await fingerprint_cache.unchanged_pairs("QQQ", "scan", "abc") is None
+    
+    async def test_record_expires(self, fingerprint_cache, fake_redis):
+        """✅ Records carry the TTL, forcing periodic full scans."""
+        await fingerprint_cache.store("SPY", "scan", "abc", PAIRS, settled=True, ttl_seconds=900)
+        
+        key = fingerprint_cache._make_key("SPY", "scan")
+        assert 0 < await fake_redis.ttl(key) <= 900
+        assert json.loads(await fake_redis.get(key))["fingerprint"] == "abc"
@@ -0,0 +1,95 @@
+"""Unit tests for the signal dedupe front-cache.
+
+This module tests SignalDedupeCache, which claims today's signal dedupe keys
+in Redis so certain duplicates skip the database.
+"""
+import pytest
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock
+import fakeredis.aioredis
+
+from app.services.signal_dedupe import SignalDedupeCache
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+async def fake_redis():
+    """Create a FakeRedis instance for testing."""
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield redis
+    await redis.flushall()
+    await redis.aclose()
+
+
+@pytest.fixture
+async def dedupe_cache(fake_redis):
+    """Create SignalDedupeCache instance with mocked Redis."""
+    cache = SignalDedupeCache()
+    cache._get_redis = AsyncMock(return_value=fake_redis)
+    cache.redis = fake_redis
+    return cache
+
+
+def make_signal(back_expiry: date = date(2025, 2, 14), day: int = 2):
+    """Minimal signal dict carrying the fields used by the dedupe key."""
+    return {
+        "ticker": "SPY",
+        "front_expiry": date(2025, 1, 17),
+        "back_expiry": back_expiry,
+        "as_of_ts": datetime(2025, 1, day, 15, 0, tzinfo=timezone.utc),
+    }
+
+
+# ============================================================================
+# Tests for claim() / release()
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSignalDedupeCache:
+    """Test claiming and releasing dedupe keys."""
+    
+    async def test_first_claim_passes(self, dedupe_cache):
+        """✅ Unseen key → signal kept."""
+        signal = make_signal()
+        
+        assert await dedupe_cache.claim([signal]) == [signal]
+    
+    async def test_second_claim_is_certain_duplicate(self, dedupe_cache):
+        """✅ Key claimed earlier today → signal dropped."""
+        await dedupe_cache.claim([make_signal()])
+        
+        assert await dedupe_cache.claim([make_signal()]) == []
+    
+    async def test_batch_repeats_dropped(self, dedupe_cache):
+        """✅ Same key twice in one batch → kept once."""
+        other = make_signal(back_expiry=date(2025, 3, 21))
+        
+        fresh = await dedupe_cache.claim([make_signal(), make_signal(), other])
+        
+        assert len(fresh) == 2
+        assert fresh[1] is other
+    
+    async def test_next_day_not_duplicate(self, dedupe_cache):
+        """✅ Same pair on a new day → separate set, signal kept."""
+        await dedupe_cache.claim([make_signal(day=2)])
+        
+        assert len(await dedupe_cache.claim([make_signal(day=3)])) == 1
+    
+    async def test_day_set_expires(self, dedupe_cache, fake_redis):
+        """✅ Day set carries a TTL."""
+        await dedupe_cache.claim([make_signal()])
+        
+        ttl = await fake_redis.ttl("signal_dedupe:2025-01-02")
+        assert 0 < ttl <= SignalDedupeCache.KEY_TTL_SECONDS
+    
+    async def test_release_allows_reclaim(self, dedupe_cache):
+        """✅ Released key can be claimed again."""
+        signal = make_signal()
+        await dedupe_cache.claim([signal])
+        await dedupe_cache.release([signal])
+        
+        assert await dedupe_cache.claim([signal]) == [signal]
@@ -5,14 +5,18 @@ All mathematical formulas are validated against the Forward Factor calculation r
 """
 import pytest
 import numpy as np
-from datetime import date, datetime
+from unittest.mock import patch
+from datetime import date, datetime, timedelta
 from typing import List
 
 from app.services.signal_engine import (
     forward_factor,
+    term_structure,
+    select_contract,
     select_vol_point,
     pair_expiries,
     apply_liquidity_filters,
+    chain_fingerprint,
     compute_signals
 )
 from app.providers.models import Contract, Expiry, ChainSnapshot
@@ -757,3 +761,171 @@ class TestComputeSignals:
             signal = signals[0]
             if len(signal["reason_codes"]) == 0:
                 assert signal["quality_score"] == 1.0
+
+
+# ============================================================================
+# Tests for term_structure()
+# ============================================================================
+
+@pytest.mark.unit
+class TestTermStructure:
+    """Test the per-chain Forward Factor matrix."""
+    
+    def _chain(self):
+        ivs = [(7, 0.45), (30, 0.35), (60, 0.25), (90, 0.24)]
+        expiries = [
+            create_expiry(date(2025, 1, 1) + timedelta(days=dte), dte, contracts=[
+                create_contract(600.0, "call", implied_volatility=iv)
+            ])
+            for dte, iv in ivs
+        ]
+        # One expiry without IV at the vol point
+        expiries.append(create_expiry(date(2025, 6, 1), 120, contracts=[
+            create_contract(600.0, "call", implied_volatility=None)
+        ]))
+        return create_chain_snapshot(expiries=expiries)
+    
+    def test_matrix_matches_forward_factor(self):
+        """✅ Every [front, back] entry equals forward_factor() (NaN where None)."""
+        chain = self._chain()
+        structure = term_structure(chain, "ATM")
+        
+        for i, front in enumerate(chain.expiries):
+            for j, back in enumerate(chain.expiries):
+                front_iv = select_vol_point(front, chain.underlying_price, "ATM")
+                back_iv = select_vol_point(back, chain.underlying_price, "ATM")
+                expected = None
+                if front_iv is not None and back_iv is not None:
+                    expected = forward_factor(front_iv, front.dte, back_iv, back.dte)
+                if expected is None:
+                    assert np.isnan(structure.ff[i, j])
+                    assert np.isnan(structure.sigma_fwd[i, j])
+                else:
+                    assert structure.ff[i, j] == pytest.approx(expected)
+    
+    def test_computed_once_per_vol_point(self):
+        """✅ Cached on the chain per vol point and reused by compute_signals."""
+        chain = self._chain()
+        structure = term_structure(chain, "ATM")
+        
+        assert term_structure(chain, "ATM") is structure
+        assert term_structure(chain, "35d_put") is not structure
+        
+        settings = {
+            "ff_threshold": -10.0,
+            "dte_pairs": [{"front": 30, "back": 60, "front_tol": 5, "back_tol": 10}],
+            "vol_point": "ATM",
+            "sigma_fwd_floor": 0.0
+        }
+        signals = compute_signals(chain, settings)
+        front, back = structure.position(chain.expiries[1]), structure.position(chain.expiries[2])
+        
+        assert signals[0]["ff_value"] == structure.ff[front, back]
+        assert {("term_structure", "ATM"), ("term_structure", "35d_put")} <= set(chain.derived)
+    
+    def test_not_part_of_equality(self):
+        """✅ Cached values don't affect chain equality."""
+        chain = self._chain()
+        other = self._chain()
+        term_structure(chain, "ATM")
+        
+        assert chain == other
+
+
+# ============================================================================
+# Tests for select_contract()
+# ============================================================================
+
+@pytest.mark.unit
+class TestSelectContract:
+    """Test the per-chain contract selection cache."""
+    
+    def test_matches_select_vol_point(self, sample_chain_snapshot):
+        """✅ Cached selection has the same IV as select_vol_point()."""
+        chain = sample_chain_snapshot
+        
+        for expiry in chain.expiries:
+            for method in ("ATM", "35d_put", "35d_call", "bogus"):
+                selection = select_contract(chain, expiry, method)
+                assert selection.iv == select_vol_point(expiry, chain.underlying_price, method)
+    
+    def test_each_expiry_scanned_once(self, sample_chain_snapshot, default_user_settings):
+        """✅ ATM vol point and liquidity checks share one scan per expiry across users."""
+        chain = sample_chain_snapshot
+        settings = {**default_user_settings, "vol_point": "ATM", "ff_threshold": -10.0}
+        
+        with patch.object(Expiry, "get_atm_contract", autospec=True, side_effect=Expiry.get_atm_contract) as atm:
+            for _ in range(5):
+                compute_signals(chain, settings)
+        
+        scanned = [call.args[0] for call in atm.call_args_list]
+        assert len(scanned) == len({id(e) for e in scanned})
+    
+    def test_liquidity_verdict_cached_per_thresholds(self):
+        """✅ Liquidity verdicts are computed once per set of thresholds."""
+        expiry = create_expiry(date(2025, 1, 14), 30, contracts=[
+            create_contract(600.0, "call", bid=5.0, ask=5.05, volume=50, open_interest=500)
+        ])
+        chain = create_chain_snapshot(expiries=[expiry])
+        selection = select_contract(chain, expiry)
+        
+        assert selection.liquidity(100, 10, 0.08) == (True, [])
+        assert selection.liquidity(100, 10, 0.08) is selection.liquidity(100, 10, 0.08)
+        assert selection.liquidity(1000, 10, 0.08) == (False, ["low_oi_500"])
+        assert len(selection.verdicts) == 2
+    
+    def test_no_matching_contract(self):
+        """❌ No contract for the method → empty selection, no signal."""
+        expiry = create_expiry(date(2025, 1, 14), 30, contracts=[create_contract(600.0, "put")])
+        chain = create_chain_snapshot(expiries=[expiry])
+        
+        selection = select_contract(chain, expiry, "ATM", "call")
+        
+        assert selection.contract is None
+        assert selection.iv is None
+
+
+# ============================================================================
+# Tests for chain_fingerprint()
+# ============================================================================
+
+@pytest.mark.unit
+class TestChainFingerprint:
+    """Test the digest of the signal-relevant chain slice."""
+    
+    def test_equal_for_identical_chains(self):
+        """✅ Same data, new snapshot time → same fingerprint."""
+        first = create_chain_snapshot()
+        second = create_chain_snapshot()
+        second.as_of = first.as_of + timedelta(minutes=3)
+        
+        assert chain_fingerprint(first) == chain_fingerprint(second)
+    
+    @pytest.mark.parametrize("change", [
+        lambda chain: setattr(chain.expiries[0].contracts[1], "bid", 5.05),  # ATM call quote
+        lambda chain: setattr(chain.expiries[0].contracts[1], "open_interest", 10),
+        lambda chain: setattr(chain.expiries[1].contracts[0], "implied_volatility", 0.3),
+        lambda chain: setattr(chain.expiries[1].contracts[0], "delta", -0.4),  # Delta vol points
+        lambda chain: setattr(chain.expiries[0], "dte", 29),
+        lambda chain: setattr(chain, "underlying_price", 604.0),  # ATM strike moves
+    ])
+    def test_changes_with_signal_inputs(self, change):
+        """✅ Anything compute_signals() reads changes the fingerprint."""
+        chain = create_chain_snapshot()
+        before = chain_fingerprint(create_chain_snapshot())
+        
+        change(chain)
+        
+        assert chain_fingerprint(chain) != before
+    
+    def test_ignores_unused_fields(self):
+        """❌ Other greeks, last trade and a small underlying move → unchanged."""
+        chain = create_chain_snapshot()
+        before = chain_fingerprint(create_chain_snapshot())
+        
+        for expiry in chain.expiries:
+            for contract in expiry.contracts:
+                contract.gamma, contract.theta, contract.last = 0.02, -0.1, 1.0
+        chain.underlying_price += 0.5
+        
+        assert chain_fingerprint(chain) == before
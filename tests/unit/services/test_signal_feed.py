@@ -0,0 +1,118 @@
+"""Unit tests for the per-user signal feed cache.
+
+This module tests SignalFeedCache, which keeps each user's latest watchlist
+signals in Redis so the default signals view skips Postgres.
+"""
+import pytest
+from unittest.mock import AsyncMock
+import fakeredis.aioredis
+
+from app.services.signal_feed import SignalFeedCache
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+async def fake_redis():
+    """Create a FakeRedis instance for testing."""
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield redis
+    await redis.flushall()
+    await redis.aclose()
+
+
+@pytest.fixture
+async def feed_cache(fake_redis):
+    """Create SignalFeedCache instance with mocked Redis."""
+    cache = SignalFeedCache()
+    cache._get_redis = AsyncMock(return_value=fake_redis)
+    cache.redis = fake_redis
+    return cache
+
+
+def make_payload(signal_id: str, day: int = 1, ticker: str = "SPY"):
+    """Minimal signal payload with the fields used by the feed."""
+    return {
+        "id": signal_id,
+        "ref": f"{signal_id}@ref",
+        "ticker": ticker,
+        "as_of_ts": f"2025-01-{day:02d}T10:00:00+00:00"
+    }
+
+
+# ============================================================================
+# Tests for SignalFeedCache
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSignalFeedCache:
+    """Test feed fill, push and read."""
+    
+    async def test_unfilled_feed_is_a_miss(self, feed_cache):
+        """✅ Feed never filled from the database → None even after pushes."""
+        await feed_cache.push(["user-1"], [make_payload("sig-1")])
+        
+        assert await feed_cache.get_latest("user-1", 10) is None
+    
+    async def test_fill_then_push_newest_first(self, feed_cache):
+        """✅ Filled feed serves pushed signals newest first."""
+        await feed_cache.fill("user-1", [make_payload("sig-1", day=1)])
+        await feed_cache.push(["user-1", "user-2"], [make_payload("sig-2", day=2)])
+        
+        latest = await feed_cache.get_latest("user-1", 10)
+        
+        assert [p["id"] for p in latest] == ["sig-2", "sig-1"]
+        # user-2 was never filled
+        assert await feed_cache.get_latest("user-2", 10) is None
+    
+    async def test_empty_fill_is_a_hit(self, feed_cache):
+        """✅ User with no signals → cached empty list."""
+        await feed_cache.fill("user-1", [])
+        
+        assert await feed_cache.get_latest("user-1", 10) == []
+    
+    async def test_feed_trimmed_to_size(self, feed_cache):
+        """✅ Feed keeps only the newest FEED_SIZE refs."""
+        feed_cache.FEED_SIZE = 2
+        await feed_cache.fill("user-1", [make_payload(f"sig-{d}", day=d) for d in (1, 2, 3)])
+        
+        latest = await feed_cache.get_latest("user-1", 10)
+        
+        assert [p["id"] for p in latest] == ["sig-3", "sig-2"]
+    
+    async def test_expired_payload_is_a_miss(self, feed_cache, fake_redis):
+        """✅ Missing payload → None so the caller rebuilds."""
+        await feed_cache.fill("user-1", [make_payload("sig-1")])
+        await fake_redis.delete("signal_payload:sig-1@ref")
+        
+        assert await feed_cache.get_latest("user-1", 10) is None
+    
+    async def test_push_between_read_and_fill_kept(self, feed_cache):
+        """✅ Push landing after the route's database read survives its fill."""
+        # The route read sig-1 from the database; the scan worker then pushes sig-2
+        rows = [make_payload("sig-1", day=1)]
+        await feed_cache.push(["user-1"], [make_payload("sig-2", day=2)])
+        await feed_cache.fill("user-1", rows)
+        
+        latest = await feed_cache.get_latest("user-1", 10)
+        
+        assert [p["id"] for p in latest] == ["sig-2", "sig-1"]
+    
+    async def test_ready_expires_quickly(self, feed_cache, fake_redis):
+        """✅ Ready marker outlives a lost push by at most READY_TTL_SECONDS."""
+        await feed_cache.fill("user-1", [make_payload("sig-1")])
+        
+        ttl = await fake_redis.ttl("signal_feed_ready:user-1")
+        
+        assert 0 < ttl <= feed_cache.READY_TTL_SECONDS < feed_cache.FEED_TTL_SECONDS
+    
+    async def test_invalidate(self, feed_cache):
+        """✅ Invalidate drops the feed."""
+        await feed_cache.fill("user-1", [make_payload("sig-1")])
+        
+        await feed_cache.invalidate("user-1")
+        
+        assert await feed_cache.get_latest("user-1", 10) is None
@@ -5,9 +5,10 @@ of trading signals and user decisions.
 """
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 import hashlib
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects import postgresql
 
 # We need to mock app.models imports if they trigger pydantic errors
 # But for writing the test file, we'll assume we can import them
@@ -101,6 +102,20 @@ class TestGenerateDedupeKey:
         assert hash1 != hash2
 
 
+@pytest.mark.unit
+class TestDedupeDayBounds:
+    """Test the as_of_ts range covered by a dedupe key."""
+    
+    def test_bounds_cover_calendar_day(self):
+        """✅ Bounds are midnight to next midnight, keeping tzinfo."""
+        ts = datetime(2025, 1, 1, 15, 30, tzinfo=timezone.utc)
+        
+        start, end = SignalService.dedupe_day_bounds(ts)
+        
+        assert start == datetime(2025, 1, 1, tzinfo=timezone.utc)
+        assert end == datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+
 # ============================================================================
 # Tests for create_signal()
 # ============================================================================
@@ -180,6 +195,141 @@ class TestCreateSignal:
             assert kwargs['dedupe_key'] is not None
 
 
+# ============================================================================
+# Tests for create_signals_bulk()
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCreateSignalsBulk:
+    """Test batched signal persistence."""
+    
+    @pytest.fixture
+    def pg_db(self, mock_db):
+        """Mock session bound to the PostgreSQL dialect."""
+        mock_db.bind = MagicMock()
+        mock_db.bind.dialect.name = "postgresql"
+        return mock_db
+    
+    @staticmethod
+    def _rows(*mappings):
+        """Build a mock result whose rows expose the given mappings."""
+        result = MagicMock()
+        rows = []
+        for mapping in mappings:
+            row = MagicMock()
+            row._mapping = mapping
+            row.__getitem__ = lambda self, i, m=mapping: list(m.values())[i]
+            rows.append(row)
+        result.all.return_value = rows
+        return result
+    
+    async def test_single_statement_and_commit(self, pg_db, sample_signal_data):
+        """✅ Multiple signals → one lookup, one INSERT ... RETURNING, one commit."""
+        other = sample_signal_data.copy()
+        other["back_expiry"] = date(2025, 3, 21)
+        
+        created_row = {"id": "sig-1", "as_of_ts": sample_signal_data["as_of_ts"], "dedupe_key": "k"}
+        pg_db.execute.side_effect = [self._rows(), self._rows(created_row)]
+        
+        created = await SignalService.create_signals_bulk(pg_db, [sample_signal_data, other])
+        
+        assert created == [created_row]
+        assert pg_db.execute.call_count == 2
+        pg_db.commit.assert_called_once()
+        
+        stmt = pg_db.execute.call_args_list[1][0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (dedupe_key, as_of_ts)" in sql
+        assert "RETURNING" in sql
+    
+    async def test_existing_lookup_bounded_to_day(self, pg_db, sample_signal_data):
+        """✅ Duplicate lookup filters as_of_ts to the key's day (one chunk)."""
+        pg_db.execute.side_effect = [self._rows(), self._rows()]
+        
+        await SignalService.create_signals_bulk(pg_db, [sample_signal_data])
+        
+        lookup = pg_db.execute.call_args_list[0][0][0]
+        params = lookup.compile(dialect=postgresql.dialect()).params
+        bounds = sorted(v for v in params.values() if isinstance(v, datetime))
+        assert bounds == [datetime(2025, 1, 1), datetime(2025, 1, 2)]
+    
+    async def test_existing_key_not_inserted(self, pg_db, sample_signal_data):
+        """✅ Key already stored today → no INSERT issued."""
+        existing_key = SignalService.generate_dedupe_key(sample_signal_data)
+        pg_db.execute.side_effect = [self._rows({"dedupe_key": existing_key})]
+        
+        created = await SignalService.create_signals_bulk(pg_db, [sample_signal_data])
+        
+        assert created == []
+        pg_db.execute.assert_called_once()
+        pg_db.commit.assert_not_called()
+    
+    async def test_batch_duplicates_collapsed(self, pg_db, sample_signal_data):
+        """✅ Same dedupe key twice in a batch → inserted once."""
+        pg_db.execute.side_effect = [self._rows(), self._rows()]
+        
+        await SignalService.create_signals_bulk(
+            pg_db, [sample_signal_data, sample_signal_data.copy()]
+        )
+        
+        stmt = pg_db.execute.call_args_list[1][0][0]
+        assert len(stmt._multi_values[0]) == 1
+    
+    async def test_empty_batch(self, pg_db):
+        """✅ No signals → no database round trip."""
+        created = await SignalService.create_signals_bulk(pg_db, [])
+        
+        assert created == []
+        pg_db.execute.assert_not_called()
+        pg_db.commit.assert_not_called()
+
+
+# ============================================================================
+# Tests for get_signal_by_ref()
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGetSignalByRef:
+    """Test signal lookup by reference token."""
+
+    async def test_ref_filters_on_primary_key(self, mock_db):
+        """✅ Reference with timestamp → filters on id and as_of_ts."""
+        from app.utils.signal_ref import encode_signal_ref
+
+        ts = datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)
+        signal = Signal(id="sig-1", ticker="SPY")
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = signal
+        mock_db.execute.return_value = mock_result
+
+        found = await SignalService.get_signal_by_ref(mock_db, encode_signal_ref("sig-1", ts))
+
+        assert found is signal
+        stmt = mock_db.execute.call_args[0][0]
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        assert "sig-1" in params.values()
+        assert ts in params.values()
+
+    async def test_bare_id_filters_on_id_only(self, mock_db):
+        """✅ Bare ID → ID-only lookup."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_db.execute.return_value = mock_result
+
+        await SignalService.get_signal_by_ref(mock_db, "sig-1")
+
+        stmt = mock_db.execute.call_args[0][0]
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        assert list(params.values()) == ["sig-1"]
+
+    async def test_malformed_ref_returns_none(self, mock_db):
+        """❌ Malformed reference → None without querying."""
+        assert await SignalService.get_signal_by_ref(mock_db, "sig-1@!!") is None
+        mock_db.execute.assert_not_called()
+
+
 # ============================================================================
 # Tests for get_recent_signals()
 # ============================================================================
@@ -319,3 +469,47 @@ class TestGetUserDecisions:
         assert item["decision"] == "placed"
         assert item["ff_value"] == 0.35
         assert item["decision_ts"] == "2025-01-01 12:00"
+
+
+# ============================================================================
+# Tests for get_hourly_signal_counts() / get_daily_signal_stats()
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSignalStatsAggregates:
+    """Test that statistics read from the continuous aggregates."""
+    
+    @pytest.fixture
+    def stats_db(self, mock_db):
+        """Mock session returning no rows."""
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = []
+        mock_db.execute.return_value = mock_result
+        return mock_db
+    
+    async def test_hourly_reads_overall_view(self, stats_db):
+        """✅ No ticker → signals_hourly aggregate."""
+        await SignalService.get_hourly_signal_counts(stats_db, days=3)
+        
+        query, params = stats_db.execute.call_args[0]
+        assert "FROM signals_hourly\n" in str(query)
+        assert "time_bucket" not in str(query)
+        assert params == {"days": 3}
+    
+    async def test_hourly_reads_ticker_view(self, stats_db):
+        """✅ Ticker filter → signals_hourly_by_ticker aggregate."""
+        await SignalService.get_hourly_signal_counts(stats_db, ticker="spy")
+        
+        query, params = stats_db.execute.call_args[0]
+        assert "FROM signals_hourly_by_ticker" in str(query)
+        assert params == {"days": 7, "ticker": "SPY"}
+    
+    async def test_daily_reads_ticker_view(self, stats_db):
+        """✅ Daily stats with ticker → signals_daily_by_ticker aggregate."""
+        await SignalService.get_daily_signal_stats(stats_db, ticker="qqq", days=10)
+        
+        query, params = stats_db.execute.call_args[0]
+        assert "FROM signals_daily_by_ticker" in str(query)
+        assert "stddev_ff_value" in str(query)
+        assert params == {"days": 10, "ticker": "QQQ"}
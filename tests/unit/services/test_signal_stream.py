@@ -0,0 +1,164 @@
+"""Unit tests for the live signal stream.
+
+This module tests SignalStream, which publishes new signals over Redis and
+fans them out to Server-Sent Events connections filtered by subscription.
+"""
+import asyncio
+import pytest
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock
+import fakeredis.aioredis
+
+from app.services.signal_stream import SignalStream
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+async def fake_redis():
+    """Create a FakeRedis instance for testing."""
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield redis
+    await redis.flushall()
+    await redis.aclose()
+
+
+@pytest.fixture
+async def stream(fake_redis):
+    """Create SignalStream instance with mocked Redis."""
+    signal_stream = SignalStream()
+    signal_stream._get_redis = AsyncMock(return_value=fake_redis)
+    signal_stream.redis = fake_redis
+    yield signal_stream
+    # Let the listener notice there are no connections and exit
+    signal_stream._connections.clear()
+    if signal_stream._listener is not None:
+        await asyncio.wait_for(signal_stream._listener, timeout=5)
+
+
+def make_payload(ticker: str = "SPY", signal_id: str = "sig-1"):
+    """Build a stream payload for a minimal signal."""
+    signal_data = {
+        "ticker": ticker,
+        "ff_value": 0.35,
+        "front_iv": 0.25,
+        "back_iv": 0.20,
+        "sigma_fwd": 0.15,
+        "front_expiry": date(2025, 1, 17),
+        "back_expiry": date(2025, 2, 14),
+        "front_dte": 16,
+        "back_dte": 44,
+        "quality_score": 1.0,
+        "vol_point": "ATM"
+    }
+    return SignalStream.build_payload(
+        signal_data, signal_id, datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)
+    )
+
+
+# ============================================================================
+# Tests for build_payload / publish / replay
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPublishAndReplay:
+    """Test the replay buffer."""
+    
+    async def test_payload_is_json_ready(self):
+        """✅ Payload uses ISO strings and carries the signal ref."""
+        payload = make_payload()
+        
+        assert payload["front_expiry"] == "2025-01-17"
+        assert payload["as_of_ts"] == "2025-01-01T10:00:00+00:00"
+        assert payload["ref"].startswith("sig-1@")
+    
+    async def test_replay_after_last_event(self, stream):
+        """✅ Replay returns only later events for subscribed tickers."""
+        first, second, third = await stream.publish([
+            make_payload("SPY", "sig-1"),
+            make_payload("QQQ", "sig-2"),
+            make_payload("SPY", "sig-3")
+        ])
+        
+        events = await stream.replay(first, {"SPY"})
+        
+        assert [e["id"] for e in events] == [third]
+        assert events[0]["data"]["id"] == "sig-3"
+    
+    async def test_replay_malformed_id(self, stream):
+        """❌ Malformed Last-Event-ID → nothing replayed."""
+        await stream.publish([make_payload()])
+        
+        assert await stream.replay("not-an-id", {"SPY"}) == []
+    
+    async def test_publish_empty(self, stream, fake_redis):
+        """✅ No payloads → no Redis writes."""
+        assert await stream.publish([]) == []
+        assert not await fake_redis.exists(SignalStream.EVENTS_KEY)
+
+
+# ============================================================================
+# Tests for connect / dispatch
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestFanOut:
+    """Test per-user filtering of live events."""
+    
+    async def test_dispatch_filters_by_subscription(self, stream):
+        """✅ Only users subscribed to the ticker receive the event."""
+        spy_queue = await stream.connect("user-1", {"spy"})
+        qqq_queue = await stream.connect("user-2", {"QQQ"})
+        
+        stream.dispatch({"id": "1-0", "data": make_payload("SPY")})
+        
+        assert spy_queue.qsize() == 1
+        assert qqq_queue.empty()
+    
+    async def test_full_queue_drops_event(self, stream):
+        """✅ Slow client with a full queue does not block others."""
+        slow = await stream.connect("user-1", {"SPY"})
+        for i in range(SignalStream.QUEUE_SIZE):
+            slow.put_nowait({"id": f"{i}-0"})
+        fast = await stream.connect("user-2", {"SPY"})
+        
+        stream.dispatch({"id": "999-0", "data": make_payload("SPY")})
+        
+        assert fast.qsize() == 1
+    
+    async def test_disconnect_clears_user(self, stream):
+        """✅ Last connection closed → user removed from the map."""
+        queue = await stream.connect("user-1", {"SPY"})
+        
+        stream.disconnect("user-1", queue)
+        
+        assert "user-1" not in stream._connections
+        assert "user-1" not in stream._subscriptions
+    
+    async def test_published_event_reaches_connection(self, stream):
+        """✅ End to end: publish → pub/sub listener → subscribed queue."""
+        queue = await stream.connect("user-1", {"SPY"})
+        # Give the listener a moment to subscribe
+        await asyncio.sleep(0.1)
+        
+        (event_id,) = await stream.publish([make_payload("SPY")])
+        event = await asyncio.wait_for(queue.get(), timeout=5)
+        
+        assert event["id"] == event_id
+        assert event["data"]["ticker"] == "SPY"
+
+
+@pytest.mark.unit
+class TestEventOrdering:
+    """Test stream ID comparison."""
+    
+    def test_is_after(self):
+        """✅ Compares millisecond and sequence parts numerically."""
+        assert SignalStream.is_after("10-1", "9-5")
+        assert SignalStream.is_after("10-2", "10-1")
+        assert not SignalStream.is_after("10-1", "10-1")
+        assert SignalStream.is_after("10-1", None)
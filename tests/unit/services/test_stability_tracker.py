@@ -4,11 +4,13 @@ This module tests the StabilityTracker service which implements signal debouncin
 and stability requirements across consecutive scans using Redis.
 """
 import pytest
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import AsyncMock, patch
 import fakeredis.aioredis
+from prometheus_client import REGISTRY
 
-from app.services.stability_tracker import StabilityTracker
+from app.core.metrics import PROCESS_ROLE
+from app.services.stability_tracker import StabilityTracker, reason_label
 
 
 # ============================================================================
@@ -646,6 +648,30 @@ class TestCheckStabilityTTL:
         assert should_alert is False
         assert state["consecutive_count"] == 1
         assert state["reason"] == "first_scan"
+    
+    @pytest.mark.asyncio
+    async def test_state_expires_on_scan_time(self, stability_tracker, sample_dates):
+        """✅ State older than the TTL by the given scan time starts over (replays)."""
+        start = datetime(2026, 3, 2, 14, 30, tzinfo=timezone.utc)
+        for minutes in (0, 5):
+            await stability_tracker.check_stability(
+                ticker="SPY",
+                front_expiry=sample_dates["front"],
+                back_expiry=sample_dates["back"],
+                ff_value=0.35,
+                now=start + timedelta(minutes=minutes)
+            )
+        
+        should_alert, state = await stability_tracker.check_stability(
+            ticker="SPY",
+            front_expiry=sample_dates["front"],
+            back_expiry=sample_dates["back"],
+            ff_value=0.40,
+            now=start + timedelta(hours=24)
+        )
+        
+        assert should_alert is False
+        assert state["reason"] == "first_scan"
 
 
 # ============================================================================
@@ -882,3 +908,100 @@ class TestReset:
         qqq_state = await fake_redis.hgetall(qqq_key)
         assert len(qqq_state) > 0
         assert qqq_state["last_ff"] == "0.4"
+
+
+# ============================================================================
+# Tests for refresh() / is_settled()
+# ============================================================================
+
+@pytest.mark.unit
+class TestRefresh:
+    """Test counting unchanged rescans without a full check."""
+    
+    @pytest.mark.parametrize("reason,settled", [
+        ("stable", True),
+        ("cooldown_12.5min", True),
+        ("ff_delta_too_small_0.0000", True),
+        ("first_scan", False),
+        ("need_3_scans", False),
+        ("lock_failed", False),
+    ])
+    def test_is_settled(self, reason, settled):
+        """✅ Only outcomes that cannot alert again at the same FF are settled."""
+        assert StabilityTracker.is_settled({"reason": reason}) is settled
+    
+    @pytest.mark.asyncio
+    async def test_refresh_counts_scan(self, stability_tracker, sample_dates, fake_redis):
+        """✅ Refresh bumps the scan count and leaves FF, alert time and TTL alone."""
+        for _ in range(2):
+            await stability_tracker.check_stability(
+                ticker="SPY",
+                front_expiry=sample_dates["front"],
+                back_expiry=sample_dates["back"],
+                ff_value=0.35
+            )
+        key = stability_tracker._make_key("SPY", sample_dates["front"], sample_dates["back"])
+        before = await fake_redis.hgetall(key)
+        ttl = await fake_redis.ttl(key)
+        
+        await stability_tracker.refresh("SPY", [(str(sample_dates["front"]), str(sample_dates["back"]))])
+        
+        after = await fake_redis.hgetall(key)
+        assert after == {**before, "consecutive_count": "3"}
+        assert await fake_redis.ttl(key) == ttl
+    
+    @pytest.mark.asyncio
+    async def test_refresh_does_not_recreate_expired_state(self, stability_tracker, sample_dates, fake_redis):
+        """❌ Expired pair → stays absent, so the next check starts fresh."""
+        await stability_tracker.refresh("SPY", [(sample_dates["front"], sample_dates["back"])])
+        
+        key = stability_tracker._make_key("SPY", sample_dates["front"], sample_dates["back"])
+        assert await fake_redis.exists(key) == 0
+    
+    @pytest.mark.asyncio
+    async def test_refresh_nothing(self, stability_tracker, fake_redis):
+        """✅ No pairs → no Redis calls."""
+        stability_tracker._get_redis.reset_mock()
+        
+        await stability_tracker.refresh("SPY", [])
+        
+        stability_tracker._get_redis.assert_not_called()
+
+
+# ============================================================================
+# Tests for outcome metrics
+# ============================================================================
+
+@pytest.mark.unit
+class TestOutcomeMetrics:
+    """Test stability outcome counters."""
+    
+    @pytest.mark.parametrize("reason,label", [
+        ("first_scan", "first_scan"),
+        ("stable", "stable"),
+        ("lock_failed", "lock_failed"),
+        ("need_3_scans", "need_scans"),
+        ("cooldown_12.5min", "cooldown"),
+        ("ff_delta_too_small_-0.0100", "ff_delta_too_small"),
+    ])
+    def test_reason_label(self, reason, label):
+        """✅ Numeric details are stripped so labels stay low-cardinality."""
+        assert reason_label(reason) == label
+    
+    @pytest.mark.asyncio
+    async def test_check_counts_outcome(self, stability_tracker, sample_dates):
+        """✅ Each check increments the counter for its reason."""
+        labels = {"role": PROCESS_ROLE, "reason": "need_scans"}
+        before = REGISTRY.get_sample_value("ffbot_stability_checks_total", labels) or 0
+        
+        for _ in range(2):
+            await stability_tracker.check_stability(
+                ticker="SPY",
+                front_expiry=sample_dates["front"],
+                back_expiry=sample_dates["back"],
+                ff_value=0.35,
+                required_scans=3
+            )
+        
+        # First scan is "first_scan"; the second still needs a third scan
+        assert REGISTRY.get_sample_value("ffbot_stability_checks_total", labels) == before + 1
@@ -4,7 +4,7 @@ This module tests subscription management logic including adding, removing,
 and retrieving subscriptions.
 """
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # Mock imports
 from app.services.subscription_service import SubscriptionService
@@ -15,6 +15,22 @@ from app.models.subscription import Subscription
 # Fixtures
 # ============================================================================
 
+@pytest.fixture(autouse=True)
+def mock_feed_cache():
+    """Mock the per-user signal feed cache invalidated on watchlist changes."""
+    with patch("app.services.subscription_service.signal_feed_cache") as cache:
+        cache.invalidate = AsyncMock()
+        yield cache
+
+
+@pytest.fixture(autouse=True)
+def mock_response_cache():
+    """Mock the response cache whose subscription version is bumped on changes."""
+    with patch("app.services.subscription_service.response_cache") as cache:
+        cache.bump = AsyncMock()
+        yield cache
+
+
 @pytest.fixture
 def mock_db():
     """Create a mock database session."""
@@ -42,7 +58,7 @@ def mock_subscription():
 class TestAddSubscription:
     """Test add subscription."""
     
-    async def test_add_new(self, mock_db):
+    async def test_add_new(self, mock_db, mock_feed_cache, mock_response_cache):
         """✅ New subscription created."""
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
@@ -54,6 +70,8 @@ class TestAddSubscription:
         assert sub.active is True
         mock_db.add.assert_called_once()
         mock_db.commit.assert_called_once()
+        mock_feed_cache.invalidate.assert_awaited_once_with("user-1")
+        mock_response_cache.bump.assert_awaited_once_with("subscriptions", "user-1")
     
     async def test_reactivate_existing(self, mock_db, mock_subscription):
         """✅ Existing inactive → reactivate."""
@@ -90,7 +108,7 @@ class TestRemoveSubscription:
         assert result is True
         mock_db.commit.assert_called_once()
     
-    async def test_remove_not_found(self, mock_db):
+    async def test_remove_not_found(self, mock_db, mock_feed_cache):
         """✅ Not found → returns false."""
         mock_result = MagicMock()
         mock_result.rowcount = 0
@@ -99,6 +117,7 @@ class TestRemoveSubscription:
         result = await SubscriptionService.remove_subscription(mock_db, "user-1", "spy")
         
         assert result is False
+        mock_feed_cache.invalidate.assert_not_called()
 
 
 # ============================================================================
@@ -142,9 +142,13 @@ class TestUpdateUserSettings:
         mock_result.scalar_one.return_value = mock_settings
         mock_db.execute.return_value = mock_result
         
-        updated = await UserService.update_user_settings(
-            mock_db, "user-123", ff_threshold=0.5, unknown_field="ignored"
-        )
+        with patch("app.services.user_service.response_cache") as cache:
+            cache.bump = AsyncMock()
+            updated = await UserService.update_user_settings(
+                mock_db, "user-123", ff_threshold=0.5, unknown_field="ignored"
+            )
+        
+        cache.bump.assert_awaited_once_with("settings", "user-123")
         
         assert updated.ff_threshold == 0.5
         # Unknown field should be ignored (or at least not crash if hasattr check works)
@@ -0,0 +1,37 @@
+"""Unit tests for pagination cursor helpers.
+
+This module tests the opaque (timestamp, id) cursors used for keyset
+pagination of list endpoints.
+"""
+import pytest
+from datetime import datetime, timezone
+
+from app.utils.pagination import encode_cursor, decode_cursor
+
+
+# ============================================================================
+# Tests for encode_cursor / decode_cursor
+# ============================================================================
+
+@pytest.mark.unit
+class TestCursor:
+    """Test cursor round-trips."""
+
+    def test_round_trip(self):
+        """✅ Cursor decodes to the original timestamp and id."""
+        ts = datetime(2025, 1, 2, 14, 30, 15, 123456, tzinfo=timezone.utc)
+        cursor = encode_cursor(ts, "sig-123")
+
+        assert decode_cursor(cursor) == (ts, "sig-123")
+
+    def test_cursor_is_url_safe(self):
+        """✅ Cursor contains no padding or URL-reserved characters."""
+        cursor = encode_cursor(datetime(2025, 1, 2, tzinfo=timezone.utc), "a/b+c")
+
+        assert not set(cursor) & set("=+/&?")
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "", "c2lnLTEyMw"])
+    def test_malformed_cursor_raises(self, cursor):
+        """❌ Malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
@@ -0,0 +1,51 @@
+"""Unit tests for signal reference helpers.
+
+This module tests encoding and decoding of "<id>@<timestamp>" signal
+references used by the notification queue, Telegram callbacks and the API.
+"""
+import uuid
+import pytest
+from datetime import datetime, timezone
+
+from app.utils.signal_ref import encode_signal_ref, decode_signal_ref
+
+
+# ============================================================================
+# Tests for encode_signal_ref / decode_signal_ref
+# ============================================================================
+
+@pytest.mark.unit
+class TestSignalRef:
+    """Test signal reference round-trips."""
+
+    def test_round_trip(self):
+        """✅ Reference decodes to the original ID and timestamp."""
+        ts = datetime(2025, 1, 2, 14, 30, 15, 123456, tzinfo=timezone.utc)
+        ref = encode_signal_ref("sig-123", ts)
+
+        assert ref.startswith("sig-123@")
+        assert decode_signal_ref(ref) == ("sig-123", ts)
+
+    def test_naive_timestamp_treated_as_utc(self):
+        """✅ Naive timestamps are encoded as UTC."""
+        naive = datetime(2025, 1, 2, 14, 30)
+        aware = naive.replace(tzinfo=timezone.utc)
+
+        assert encode_signal_ref("sig-123", naive) == encode_signal_ref("sig-123", aware)
+        assert decode_signal_ref(encode_signal_ref("sig-123", naive))[1] == aware
+
+    def test_bare_id_has_no_timestamp(self):
+        """✅ Legacy bare IDs decode without a timestamp."""
+        assert decode_signal_ref("sig-123") == ("sig-123", None)
+
+    @pytest.mark.parametrize("ref", ["sig-123@", "@1k9x0q8g2w", "sig-123@not valid!"])
+    def test_malformed_ref_raises(self, ref):
+        """❌ Malformed references raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_signal_ref(ref)
+
+    def test_fits_telegram_callback_data(self):
+        """✅ UUID refs stay within Telegram's 64-byte callback data limit."""
+        ref = encode_signal_ref(str(uuid.uuid4()), datetime(2099, 12, 31, tzinfo=timezone.utc))
+
+        assert len(f"ignore:{ref}".encode()) <= 64
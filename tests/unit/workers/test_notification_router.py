@@ -0,0 +1,103 @@
+"""Unit tests for NotificationRouter.
+
+This module tests fan-out of a queued signal to subscribers' linked Telegram
+chats and continuation of the scan's trace.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.tracing import PipelineTrace, use_trace, inject_payload
+from app.workers.notification_router import NotificationRouter
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def mock_db_session():
+    """Mock database session returning linked chats."""
+    session = AsyncMock()
+    session.__aenter__.return_value = session
+    session.__aexit__.return_value = None
+    result = MagicMock()
+    result.all.return_value = [("user-1", "111"), ("user-1", "112"), ("user-2", "222")]
+    session.execute.return_value = result
+
+    with patch("app.workers.notification_router.AsyncSessionLocal", return_value=session):
+        yield session
+
+
+@pytest.fixture
+def mock_services():
+    """Mock signal and subscription services."""
+    with patch("app.workers.notification_router.SignalService") as sig_svc, \
+         patch("app.workers.notification_router.SubscriptionService") as sub_svc:
+        signal = MagicMock()
+        signal.ticker = "SPY"
+        sig_svc.get_signal_by_ref = AsyncMock(return_value=signal)
+        sub_svc.get_ticker_subscribers = AsyncMock(return_value=["user-1", "user-2", "user-3"])
+        yield {"signal": sig_svc, "sub": sub_svc, "signal_obj": signal}
+
+
+@pytest.fixture
+def router():
+    """NotificationRouter with a mocked Bot and send_signal_to_user."""
+    with patch("app.workers.notification_router.Bot"):
+        router = NotificationRouter()
+    router.send_signal_to_user = AsyncMock()
+    return router
+
+
+# ============================================================================
+# Tests for process_notification
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestProcessNotification:
+    """Test process_notification method."""
+
+    async def test_sends_to_every_linked_chat(self, router, mock_db_session, mock_services):
+        """✅ Every linked chat of every subscriber gets the signal."""
+        await router.process_notification("sig-1@abc")
+
+        mock_services["signal"].get_signal_by_ref.assert_awaited_once_with(mock_db_session, "sig-1@abc")
+        sent = [call.args[1:] for call in router.send_signal_to_user.await_args_list]
+        assert sent == [("user-1", "111"), ("user-1", "112"), ("user-2", "222")]
+        # Chats for all subscribers come from a single query
+        assert mock_db_session.execute.await_count == 1
+
+    async def test_signal_not_found(self, router, mock_db_session, mock_services):
+        """❌ Unknown signal → nothing sent."""
+        mock_services["signal"].get_signal_by_ref.return_value = None
+
+        await router.process_notification("missing@abc")
+
+        router.send_signal_to_user.assert_not_awaited()
+
+    async def test_no_subscribers(self, router, mock_db_session, mock_services):
+        """✅ No subscribers → no chat query, nothing sent."""
+        mock_services["sub"].get_ticker_subscribers.return_value = []
+
+        await router.process_notification("sig-1@abc")
+
+        mock_db_session.execute.assert_not_awaited()
+        router.send_signal_to_user.assert_not_awaited()
+
+    async def test_traced_payload_continues_trace(self, router, mock_db_session, mock_services):
+        """✅ A payload with trace context is unwrapped and the trace continued."""
+        scan = PipelineTrace("scan_ticker")
+        with use_trace(scan):
+            payload = inject_payload("sig-1@abc")
+
+        with patch("app.workers.notification_router.span_exporter") as exporter:
+            exporter.export = AsyncMock()
+            await router.process_notification(payload)
+
+        mock_services["signal"].get_signal_by_ref.assert_awaited_once_with(mock_db_session, "sig-1@abc")
+        spans = exporter.export.await_args[0][0]
+        notify, dequeue = spans
+        assert notify.trace_id == scan.root.trace_id
+        assert notify.parent_id == scan.root.span_id
+        assert dequeue.name == "dequeue"
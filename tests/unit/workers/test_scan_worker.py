@@ -6,15 +6,24 @@ signal computation, stability checking, and queue processing.
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, date
+from prometheus_client import REGISTRY
 
 # Mock imports
+from app.core.metrics import PROCESS_ROLE
+from app.core.tracing import extract_payload
 from app.workers.scan_worker import ScanWorker
+from app.utils.signal_ref import encode_signal_ref
 
 
 # ============================================================================
 # Fixtures
 # ============================================================================
 
+def sample(name: str, **labels):
+    """Read a pipeline metric sample for this process (0 if absent)."""
+    return REGISTRY.get_sample_value(name, {"role": PROCESS_ROLE, **labels}) or 0
+
+
 @pytest.fixture
 def mock_provider():
     """Mock PolygonProvider."""
@@ -28,6 +37,8 @@ def mock_provider():
 def mock_redis():
     """Mock Redis client."""
     redis = AsyncMock()
+    # pipeline() is synchronous; queued commands run on execute()
+    redis.pipeline = MagicMock(return_value=MagicMock(execute=AsyncMock()))
     with patch("app.workers.scan_worker.get_redis", new=AsyncMock(return_value=redis)):
         yield redis
 
@@ -52,15 +63,32 @@ def mock_services():
          patch("app.workers.scan_worker.SignalService") as sig_svc, \
          patch("app.workers.scan_worker.TickerService") as tick_svc, \
          patch("app.workers.scan_worker.stability_tracker") as stab_tracker, \
+         patch("app.workers.scan_worker.signal_dedupe_cache") as dedupe_cache, \
+         patch("app.workers.scan_worker.signal_stream") as sig_stream, \
+         patch("app.workers.scan_worker.signal_feed_cache") as feed_cache, \
+         patch("app.workers.scan_worker.response_cache") as resp_cache, \
+         patch("app.workers.scan_worker.scan_fingerprint_cache") as fp_cache, \
+         patch("app.workers.scan_worker.chain_fingerprint", return_value="fp-1"), \
          patch("app.workers.scan_worker.compute_signals") as comp_sigs:
         
         # Configure async methods
         sub_svc.get_ticker_subscribers = AsyncMock()
         user_svc.get_discovery_users = AsyncMock()
         user_svc.get_user_settings = AsyncMock()
-        sig_svc.create_signal = AsyncMock()
+        sig_svc.create_signals_bulk = AsyncMock()
+        sig_svc.generate_dedupe_key.return_value = "key"
         tick_svc.update_last_scan = AsyncMock()
         stab_tracker.check_stability = AsyncMock()
+        stab_tracker.refresh = AsyncMock()
+        # Front-cache passes everything through unless a test says otherwise
+        dedupe_cache.claim = AsyncMock(side_effect=lambda signals: list(signals))
+        dedupe_cache.release = AsyncMock()
+        sig_stream.publish = AsyncMock()
+        feed_cache.push = AsyncMock()
+        resp_cache.bump = AsyncMock()
+        # No previous scan on record unless a test says otherwise
+        fp_cache.unchanged_pairs = AsyncMock(return_value=None)
+        fp_cache.store = AsyncMock()
         
         yield {
             "sub": sub_svc,
@@ -68,6 +96,11 @@ def mock_services():
             "signal": sig_svc,
             "ticker": tick_svc,
             "stability": stab_tracker,
+            "dedupe": dedupe_cache,
+            "stream": sig_stream,
+            "feed": feed_cache,
+            "response_cache": resp_cache,
+            "fingerprints": fp_cache,
             "compute": comp_sigs
         }
 
@@ -84,7 +117,8 @@ class TestScanTicker:
     async def test_scan_success(self, mock_provider, mock_redis, mock_db_session, mock_services):
         """✅ Full scan workflow success."""
         # Setup mocks
-        mock_provider.get_chain_snapshot.return_value = "mock_chain"
+        chain = MagicMock(ticker="SPY", as_of=datetime(2025, 1, 1, 15, 0))
+        mock_provider.get_chain_snapshot.return_value = chain
         
         # Mock subscribers
         mock_services["sub"].get_ticker_subscribers.return_value = ["user-1"]
@@ -109,14 +143,23 @@ class TestScanTicker:
         mock_services["stability"].check_stability.return_value = (True, {})
         
         # Mock signal creation (new signal)
-        signal_obj = MagicMock()
-        signal_obj.id = "sig-123"
-        mock_services["signal"].create_signal.return_value = signal_obj
+        mock_services["signal"].create_signals_bulk.return_value = [
+            {"id": "sig-123", "as_of_ts": datetime(2025, 1, 1), "dedupe_key": "key"}
+        ]
+        
+        scans_before = sample("ffbot_scans_total", mode="scan", result="ok")
+        created_before = sample("ffbot_signals_created_total")
+        computes_before = sample("ffbot_compute_signals_duration_seconds_count")
         
         # Run scan
         worker = ScanWorker()
         await worker.scan_ticker("SPY")
         
+        # Verify pipeline metrics
+        assert sample("ffbot_scans_total", mode="scan", result="ok") == scans_before + 1
+        assert sample("ffbot_signals_created_total") == created_before + 1
+        assert sample("ffbot_compute_signals_duration_seconds_count") == computes_before + 1
+        
         # Verify provider call
         mock_provider.get_chain_snapshot.assert_called_once_with("SPY")
         
@@ -128,12 +171,31 @@ class TestScanTicker:
         
         # Verify stability check
         mock_services["stability"].check_stability.assert_called_once()
+        # Debounced on the chain's time, so replays match live scans
+        assert mock_services["stability"].check_stability.call_args.kwargs["now"] == chain.as_of
         
         # Verify signal creation
-        mock_services["signal"].create_signal.assert_called_once()
+        mock_services["signal"].create_signals_bulk.assert_called_once()
         
         # Verify notification queue
-        mock_redis.lpush.assert_called_once_with("notification_queue", "sig-123")
+        pipe = mock_redis.pipeline.return_value
+        pipe.lpush.assert_called_once()
+        queue, payload = pipe.lpush.call_args[0]
+        assert queue == "notification_queue"
+        signal_ref, trace_context = extract_payload(payload)
+        assert signal_ref == encode_signal_ref("sig-123", datetime(2025, 1, 1))
+        assert len(trace_context["trace_id"]) == 32
+        assert trace_context["fetched_at"] is None  # provider is mocked, no fetch stage
+        pipe.execute.assert_awaited_once()
+        
+        # Verify live stream publish
+        mock_services["stream"].build_payload.assert_called_once_with(
+            signal_data, "sig-123", datetime(2025, 1, 1)
+        )
+        mock_services["stream"].publish.assert_awaited_once()
+        mock_services["feed"].push.assert_awaited_once()
+        assert mock_services["feed"].push.call_args[0][0] == ["user-1"]
+        mock_services["response_cache"].bump.assert_awaited_once_with("signals")
         
         # Verify last scan update
         mock_services["ticker"].update_last_scan.assert_called_once_with(mock_db_session, "SPY")
@@ -142,6 +204,7 @@ class TestScanTicker:
         """✅ No subscribers → skip."""
         mock_services["sub"].get_ticker_subscribers.return_value = []
         mock_services["user"].get_discovery_users.return_value = []
+        before = sample("ffbot_scans_total", mode="scan", result="no_subscribers")
         
         worker = ScanWorker()
         await worker.scan_ticker("SPY")
@@ -149,6 +212,19 @@ class TestScanTicker:
         # Should fetch chain but stop after checking subscribers
         mock_provider.get_chain_snapshot.assert_called_once()
         mock_services["compute"].assert_not_called()
+        assert sample("ffbot_scans_total", mode="scan", result="no_subscribers") == before + 1
+    
+    async def test_provider_error_counted(self, mock_provider, mock_redis, mock_db_session, mock_services):
+        """✅ Failed chain fetch → scan counted as an error, not raised."""
+        mock_provider.get_chain_snapshot.side_effect = Exception("Polygon down")
+        errors_before = sample("ffbot_scans_total", mode="discovery", result="error")
+        durations_before = sample("ffbot_scan_duration_seconds_count", mode="discovery")
+        
+        worker = ScanWorker()
+        await worker.scan_ticker("SPY", is_discovery=True)
+        
+        assert sample("ffbot_scans_total", mode="discovery", result="error") == errors_before + 1
+        assert sample("ffbot_scan_duration_seconds_count", mode="discovery") == durations_before + 1
     
     async def test_discovery_mode_with_users(self, mock_provider, mock_redis, mock_db_session, mock_services):
         """✅ Discovery mode processes even without subscribers."""
@@ -177,19 +253,19 @@ class TestScanTicker:
         mock_services["stability"].check_stability.return_value = (True, {})
         
         # Mock signal creation
-        signal_obj = MagicMock()
-        signal_obj.id = "sig-discovery-123"
-        mock_services["signal"].create_signal.return_value = signal_obj
+        mock_services["signal"].create_signals_bulk.return_value = [
+            {"id": "sig-discovery-123", "as_of_ts": datetime(2025, 1, 1), "dedupe_key": "key"}
+        ]
         
         worker = ScanWorker()
         await worker.scan_ticker("SPY", is_discovery=True)
         
         # Should process and create signal
         mock_services["compute"].assert_called_once()
-        mock_services["signal"].create_signal.assert_called_once()
+        mock_services["signal"].create_signals_bulk.assert_called_once()
         
         # Verify is_discovery is set in signal_data
-        created_signal_data = mock_services["signal"].create_signal.call_args[0][1]
+        created_signal_data = mock_services["signal"].create_signals_bulk.call_args[0][1][0]
         assert created_signal_data.get("is_discovery") == True
     
     async def test_discovery_dedupes_subscribers(self, mock_provider, mock_redis, mock_db_session, mock_services):
@@ -207,7 +283,9 @@ class TestScanTicker:
         
         mock_services["compute"].return_value = [{"ticker": "SPY", "front_expiry": date(2025,1,1), "back_expiry": date(2025,2,1), "ff_value": 0.5}]
         mock_services["stability"].check_stability.return_value = (True, {})
-        mock_services["signal"].create_signal.return_value = MagicMock(id="sig-1")
+        mock_services["signal"].create_signals_bulk.return_value = [
+            {"id": "sig-1", "as_of_ts": datetime(2025, 1, 1), "dedupe_key": "key"}
+        ]
         
         worker = ScanWorker()
         await worker.scan_ticker("SPY", is_discovery=True)
@@ -216,7 +294,7 @@ class TestScanTicker:
         assert mock_services["user"].get_user_settings.call_count == 1
         
         # For a subscriber receiving discovery signal, is_discovery should be False
-        created_signal_data = mock_services["signal"].create_signal.call_args[0][1]
+        created_signal_data = mock_services["signal"].create_signals_bulk.call_args[0][1][0]
         assert created_signal_data.get("is_discovery") == False
 
     async def test_unstable_signal(self, mock_provider, mock_redis, mock_db_session, mock_services):
@@ -231,8 +309,8 @@ class TestScanTicker:
         worker = ScanWorker()
         await worker.scan_ticker("SPY")
         
-        mock_services["signal"].create_signal.assert_not_called()
-        mock_redis.lpush.assert_not_called()
+        mock_services["signal"].create_signals_bulk.assert_not_called()
+        mock_redis.pipeline.assert_not_called()
     
     async def test_duplicate_signal(self, mock_provider, mock_redis, mock_db_session, mock_services):
         """✅ Duplicate signal → skip notification."""
@@ -241,14 +319,131 @@ class TestScanTicker:
         mock_services["compute"].return_value = [{"ticker": "SPY", "front_expiry": date(2025,1,1), "back_expiry": date(2025,2,1), "ff_value": 0.5}]
         mock_services["stability"].check_stability.return_value = (True, {})
         
-        # Mock signal creation (duplicate -> None)
-        mock_services["signal"].create_signal.return_value = None
+        # Mock signal creation (duplicate -> nothing returned)
+        mock_services["signal"].create_signals_bulk.return_value = []
+        
+        worker = ScanWorker()
+        await worker.scan_ticker("SPY")
+        
+        mock_services["signal"].create_signals_bulk.assert_called_once()
+        mock_redis.pipeline.assert_not_called()
+    
+    async def test_cached_duplicate_skips_database(self, mock_provider, mock_redis, mock_db_session, mock_services):
+        """✅ Dedupe key already claimed today → no insert, no notification."""
+        mock_services["sub"].get_ticker_subscribers.return_value = ["user-1"]
+        mock_services["user"].get_user_settings.return_value = MagicMock()
+        mock_services["compute"].return_value = [{"ticker": "SPY", "front_expiry": date(2025,1,1), "back_expiry": date(2025,2,1), "ff_value": 0.5}]
+        mock_services["stability"].check_stability.return_value = (True, {})
+        mock_services["dedupe"].claim.side_effect = None
+        mock_services["dedupe"].claim.return_value = []
+        
+        worker = ScanWorker()
+        await worker.scan_ticker("SPY")
+        
+        mock_services["signal"].create_signals_bulk.assert_not_called()
+        mock_redis.pipeline.assert_not_called()
+    
+    async def test_failed_insert_releases_claim(self, mock_provider, mock_redis, mock_db_session, mock_services):
+        """✅ Insert failure → claimed dedupe keys are released."""
+        mock_services["sub"].get_ticker_subscribers.return_value = ["user-1"]
+        mock_services["user"].get_user_settings.return_value = MagicMock()
+        mock_services["compute"].return_value = [{"ticker": "SPY", "front_expiry": date(2025,1,1), "back_expiry": date(2025,2,1), "ff_value": 0.5}]
+        mock_services["stability"].check_stability.return_value = (True, {})
+        mock_services["signal"].create_signals_bulk.side_effect = RuntimeError("db down")
+        
+        worker = ScanWorker()
+        await worker.scan_ticker("SPY")
+        
+        mock_services["dedupe"].release.assert_called_once()
+
+    async def test_stream_publish_failure_does_not_abort_scan(self, mock_provider, mock_redis, mock_db_session, mock_services):
+        """✅ Live stream publish failure → scan still completes."""
+        mock_services["sub"].get_ticker_subscribers.return_value = ["user-1"]
+        mock_services["user"].get_user_settings.return_value = MagicMock()
+        mock_services["compute"].return_value = [{"ticker": "SPY", "front_expiry": date(2025,1,1), "back_expiry": date(2025,2,1), "ff_value": 0.5}]
+        mock_services["stability"].check_stability.return_value = (True, {})
+        mock_services["signal"].create_signals_bulk.return_value = [
+            {"id": "sig-1", "as_of_ts": datetime(2025, 1, 1), "dedupe_key": "key"}
+        ]
+        mock_services["stream"].publish.side_effect = ConnectionError("redis down")
+
+        worker = ScanWorker()
+        await worker.scan_ticker("SPY")
+
+        mock_services["ticker"].update_last_scan.assert_called_once()
+
+
+# ============================================================================
+# Tests for unchanged chains
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestUnchangedChain:
+    """Test skipping rescans of a chain identical to the last settled scan."""
+    
+    def setup_scan(self, mock_provider, mock_services, reason: str = "cooldown_5.0min"):
+        """One subscriber, one signal, stability outcome with the given reason."""
+        mock_provider.get_chain_snapshot.return_value = MagicMock(ticker="SPY")
+        mock_services["sub"].get_ticker_subscribers.return_value = ["user-1"]
+        mock_services["user"].get_user_settings.return_value = MagicMock()
+        mock_services["compute"].return_value = [
+            {"ticker": "SPY", "front_expiry": date(2025, 1, 17), "back_expiry": date(2025, 2, 14), "ff_value": 0.5}
+        ]
+        mock_services["stability"].check_stability.return_value = (False, {"reason": reason})
+        mock_services["stability"].is_settled.return_value = reason != "first_scan"
+    
+    async def test_unchanged_chain_skips_scan(self, mock_provider, mock_redis, mock_db_session, mock_services):
+        """✅ Same fingerprint after a settled scan → refresh stability only."""
+        self.setup_scan(mock_provider, mock_services)
+        mock_services["fingerprints"].unchanged_pairs.return_value = [("2025-01-17", "2025-02-14")]
+        before = sample("ffbot_scans_total", mode="scan", result="unchanged")
+        
+        worker = ScanWorker()
+        await worker.scan_ticker("SPY")
+        
+        mock_services["fingerprints"].unchanged_pairs.assert_awaited_once_with("SPY", "scan", "fp-1")
+        mock_services["stability"].refresh.assert_awaited_once_with("SPY", [("2025-01-17", "2025-02-14")])
+        mock_services["sub"].get_ticker_subscribers.assert_not_called()
+        mock_services["compute"].assert_not_called()
+        mock_services["stability"].check_stability.assert_not_called()
+        mock_services["ticker"].update_last_scan.assert_awaited_once_with(mock_db_session, "SPY")
+        mock_services["fingerprints"].store.assert_not_called()
+        assert sample("ffbot_scans_total", mode="scan", result="unchanged") == before + 1
+    
+    async def test_full_scan_stores_fingerprint(self, mock_provider, mock_redis, mock_db_session, mock_services):
+        """✅ Full scan records fingerprint, checked pairs and settled state."""
+        self.setup_scan(mock_provider, mock_services)
+        
+        worker = ScanWorker()
+        with patch("app.workers.scan_worker.settings.unchanged_chain_skip_minutes", 10):
+            await worker.scan_ticker("SPY", is_discovery=True)
+        
+        mock_services["compute"].assert_called()
+        mock_services["fingerprints"].store.assert_awaited_once_with(
+            "SPY", "discovery", "fp-1", {(date(2025, 1, 17), date(2025, 2, 14))}, True, ttl_seconds=600
+        )
+    
+    async def test_pending_stability_not_settled(self, mock_provider, mock_redis, mock_db_session, mock_services):
+        """❌ A pair still debouncing → stored as unsettled, so the next scan runs in full."""
+        self.setup_scan(mock_provider, mock_services, reason="first_scan")
         
         worker = ScanWorker()
         await worker.scan_ticker("SPY")
         
-        mock_services["signal"].create_signal.assert_called_once()
-        mock_redis.lpush.assert_not_called()
+        assert mock_services["fingerprints"].store.call_args[0][4] is False
+    
+    async def test_disabled(self, mock_provider, mock_redis, mock_db_session, mock_services):
+        """✅ unchanged_chain_skip_minutes=0 → no fingerprinting at all."""
+        self.setup_scan(mock_provider, mock_services)
+        
+        worker = ScanWorker()
+        with patch("app.workers.scan_worker.settings.unchanged_chain_skip_minutes", 0):
+            await worker.scan_ticker("SPY")
+        
+        mock_services["fingerprints"].unchanged_pairs.assert_not_called()
+        mock_services["fingerprints"].store.assert_not_called()
+        mock_services["compute"].assert_called()
 
 
 # ============================================================================